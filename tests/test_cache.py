@@ -8,14 +8,35 @@
 
 import capturer
 import collections
+import hashlib
+import mock
+import numpy
 import os
 import shutil
 import tempfile
+import threading
 import time
 import unittest
 import wc_utils.cache
 
 
+class CountingPickles(object):
+    """ Object which counts the number of times that it has been pickled and unpickled """
+    n_pickles = 0
+    n_unpickles = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __getstate__(self):
+        CountingPickles.n_pickles += 1
+        return self.value
+
+    def __setstate__(self, value):
+        CountingPickles.n_unpickles += 1
+        self.value = value
+
+
 class CacheTestCase(unittest.TestCase):
     def setUp(self):
         self.dir = tempfile.mkdtemp()
@@ -408,14 +429,368 @@ class CacheTestCase(unittest.TestCase):
         with self.assertRaisesRegex(TypeError, 'missing required positional argument'):
             func(1, e=5)
 
-        @cache.memoize()
-        def func(a, **kwargs):
+        with self.assertRaisesRegex(TypeError, 'takes 5 positional arguments but 6 were given'):
+            func(1, 2, 3, 4, 5, 6)
+
+        with self.assertRaisesRegex(TypeError, "got multiple values for argument 'a'"):
+            func(1, 2, a=1)
+
+        with self.assertRaisesRegex(TypeError, "got an unexpected keyword argument 'f'"):
+            func(1, 2, f=1)
+
+    def test_memoize_variadic_and_keyword_only_arguments(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'))
+
+        @cache.memoize(typed=True)
+        def func(a, *args, b, c=3, **kwargs):
+            print('func ran')
+            return a + sum(args) + b + c + sum(kwargs.values())
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, 2, b=3), 9)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, 2, c=3, b=3), 9)
+            self.assertEqual(captured.stdout.get_text(), '')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, b=3, c=5), 9)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, 2., b=3), 9)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, 2, b=3, d=1), 10)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, 2, d=1, b=3), 10)
+            self.assertEqual(captured.stdout.get_text(), '')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, 2, b=3, e=1), 10)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+        with self.assertRaisesRegex(TypeError, "missing required keyword-only argument 'b'"):
+            func(1, 2)
+
+    def test_memoize_variadic_filename_argument(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'))
+
+        @cache.memoize(filename_args=[1], filename_kwargs=['filename'])
+        def func(a, *filenames, **kwargs):
+            print('func ran')
             return a
-        with self.assertRaisesRegex(NotImplementedError, 'only supports positional-or-keyword arguments'):
-            func(1, e=5)
 
-        @cache.memoize()
-        def func(*args, c=3, d=None):
+        filename = os.path.join(self.dir, 'test')
+        with open(filename, 'w') as file:
+            file.write('1')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, filename, filename=filename), 1)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, filename, filename=filename), 1)
+            self.assertEqual(captured.stdout.get_text(), '')
+
+        with open(filename, 'w') as file:
+            file.write('2')
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, filename, filename=filename), 1)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+    def test_memoize_variadic_filename_argument_after_default(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'))
+
+        # positions of filename arguments include the positional parameters with defaults
+        @cache.memoize(filename_args=[1, 2])
+        def func(a, b=1, *filenames):
+            print('func ran')
             return a
-        with self.assertRaisesRegex(NotImplementedError, 'Submit issue to request support for optional arguments'):
-            func(1, 2, e=5)
+
+        filename = os.path.join(self.dir, 'test')
+        with open(filename, 'w') as file:
+            file.write('1')
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, filename, filename), 1)
+            self.assertEqual(func(1, filename, filename), 1)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+        with open(filename, 'w') as file:
+            file.write('2')
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            self.assertEqual(func(1, filename, filename), 1)
+            self.assertEqual(captured.stdout.get_text(), 'func ran')
+
+    def test_file_fingerprints(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'))
+
+        filename = os.path.join(self.dir, 'test')
+        with open(filename, 'w') as file:
+            file.write('1')
+        stat = os.stat(filename)
+
+        digest = cache._hash_file_content(filename)
+        self.assertEqual(digest, cache._hash_file(filename))
+        self.assertEqual(len(cache.fingerprints), 1)
+
+        # the index is used while the status of the file is unchanged
+        with open(filename, 'w') as file:
+            file.write('2')
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(cache._hash_file_content(filename), digest)
+
+        # the index is shared across caches of the same directory
+        cache.close()
+        cache_2 = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'))
+        self.assertEqual(cache_2._hash_file_content(filename), digest)
+
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertNotEqual(cache_2._hash_file_content(filename), digest)
+        self.assertEqual(cache_2._hash_file_content(filename), cache_2._hash_file(filename))
+
+        # the index holds one hash per file, and is cleared with the cache
+        self.assertEqual(len(cache_2.fingerprints), 1)
+        cache_2.clear()
+        self.assertEqual(len(cache_2.fingerprints), 0)
+        cache_2.close()
+
+    def test_memoize_in_memory(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), memory_size=2)
+
+        @cache.memoize()
+        def func(input):
+            return numpy.full((3,), input)
+
+        value = func(1)
+        self.assertIs(func(1), value)
+        self.assertEqual(func(1.).dtype, numpy.float64)
+        self.assertEqual(func(2).tolist(), [2, 2, 2])
+        self.assertEqual(len(cache.memory), 2)
+        self.assertEqual((func.statistics.memory_hits, func.statistics.disk_hits, func.statistics.misses), (1, 0, 3))
+
+        # evicted values are read from disk, and cached in memory again
+        self.assertIsNot(func(1), value)
+        self.assertEqual(func(1).tolist(), [1, 1, 1])
+        self.assertEqual((func.statistics.memory_hits, func.statistics.disk_hits, func.statistics.misses), (2, 1, 3))
+
+        func.statistics.reset()
+        cache.clear()
+        self.assertEqual(len(cache.memory), 0)
+        func(1)
+        self.assertEqual((func.statistics.memory_hits, func.statistics.disk_hits, func.statistics.misses), (0, 0, 1))
+
+    def test_memoize_in_memory_delete(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), memory_size=10)
+
+        @cache.memoize(tag='func')
+        def func(input):
+            return [input]
+
+        # values which are removed from disk are also removed from memory, which forces them to be recomputed
+        func(1)
+        self.assertTrue(cache.delete(func.__cache_key__(1)))
+        func(1)
+        self.assertEqual((func.statistics.memory_hits, func.statistics.disk_hits, func.statistics.misses), (0, 0, 2))
+
+        func.statistics.reset()
+        del cache[func.__cache_key__(1)]
+        func(1)
+        self.assertEqual(cache.pop(func.__cache_key__(1)), [1])
+        func(1)
+        self.assertEqual((func.statistics.memory_hits, func.statistics.disk_hits, func.statistics.misses), (0, 0, 2))
+
+        func.statistics.reset()
+        self.assertEqual(cache.evict('func'), 1)
+        func(1)
+        cache.cull()
+        func(1)
+        self.assertEqual((func.statistics.memory_hits, func.statistics.disk_hits, func.statistics.misses), (0, 1, 1))
+
+    def test_memoize_in_memory_expire(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), memory_size=10)
+
+        @cache.memoize(expire=0.2)
+        def func(input):
+            return [input]
+
+        func(1)
+        func(1)
+        time.sleep(0.3)
+        func(1)
+        self.assertEqual((func.statistics.memory_hits, func.statistics.disk_hits, func.statistics.misses), (1, 0, 2))
+
+        time.sleep(0.3)
+        self.assertEqual(cache.expire(), 1)
+        self.assertEqual(len(cache.memory), 0)
+
+    def test_memory_cache(self):
+        memory = wc_utils.cache.MemoryCache(2)
+        memory.set('a', 1)
+        memory.set('b', 2)
+        self.assertEqual(memory.get('a'), 1)
+        memory.set('c', 3)
+        self.assertEqual(memory.get('b'), None)
+        self.assertEqual(memory.get('a'), 1)
+        self.assertEqual(memory.get('c'), 3)
+
+        memory.set('d', 4, expire_time=time.time() - 1)
+        self.assertEqual(memory.get('d', default=-1), -1)
+        self.assertEqual(len(memory), 1)
+
+        memory.set('d', 4, expire_time=time.time() - 1)
+        self.assertEqual(memory.expire(), 1)
+        self.assertEqual(len(memory), 1)
+        self.assertTrue(memory.delete('c'))
+        self.assertFalse(memory.delete('c'))
+        self.assertEqual(len(memory), 0)
+
+    def test_pickled_value(self):
+        CountingPickles.n_pickles = 0
+        CountingPickles.n_unpickles = 0
+
+        value = wc_utils.cache.PickledValue(CountingPickles([1]))
+        self.assertEqual(CountingPickles.n_pickles, 1)
+
+        # the pickle is unpickled once
+        self.assertEqual(value.get_value().value, [1])
+        self.assertIs(value.get_value(), value.get_value())
+        self.assertEqual(CountingPickles.n_unpickles, 1)
+
+        # the value isn't pickled again when it is written to disk
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'))
+        cache['key'] = value
+        self.assertEqual(CountingPickles.n_pickles, 1)
+        self.assertEqual(cache['key'].value, [1])
+        self.assertEqual(CountingPickles.n_unpickles, 2)
+        cache.close()
+
+    def test_hash_file(self):
+        filename = os.path.join(self.dir, 'test')
+        data = os.urandom(10000)
+        with open(filename, 'wb') as file:
+            file.write(data)
+
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), hash_block_size=1000)
+        self.assertEqual(cache._hash_file(filename), hashlib.sha1(data).hexdigest())
+        cache.close()
+
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), hash_algorithm='blake2b',
+                                     hash_block_size=1000)
+        self.assertEqual(cache._hash_file(filename), hashlib.blake2b(data).hexdigest())
+        cache.close()
+
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), hash_algorithm='blake2b',
+                                     hash_block_size=1000, hash_chunk_size=4096, hash_max_workers=2)
+        digests = [hashlib.blake2b(data[start:start + 4096]).digest() for start in range(0, len(data), 4096)]
+        self.assertEqual(cache._hash_file(filename), hashlib.blake2b(b''.join(digests)).hexdigest())
+        self.assertEqual(cache._hash_file_content(filename), cache._hash_file(filename))
+
+        filename_2 = os.path.join(self.dir, 'test_2')
+        with open(filename_2, 'wb') as file:
+            file.write(data[0:4096])
+        self.assertEqual(cache._hash_file(filename_2), hashlib.blake2b(data[0:4096]).hexdigest())
+        cache.close()
+
+        with self.assertRaisesRegex(ValueError, 'unsupported hash type'):
+            wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), hash_algorithm='unknown')
+
+    def test_memoize_write_behind(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), write_queue_size=2)
+
+        @cache.memoize()
+        def func(input):
+            print('func ran')
+            return 2 * input
+
+        with capturer.CaptureOutput(merged=False, relay=False) as captured:
+            for i in range(10):
+                self.assertEqual(func(i), 2 * i)
+                self.assertEqual(func(i), 2 * i)
+            self.assertEqual(captured.stdout.get_text(), 'func ran\n' * 9 + 'func ran')
+        self.assertEqual(func.statistics.misses, 10)
+        self.assertEqual(func.statistics.memory_hits + func.statistics.disk_hits, 10)
+
+        cache.flush()
+        self.assertEqual(cache.writer._pending, {})
+        self.assertEqual(len(cache), 10)
+
+        cache.close()
+        cache.close()
+
+        cache_2 = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'))
+
+        @cache_2.memoize(name=func.__module__ + func.__qualname__)
+        def func_2(input):
+            return None
+
+        self.assertEqual(func_2(9), 18)
+        cache_2.close()
+
+    def test_memoize_write_behind_error(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), write_queue_size=2)
+
+        @cache.memoize()
+        def func(input):
+            return [input]
+
+        # values which can't be pickled are reported to the caller
+        @cache.memoize()
+        def func_2(input):
+            return lambda: input
+
+        with self.assertRaises(Exception):
+            func_2(1)
+
+        # errors which occur while writing values are deferred until the next flush
+        with mock.patch.object(cache, 'set', side_effect=OSError('disk is full')):
+            self.assertEqual(func(1), [1])
+            with self.assertRaisesRegex(OSError, 'disk is full'):
+                cache.flush()
+        cache.flush()
+        self.assertEqual(len(cache), 0)
+
+        # deferred errors are discarded by clear
+        with mock.patch.object(cache, 'set', side_effect=OSError('disk is full')):
+            self.assertEqual(func(2), [2])
+            cache.writer.wait()
+        self.assertEqual(cache.clear(), 0)
+        cache.flush()
+        cache.close()
+
+    def test_memoize_write_behind_modified_value(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'), write_queue_size=2)
+
+        @cache.memoize()
+        def func(input):
+            return [input]
+
+        # the values are pickled when they are queued, so later modifications aren't written
+        event = threading.Event()
+        cache_set = cache.set
+
+        def set_after_event(*args, **kwargs):
+            event.wait()
+            return cache_set(*args, **kwargs)
+
+        with mock.patch.object(cache, 'set', side_effect=set_after_event):
+            value = func(1)
+            value.append(2)
+            self.assertEqual(func(1), [1])
+            self.assertIs(func(1), func(1))
+            event.set()
+            cache.flush()
+        self.assertEqual(cache[func.__cache_key__(1)], [1])
+
+        # deleted values are written before they are removed
+        func(2)
+        cache.delete(func.__cache_key__(2))
+        cache.flush()
+        self.assertNotIn(func.__cache_key__(2), cache)
+
+        cache.close()
@@ -0,0 +1,51 @@
+""" Benchmarks of the caching utilities
+
+:Author: agent <agent@local>
+:Date: 2026-10-16
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+import inspect
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import wc_utils.cache
+
+
+class MemoizeBenchmarkTestCase(unittest.TestCase):
+    """ Cache hits of small memoized functions should not be dominated by the analysis of their signatures """
+
+    N_CALLS = 2000
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_hit_throughput(self):
+        cache = wc_utils.cache.Cache(directory=os.path.join(self.dir, 'cache'))
+
+        def func(a, b, c=3, *args, d=None, **kwargs):
+            return a + b + c
+
+        memoized_func = cache.memoize()(func)
+        self.assertEqual(memoized_func(1, 2, d=4), 6)
+        for _ in range(self.N_CALLS):
+            self.assertEqual(memoized_func(1, 2, d=4), 6)
+
+        build_key = cache._compile_key_builder(func, ('func',))
+        start = time.time()
+        for _ in range(self.N_CALLS):
+            build_key((1, 2), {'d': 4})
+        compiled_rate = self.N_CALLS / max(time.time() - start, 1e-6)
+
+        start = time.time()
+        for _ in range(self.N_CALLS):
+            inspect.signature(func).bind(1, 2, d=4)
+        inspect_rate = self.N_CALLS / max(time.time() - start, 1e-6)
+
+        self.assertGreater(compiled_rate, inspect_rate)
@@ -0,0 +1,112 @@
+""" Test the binary format for workbooks
+
+:Author: agent <agent@local>
+:Date: 2026-10-16
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from shutil import rmtree
+from tempfile import mkdtemp
+from wc_utils.workbook import binary
+from wc_utils.workbook.core import Workbook, Worksheet, Row, Formula
+import datetime
+import os
+import unittest
+
+
+class TestBinary(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'test.wcwb')
+
+        wk = self.wk = Workbook()
+        wk['Ws-0'] = Worksheet([
+            Row(['Id', 'Val-1', 'Val-2', 'Val-3']),
+            Row(['a0\taa0\naaa0', 1, 2., True]),
+            Row([u'b0€', -3, float('inf'), False]),
+            Row(['c0', 2 ** 70, -2 ** 63, None]),
+        ])
+        wk[u'Ws-€'] = Worksheet([
+            Row([datetime.date(2019, 11, 14), datetime.time(1, 2, 3), datetime.datetime(2019, 11, 14, 1, 2, 3, 4)]),
+            Row([Formula('=A1', 1.5), Formula('=B1'), Formula('=C1', 'abc')]),
+            Row([]),
+            Row(['', 'a0\taa0\naaa0']),
+        ])
+        wk['Ws-2'] = Worksheet()
+
+    def tearDown(self):
+        rmtree(self.tempdir)
+
+    def test_dump_load(self):
+        binary.dump(self.wk, self.filename, key=b'key')
+        wk = binary.load(self.filename)
+        self.assertEqual(wk, self.wk)
+        self.assertEqual(list(wk.keys()), list(self.wk.keys()))
+
+        self.assertEqual([type(cell) for cell in wk['Ws-0'][1]], [str, int, float, bool])
+        self.assertEqual(wk['Ws-0'][3][1], 2 ** 70)
+        self.assertEqual(wk[u'Ws-€'][1][2].value, 'abc')
+        self.assertEqual(wk[u'Ws-€'][3][0], '')
+        self.assertIsInstance(wk['Ws-2'], Worksheet)
+        self.assertIsInstance(wk['Ws-0'][0], Row)
+
+        self.assertEqual(binary.load(self.filename, key=b'key'), self.wk)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, 'at most'):
+            binary.dump(self.wk, self.filename, key=b'k' * (binary.KEY_SIZE + 1))
+
+        wk = Workbook({'Ws': Worksheet([Row([[]])])})
+        with self.assertRaisesRegex(ValueError, 'Unsupported type list'):
+            binary.dump(wk, self.filename)
+        self.assertEqual(os.listdir(self.tempdir), [])
+
+        binary.dump(self.wk, self.filename, key=b'key')
+        with self.assertRaisesRegex(ValueError, 'different key'):
+            binary.load(self.filename, key=b'other key')
+
+        with open(self.filename, 'rb') as file:
+            data = file.read()
+
+        with open(self.filename, 'wb') as file:
+            file.write(data[0:-16])
+        with self.assertRaisesRegex(ValueError, 'truncated'):
+            binary.load(self.filename)
+
+        with open(self.filename, 'wb') as file:
+            file.write(data[0:10])
+        with self.assertRaisesRegex(ValueError, 'not a binary workbook'):
+            binary.load(self.filename)
+
+        with open(self.filename, 'wb') as file:
+            file.write(b'XXXX' + data[4:])
+        with self.assertRaisesRegex(ValueError, 'not a binary workbook'):
+            binary.load(self.filename)
+
+        with open(self.filename, 'wb') as file:
+            file.write(data[0:4] + (binary.VERSION + 1).to_bytes(4, 'little') + data[8:])
+        with self.assertRaisesRegex(ValueError, 'has version'):
+            binary.load(self.filename)
+
+    def test_corrupt(self):
+        binary.dump(self.wk, self.filename, key=b'key')
+        with open(self.filename, 'rb') as file:
+            data = file.read()
+
+        # an invalid index of the name of a sheet
+        with open(self.filename, 'wb') as file:
+            file.write(data[0:binary.HEADER.size] + b'\xff' * 8 + data[binary.HEADER.size + 8:])
+        with self.assertRaisesRegex(ValueError, 'corrupt'):
+            binary.load(self.filename, key=b'key')
+
+        # each corrupt byte of the body either yields a workbook or is reported as a `ValueError`
+        for i_byte in range(binary.HEADER.size, len(data)):
+            for value in (0x00, 0x80, 0xff):
+                with open(self.filename, 'wb') as file:
+                    file.write(data[0:i_byte] + bytes([value]) + data[i_byte + 1:])
+                try:
+                    binary.load(self.filename, key=b'key')
+                except ValueError:
+                    pass
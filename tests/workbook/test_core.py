@@ -7,9 +7,17 @@
 """
 
 from copy import deepcopy
-from wc_utils.workbook.core import Workbook, Worksheet, Row, WorksheetDifference, RowDifference, CellDifference
+from wc_utils.workbook.core import (Workbook, LazyWorkbook, Worksheet, Row, Formula, ColumnarWorksheet, WorksheetColumn,
+                                    WorksheetDifference, RowDifference, CellDifference)
+import numpy
+import pickle
 import unittest
 
+try:
+    import pandas
+except ModuleNotFoundError:  # pragma: no cover
+    pandas = None  # pragma: no cover
+
 
 class TestCore(unittest.TestCase):
 
@@ -182,6 +190,178 @@ class TestCore(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, '`other` must be an instance of `Row`'):
             self.wk.difference(wk)
 
+    def test_difference_aligned(self):
+        ws = Worksheet([Row(['Id', 'Val'])] + [Row(['r{}'.format(i), i]) for i in range(10)])
+        other = deepcopy(ws)
+        other.insert(2, Row(['new', 99]))
+        del other[6]
+        other[8] = Row(['r7', 70])
+
+        self.assertEqual(len(ws.difference(other)), 5)
+
+        expected = WorksheetDifference([
+            ((None, 2), 'Row not in self'),
+            ((5, None), 'Row not in other'),
+            ((8, 8), RowDifference({1: CellDifference('7 != 70')})),
+        ])
+        self.assertEqual(ws.difference(other, align=True), expected)
+        self.assertEqual(str(ws.difference(other, align=True)),
+                         'Row 3 of other:\n  Row not in self\n'
+                         'Row 6:\n  Row not in other\n'
+                         'Row 9:\n  Cell B: 7 != 70')
+        self.assertEqual(ws.difference(other, key_column=0), WorksheetDifference([
+            ((5, None), 'Row not in other'),
+            ((8, 8), RowDifference({1: CellDifference('7 != 70')})),
+            ((None, 2), 'Row not in self'),
+        ]))
+        self.assertEqual(ws.difference(deepcopy(ws), align=True), {})
+        self.assertEqual(ws.difference(deepcopy(ws), key_column=0), {})
+
+        # unmatched rows between matched rows are compared in order
+        other = deepcopy(ws)
+        other[3][0] = 'r2*'
+        other[4][0] = 'r3*'
+        other.insert(5, Row(['new', 99]))
+        self.assertEqual(ws.difference(other, align=True), WorksheetDifference([
+            ((3, 3), RowDifference({0: CellDifference('r2 != r2*')})),
+            ((4, 4), RowDifference({0: CellDifference('r3 != r3*')})),
+            ((None, 5), 'Row not in self'),
+        ]))
+
+        # moved rows
+        other = deepcopy(ws)
+        other[1], other[5] = other[5], other[1]
+        other[1][1] = 40
+        self.assertEqual(ws.difference(other, key_column=0), WorksheetDifference([
+            ((1, 5), 'Row moved'),
+            ((5, 1), RowDifference({1: CellDifference('4 != 40')})),
+        ]))
+        self.assertEqual(str(ws.difference(other, key_column=0)),
+                         'Row 2 (row 6 of other):\n  Row moved\n'
+                         'Row 6 (row 2 of other):\n  Cell B: 4 != 40')
+
+        # rows with duplicate keys are matched in order, as are rows with blank keys
+        ws = Worksheet([Row(['Id', 'V']), Row(['x', 1])])
+        other = Worksheet([Row(['Id', 'V']), Row(['x', 1]), Row(['x', 2])])
+        self.assertEqual(ws.difference(other, key_column=0), WorksheetDifference([
+            ((None, 2), 'Row not in self'),
+        ]))
+
+        ws = Worksheet([Row(['Id', 'V']), Row(['x', 1]), Row(['x', 2]), Row([None, 3]), Row(['', 4])])
+        other = Worksheet([Row(['Id', 'V']), Row(['x', 1]), Row(['x', 20]), Row(['x', 30]),
+                           Row([None, 3]), Row([None, 4]), Row([None, 5])])
+        self.assertEqual(ws.difference(other, key_column=0), WorksheetDifference([
+            ((2, 2), RowDifference({1: CellDifference('2 != 20')})),
+            ((None, 3), 'Row not in self'),
+            ((None, 6), 'Row not in self'),
+        ]))
+        self.assertEqual(other.difference(ws, key_column=0), WorksheetDifference([
+            ((2, 2), RowDifference({1: CellDifference('20 != 2')})),
+            ((3, None), 'Row not in other'),
+            ((6, None), 'Row not in other'),
+        ]))
+        self.assertEqual(Worksheet([Row([None, 1])]).difference(Worksheet([Row([None, 2])]), key_column=5),
+                         WorksheetDifference([((0, 0), RowDifference({1: CellDifference('1 != 2')}))]))
+
+        # unequal rows without cell differences aren't reported
+        class TolerantRow(Row):
+            def cell_difference(self, cell_self, cell_other):
+                if isinstance(cell_self, float) and isinstance(cell_other, float) and abs(cell_self - cell_other) < 1e-6:
+                    return CellDifference()
+                return super(TolerantRow, self).cell_difference(cell_self, cell_other)
+
+        ws = Worksheet([TolerantRow(['Id', 'V']), TolerantRow(['x', 1.]), TolerantRow(['y', 2.])])
+        other = Worksheet([TolerantRow(['Id', 'V']), TolerantRow(['x', 1. + 1e-9]), TolerantRow(['y', 2.])])
+        self.assertNotEqual(ws, other)
+        self.assertEqual(ws.difference(other), {})
+        self.assertEqual(ws.difference(other, align=True), {})
+        self.assertEqual(ws.difference(other, key_column=0), {})
+
+        # workbooks and columnar worksheets
+        wk = deepcopy(self.wk)
+        wk['Ws-1'].insert(1, Row(['a', 0, 0.]))
+        self.assertEqual(self.wk.difference(wk, align=True),
+                         {'Ws-1': WorksheetDifference([((None, 1), 'Row not in self')])})
+        self.assertEqual(ColumnarWorksheet.from_rows(self.wk['Ws-1']).difference(
+            ColumnarWorksheet.from_rows(wk['Ws-1']), key_column=0),
+            WorksheetDifference([((None, 1), 'Row not in self')]))
+
+    def test_get_digest(self):
+        # semantically equal rows have equal digests
+        self.assertEqual(Row(['a', 1, 2., None, '']).get_digest(), Row(['a', 1., 2, '', None]).get_digest())
+        self.assertEqual(Row([True, False]).get_digest(), Row([1, 0]).get_digest())
+        self.assertNotEqual(Row(['1']).get_digest(), Row([1]).get_digest())
+        self.assertNotEqual(Row([1.5]).get_digest(), Row([1]).get_digest())
+        self.assertNotEqual(Row([None]).get_digest(), Row(['None']).get_digest())
+        self.assertEqual(Row([2**70]).get_digest(), Row([float(2**70)]).get_digest())
+
+        # cells which can't be digested
+        self.assertEqual(Row([float('nan')]).get_digest(), None)
+        self.assertEqual(Row([Formula('=A1', 1)]).get_digest(), None)
+        self.assertEqual(Row(['a']).get_digest(compute=False), None)
+
+        # digests are only used when they have been computed for both workbooks
+        wk = deepcopy(self.wk)
+        self.assertEqual(wk.get_digest(compute=False), None)
+
+        # comparisons of worksheets whose digests haven't been computed don't subscribe the worksheets to their rows
+        self.assertEqual(wk, self.wk)
+        self.assertEqual(wk['Ws-0']._digest_token, None)
+        self.assertEqual(wk['Ws-0'][0]._worksheets, None)
+
+        self.assertEqual(self.wk.get_digest(), wk.get_digest())
+        self.assertEqual(self.wk.get_digest(compute=False), wk.get_digest(compute=False))
+        self.assertEqual(wk, self.wk)
+        self.assertEqual(wk.difference(self.wk), {})
+
+        # digests are invalidated by modifications of rows and worksheets
+        wk['Ws-1'][1][1] = 10
+        self.assertEqual(wk['Ws-1'][1].get_digest(compute=False), None)
+        self.assertEqual(wk.get_digest(compute=False), None)
+        self.assertNotEqual(wk, self.wk)
+        self.assertNotEqual(self.wk.get_digest(), wk.get_digest())
+        self.assertEqual(set(wk.difference(self.wk).keys()), set(['Ws-1']))
+
+        wk['Ws-1'][1].pop()
+        wk['Ws-1'][1].extend([2.])
+        wk['Ws-1'][1][1] = 1
+        self.assertEqual(wk, self.wk)
+        wk.get_digest()
+        self.assertEqual(wk, self.wk)
+
+        wk['Ws-2'].append(Row(['d', 7, 8.]))
+        self.assertEqual(wk['Ws-2'].get_digest(compute=False), None)
+        self.assertNotEqual(wk, self.wk)
+        self.assertNotEqual(wk.get_digest(), self.wk.get_digest())
+        del wk['Ws-2'][-1]
+        self.assertEqual(wk.get_digest(), self.wk.get_digest())
+
+        # modifications only invalidate the cached digests of the worksheets which contain the modified rows
+        wk.get_digest()
+        wk['Ws-1'][1][1] = 10
+        wk['Ws-2'].append(Row(['d', 7, 8.]))
+        self.assertEqual(wk['Ws-1'].get_digest(compute=False), None)
+        self.assertEqual(wk['Ws-2'].get_digest(compute=False), None)
+        self.assertEqual(wk['Ws-0'].get_digest(compute=False), self.wk['Ws-0'].get_digest())
+
+        ws = wk['Ws-0'][1:]
+        ws.get_digest()
+        wk['Ws-0'].get_digest()
+        wk['Ws-0'][1][1] = 10
+        self.assertEqual(ws.get_digest(compute=False), None)
+        self.assertEqual(wk['Ws-0'].get_digest(compute=False), None)
+        self.assertEqual(ws.get_digest(), wk['Ws-0'][1:].get_digest())
+
+        # cached digests of worksheets aren't pickled
+        ws = pickle.loads(pickle.dumps(self.wk['Ws-0']))
+        self.assertEqual(ws._digest_cache, None)
+        self.assertEqual(ws.get_digest(compute=False), self.wk['Ws-0'].get_digest())
+
+        # worksheets whose rows aren't instances of `Row` aren't digested
+        ws = Worksheet([['a', 1]])
+        self.assertEqual(ws.get_digest(), None)
+        self.assertNotEqual(ws, Worksheet([Row(['a', 1])]))
+
     def test_remove_empty_final_rows(self):
         ws = Worksheet()
         ws.append(Row(['a', 'b']))
@@ -225,3 +405,208 @@ class TestCore(unittest.TestCase):
         self.assertEqual(len(ws), 2)
         self.assertEqual(ws[0], Row(['a', None, 'c']))
         self.assertEqual(ws[1], Row(['b', None, 'd']))
+
+
+class TestLazyWorkbook(unittest.TestCase):
+
+    def setUp(self):
+        wk = self.wk = Workbook()
+        wk['Ws-0'] = Worksheet([Row(['Id', 'Val']), Row(['a', 1])])
+        wk['Ws-1'] = Worksheet([Row(['Id', 'Val']), Row(['b', 2])])
+        wk['Ws-2'] = Worksheet([Row(['Id', 'Val']), Row(['c', 3])])
+
+        self.loaded = []
+        self.closed = []
+
+    def get_lazy_workbook(self):
+        def load_worksheet(sheet_name):
+            self.loaded.append(sheet_name)
+            return deepcopy(self.wk[sheet_name])
+
+        return LazyWorkbook(list(self.wk.keys()), load_worksheet=load_worksheet,
+                            close=lambda: self.closed.append(True))
+
+    def test_load_on_access(self):
+        wk = self.get_lazy_workbook()
+        self.assertIsInstance(wk, Workbook)
+        self.assertEqual(list(wk), ['Ws-0', 'Ws-1', 'Ws-2'])
+        self.assertEqual(list(wk.keys()), ['Ws-0', 'Ws-1', 'Ws-2'])
+        self.assertEqual(len(wk), 3)
+        self.assertIn('Ws-1', wk)
+        self.assertEqual(repr(wk), "LazyWorkbook([('Ws-0', <unloaded>), ('Ws-1', <unloaded>), ('Ws-2', <unloaded>)])")
+        self.assertEqual(self.loaded, [])
+
+        self.assertEqual(wk['Ws-1'], self.wk['Ws-1'])
+        self.assertIs(wk['Ws-1'], wk.get('Ws-1'))
+        self.assertEqual(self.loaded, ['Ws-1'])
+        self.assertTrue(wk.is_loaded('Ws-1'))
+        self.assertFalse(wk.is_loaded('Ws-0'))
+        self.assertEqual(wk.get('Ws-3'), None)
+
+        self.assertEqual(list(wk.values()), list(self.wk.values()))
+        self.assertEqual(list(wk.items()), list(self.wk.items()))
+        self.assertEqual(self.loaded, ['Ws-1', 'Ws-0', 'Ws-2'])
+
+        # release memory
+        wk.unload('Ws-0')
+        self.assertFalse(wk.is_loaded('Ws-0'))
+        self.assertEqual(wk['Ws-0'], self.wk['Ws-0'])
+        self.assertEqual(self.loaded, ['Ws-1', 'Ws-0', 'Ws-2', 'Ws-0'])
+
+        # worksheets which were set can't be unloaded
+        wk['Ws-3'] = Worksheet()
+        with self.assertRaisesRegex(ValueError, 'not loaded lazily'):
+            wk.unload('Ws-3')
+
+        self.assertEqual(wk.pop('Ws-3'), Worksheet())
+        self.assertEqual(wk.setdefault('Ws-0'), self.wk['Ws-0'])
+        self.assertEqual(wk.popitem(), ('Ws-2', self.wk['Ws-2']))
+
+    def test_eq_and_difference(self):
+        wk = self.get_lazy_workbook()
+        self.assertEqual(wk, self.wk)
+        self.assertEqual(self.wk, wk)
+        self.assertEqual(self.loaded, ['Ws-0', 'Ws-1', 'Ws-2'])
+
+        wk = self.get_lazy_workbook()
+        self.assertNotEqual(wk, 'wk')
+        self.assertEqual(self.wk.difference(wk), {})
+        self.assertEqual(wk.difference(self.wk), {})
+        with self.assertRaisesRegex(ValueError, 'must be an instance of `Workbook`'):
+            wk.difference('wk')
+
+        wk = self.get_lazy_workbook()
+        other = deepcopy(self.wk)
+        other['Ws-1'][1][1] = 20
+        self.assertNotEqual(wk, other)
+        self.assertEqual(set(wk.difference(other).keys()), set(['Ws-1']))
+
+        # copies are eager workbooks
+        wk = self.get_lazy_workbook()
+        for copy in [deepcopy(wk), wk.copy()]:
+            self.assertEqual(copy.__class__, Workbook)
+            self.assertEqual(copy, self.wk)
+
+    def test_close(self):
+        with self.get_lazy_workbook() as wk:
+            self.assertEqual(wk['Ws-0'], self.wk['Ws-0'])
+        self.assertEqual(self.closed, [True])
+        wk.close()
+        self.assertEqual(self.closed, [True])
+
+        self.assertEqual(wk['Ws-0'], self.wk['Ws-0'])
+        with self.assertRaisesRegex(ValueError, 'has been closed'):
+            wk['Ws-1']
+        with self.assertRaisesRegex(ValueError, 'has been closed'):
+            wk.unload('Ws-0')
+
+
+class TestColumnarWorksheet(unittest.TestCase):
+
+    def setUp(self):
+        self.ws = Worksheet()
+        self.ws.append(Row(['Id', 'Int', 'Float', 'Bool', 'Mixed']))
+        self.ws.append(Row(['a', 1, 2., True, None]))
+        self.ws.append(Row(['b', None, 3.5, False, 'x']))
+        self.ws.append(Row(['c', 3, '', None, Formula('=1', 1)]))
+        self.ws.append(Row(['d', 4, 4.5, True, 1]))
+
+    def test_from_rows(self):
+        ws = ColumnarWorksheet.from_rows(self.ws)
+        self.assertEqual(len(ws), 5)
+        self.assertEqual([column.values.dtype for column in ws.columns],
+                         [numpy.dtype(object), numpy.dtype(numpy.int64), numpy.dtype(numpy.float64),
+                          numpy.dtype(numpy.bool_), numpy.dtype(object)])
+        self.assertEqual(ws.columns[1].others, {0: 'Int'})
+        self.assertEqual(ws.columns[1].mask.tolist(), [True, False, True, False, False])
+        self.assertEqual(WorksheetColumn.from_values([1, 2, 2**70]).others, {2: 2**70})
+        self.assertEqual(ws.columns[3].values[1:].tolist(), [True, False, False, True])
+
+        self.assertEqual(ColumnarWorksheet.from_rows([Row(['a']), Row(['b', 2])])[0], Row(['a', None]))
+
+        ws = ColumnarWorksheet.from_rows([Row(), Row()])
+        self.assertEqual(len(ws), 2)
+        self.assertEqual(list(ws), [Row(), Row()])
+
+        with self.assertRaisesRegex(ValueError, 'same length'):
+            ColumnarWorksheet([WorksheetColumn.from_values([1]), WorksheetColumn.from_values([1, 2])])
+
+    def test_list_api(self):
+        ws = ColumnarWorksheet.from_rows(self.ws)
+        self.assertEqual(list(ws), list(self.ws))
+        self.assertEqual(ws.to_worksheet(), self.ws)
+        self.assertEqual(ws[1], Row(['a', 1, 2., True, None]))
+        self.assertIsInstance(ws[1][1], int)
+        self.assertIsInstance(ws[1][3], bool)
+        self.assertEqual(ws[-2], Row(['c', 3, None, None, Formula('=1', 1)]))
+        self.assertEqual(ws[1:3].to_worksheet(), self.ws[1:3])
+        self.assertEqual(ws[::2].to_worksheet(), self.ws[::2])
+        with self.assertRaises(IndexError):
+            ws[5]
+
+    def test_eq_and_difference(self):
+        ws = ColumnarWorksheet.from_rows(self.ws)
+        self.assertEqual(ws, ColumnarWorksheet.from_rows(self.ws))
+        self.assertNotEqual(ws, self.ws)
+        self.assertNotEqual(ws, ws[0:4])
+
+        other = deepcopy(self.ws)
+        other[2][2] = 3.6
+        other_ws = ColumnarWorksheet.from_rows(other)
+        self.assertNotEqual(ws, other_ws)
+        self.assertEqual(ws.difference(other_ws), self.ws.difference(other))
+
+        # columns of different types
+        other = deepcopy(self.ws)
+        other[0][3] = None
+        other[1][3] = 1
+        other[2][3] = 'False'
+        self.assertNotEqual(ws, ColumnarWorksheet.from_rows(other))
+
+        with self.assertRaisesRegex(ValueError, 'must be an instance of `ColumnarWorksheet`'):
+            ws.difference(self.ws)
+
+    def test_remove_empty_final_rows_and_cols(self):
+        ws = ColumnarWorksheet.from_rows([
+            Row(['a', None, 'c', None, None]),
+            Row(['b', 1, 'd', '']),
+            Row([None, None, None, None, None]),
+            Row([None, '']),
+        ])
+
+        ws.remove_empty_final_rows()
+        ws.remove_empty_final_cols()
+
+        self.assertEqual(len(ws), 2)
+        self.assertEqual(len(ws.columns), 3)
+        self.assertEqual(ws[0], Row(['a', None, 'c']))
+        self.assertEqual(ws[1], Row(['b', 1, 'd']))
+
+    def test_to_numpy(self):
+        ws = ColumnarWorksheet.from_rows([Row(['A', 'B']), Row([1, 2]), Row([3, 4])])
+        array = ws.to_numpy(head_rows=1)
+        self.assertEqual(array.dtype, numpy.int64)
+        self.assertEqual(array.tolist(), [[1, 2], [3, 4]])
+
+        array = ColumnarWorksheet(ws.columns[0:1]).to_numpy(head_rows=1)
+        self.assertTrue(numpy.shares_memory(array, ws.columns[0].values))
+
+        array = ColumnarWorksheet.from_rows(self.ws).to_numpy()
+        self.assertEqual(array.dtype, numpy.dtype(object))
+        self.assertEqual(array.shape, (5, 5))
+        self.assertEqual(array[3, 2], None)
+
+    @unittest.skipIf(pandas is None, 'pandas is not installed')
+    def test_to_pandas(self):
+        data_frame = ColumnarWorksheet.from_rows(self.ws).to_pandas()
+        self.assertEqual(list(data_frame.columns), ['Id', 'Int', 'Float', 'Bool', 'Mixed'])
+        self.assertEqual(str(data_frame['Int'].dtype), 'Int64')
+        self.assertEqual(str(data_frame['Bool'].dtype), 'boolean')
+        self.assertEqual(data_frame['Int'].tolist(), [1, pandas.NA, 3, 4])
+        self.assertEqual(data_frame['Mixed'].tolist(), [None, 'x', Formula('=1', 1), 1])
+
+        data_frame = ColumnarWorksheet.from_rows(self.ws[1:3]).to_pandas(head_rows=0)
+        self.assertEqual(list(data_frame.columns), [0, 1, 2, 3, 4])
+        self.assertEqual(len(data_frame), 2)
+        self.assertEqual(data_frame[2].dtype, numpy.float64)
+        self.assertEqual(data_frame[3].dtype, numpy.bool_)
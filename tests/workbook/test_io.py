@@ -7,6 +7,7 @@
 :License: MIT
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from os import path
 from openpyxl.styles import NamedStyle
@@ -14,10 +15,13 @@ from datetime import datetime
 from shutil import rmtree
 from tempfile import mkdtemp
 from wc_utils.workbook import io
-from wc_utils.workbook.core import Workbook, Worksheet, Row, Formula
+from wc_utils.workbook.core import Workbook, Worksheet, ColumnarWorksheet, WorksheetColumn, Row, Formula
 import math
+import numpy
+import os
 import openpyxl
 import unittest
+import xlsxwriter
 
 
 class TestIo(unittest.TestCase):
@@ -165,6 +169,114 @@ class TestIo(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'Unsupported pattern'):
             io.ExcelWriter(filename).run(self.wk, style=style)
 
+    def test_write_excel_extra_rows_cols(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+        style = self.style
+        style['Ws-1'] = io.WorksheetStyle(head_rows=1, extra_rows=2, extra_columns=2)
+        io.ExcelWriter(filename).run(self.wk, style=style)
+
+        # the extra cells aren't written; they are formatted by their rows and columns
+        xls_ws = openpyxl.load_workbook(filename)['Ws-1']
+        self.assertEqual(xls_ws.max_row, 4)
+        self.assertEqual(xls_ws.max_column, 3)
+        self.assertEqual([cell.value for cell in xls_ws[1]], ['Id', 'Val-1', 'Val-2'])
+        self.assertEqual(xls_ws.row_dimensions[1].font.b, True)
+
+        self.assertEqual((xls_ws.column_dimensions['A'].min, xls_ws.column_dimensions['A'].max), (1, 3))
+        self.assertEqual((xls_ws.column_dimensions['D'].min, xls_ws.column_dimensions['D'].max), (4, 5))
+        self.assertEqual(xls_ws.column_dimensions['D'].protection.locked, False)
+        self.assertEqual(xls_ws.column_dimensions['D'].hidden, False)
+        self.assertEqual(xls_ws.column_dimensions['F'].hidden, True)
+        self.assertEqual(sorted(i_row for i_row, dim in xls_ws.row_dimensions.items() if not dim.hidden),
+                         [1, 2, 3, 4, 5, 6])
+
+        self.assertEqual(io.ExcelReader(filename).run(), self.wk)
+
+    def test_write_excel_extra_rows_cols_protection(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+        style = self.style
+
+        # the rows beyond the extra rows are hidden; the columns are unlocked like the extra cells, and the extra cells
+        # of the head rows are formatted by the format of the row
+        style['Ws-1'] = io.WorksheetStyle(head_rows=1, extra_rows=2, extra_columns=2)
+        io.ExcelWriter(filename).run(self.wk, style=style, protected=True)
+        xls_ws = openpyxl.load_workbook(filename)['Ws-1']
+        self.assertEqual(xls_ws['A1'].protection.locked, True)
+        self.assertEqual(xls_ws['A2'].protection.locked, False)
+        self.assertEqual(xls_ws.row_dimensions[1].protection.locked, False)
+        self.assertEqual(xls_ws.row_dimensions[1].font.b, True)
+        self.assertEqual(xls_ws.column_dimensions['A'].protection.locked, False)
+        self.assertEqual(xls_ws.column_dimensions['D'].protection.locked, False)
+
+        # all rows are shown; the extra columns are formatted, and the cells below the data in the other columns keep
+        # the default format
+        style['Ws-1'] = io.WorksheetStyle(head_rows=1, extra_columns=2)
+        io.ExcelWriter(filename).run(self.wk, style=style, protected=True)
+        xls_ws = openpyxl.load_workbook(filename)['Ws-1']
+        self.assertEqual(xls_ws.max_row, 4)
+        self.assertEqual(xls_ws.max_column, 3)
+        self.assertEqual(xls_ws.row_dimensions[1].protection.locked, False)
+        self.assertEqual(xls_ws.row_dimensions[2].protection.locked, True)
+        for col in 'ABC':
+            self.assertEqual(xls_ws.column_dimensions[col].protection.locked, True)
+        self.assertEqual(xls_ws.column_dimensions['D'].max, 5)
+        self.assertEqual(xls_ws.column_dimensions['D'].protection.locked, False)
+        self.assertEqual(xls_ws.column_dimensions['D'].font.b, False)
+        self.assertEqual(xls_ws.column_dimensions['F'].hidden, True)
+
+        # the extra cells aren't written as blank cells
+        style['Ws-1'] = io.WorksheetStyle(head_rows=1)
+        io.ExcelWriter(filename).run(self.wk, style=style, protected=True)
+        xls_ws = openpyxl.load_workbook(filename)['Ws-1']
+        self.assertEqual(xls_ws.max_column, 3)
+        self.assertEqual(xls_ws.column_dimensions['D'].protection.locked, False)
+
+    def test_write_excel_shared_formats(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+        writer = io.ExcelWriter(filename)
+        writer.run(self.wk, style=self.style)
+
+        # one set of formats is shared by all of the worksheets, which have the same style
+        self.assertEqual(len(writer._xls_formats), 7)
+        self.assertEqual(len(set(map(id, writer.xls_workbook.formats))), len(writer.xls_workbook.formats))
+
+        style = self.style
+        style['Ws-0'] = io.WorksheetStyle(head_rows=1, head_row_fill_fgcolor='DDDDDD',
+                                          extra_rows=2, extra_columns=2)
+        writer = io.ExcelWriter(filename)
+        writer.run(self.wk, style=style)
+        self.assertEqual(len(writer._xls_formats), 7 + 2)
+        self.assertEqual(io.ExcelReader(filename).run(), self.wk)
+
+    def test_write_excel_cell_errors(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+
+        wk = deepcopy(self.wk)
+        wk['Ws-1'][2][1] = 'a' * 40000
+        with self.assertRaisesRegex(ValueError, r'^Value must be <= 32,000 characters at .*:Ws-1:B3$'):
+            io.ExcelWriter(filename).run(wk, style=self.style)
+
+        wk = deepcopy(self.wk)
+        wk['Ws-2'][3][2] = {}
+        with self.assertRaisesRegex(ValueError, r'^Unsupported type dict at .*:Ws-2:C4$'):
+            io.ExcelWriter(filename).run(wk, style=self.style)
+
+    def test_write_excel_subclassed_values(self):
+        class Str(str):
+            pass
+
+        class Int(int):
+            pass
+
+        filename = path.join(self.tempdir, 'test.xlsx')
+        wk = deepcopy(self.wk)
+        wk['Ws-0'][1][0] = Str('a0')
+        wk['Ws-0'][1][1] = Int(1)
+        io.ExcelWriter(filename).run(wk, style=self.style)
+
+        wk = io.ExcelReader(filename).run()
+        self.assertEqual(list(wk['Ws-0'][1][0:2]), ['a0', 1])
+
     def test_write_excel_row_validation(self):
         filename = path.join(self.tempdir, 'test.xlsx')
         style = self.style
@@ -335,6 +447,71 @@ class TestIo(unittest.TestCase):
         self.assertEqual(wb2['Sheet-1'][8][0], datetime_value_2)
         self.assertEqual(wb2['Sheet-1'][9][0], datetime_value_3)
 
+    def test_read_excel_read_only(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.ExcelWriter(filename).run(self.wk, style=self.style)
+
+        reader = io.ExcelReader(filename, read_only=True)
+        wk = reader.run()
+        self.assertEqual(wk, self.wk)
+        self.assertIsInstance(wk['Ws-0'][1][1], int)
+        self.assertIsInstance(wk['Ws-0'][1][3], bool)
+        self.assertEqual(wk, io.ExcelReader(filename).run())
+
+        reader.initialize_workbook()
+        ws = reader.read_worksheet('Ws-0', ignore_empty_final_rows=False, ignore_empty_final_cols=False)
+        reader.finalize_workbook()
+        dom_reader = io.ExcelReader(filename)
+        dom_reader.initialize_workbook()
+        dom_ws = dom_reader.read_worksheet('Ws-0', ignore_empty_final_rows=False, ignore_empty_final_cols=False)
+        dom_reader.finalize_workbook()
+
+        # in read-only mode, worksheets are padded to their declared dimensions, which include the extra rows and columns
+        self.assertEqual(len(ws), 6)
+        self.assertEqual(len(ws[0]), 6)
+        self.assertEqual(Worksheet(Row(row[0:len(dom_ws[0])]) for row in ws[0:len(dom_ws)]), dom_ws)
+        for row in ws[len(dom_ws):]:
+            self.assertEqual(row, Row([None] * 6))
+
+    def test_read_excel_read_only_types_and_merged_cells(self):
+        wb = openpyxl.Workbook()
+        ws = wb.create_sheet('Sheet-1')
+        ws.cell(row=1, column=1).value = 'A1'
+        ws.cell(row=1, column=2).value = '=TRUE()'
+        ws.cell(row=1, column=3).value = '=1+2'
+        ws.cell(row=2, column=1).value = datetime.strptime("30/10/2019", '%d/%m/%Y')
+        ws.cell(row=2, column=2).value = 'merged'
+        ws.merge_cells(start_row=2, start_column=2, end_row=3, end_column=3)
+        ws.cell(row=4, column=1).value = 'A4'
+        ws.cell(row=6, column=6).value = None
+
+        filename = path.join(self.tempdir, 'test.xlsx')
+        wb.save(filename)
+
+        wb_dom = io.ExcelReader(filename).run()
+        wb_read_only = io.ExcelReader(filename, read_only=True).run()
+        self.assertEqual(wb_read_only['Sheet-1'][0][0], 'A1')
+        self.assertEqual(wb_read_only['Sheet-1'][0][1], True)
+        self.assertEqual(wb_read_only['Sheet-1'][0][2], Formula('=1+2'))
+        self.assertEqual(wb_read_only['Sheet-1'][1][0], datetime.strptime("30/10/2019", '%d/%m/%Y'))
+        self.assertEqual(wb_read_only['Sheet-1'][2][2], 'merged')
+        self.assertEqual(len(wb_read_only['Sheet-1']), 4)
+        self.assertEqual(wb_read_only, wb_dom)
+
+    def test_read_excel_read_only_error(self):
+        wb = openpyxl.Workbook()
+        ws = wb.create_sheet('Sheet-1')
+
+        cell = ws.cell(row=1, column=1)
+        cell.data_type = openpyxl.cell.cell.TYPE_ERROR
+        cell.value = '#NAME?'
+
+        filename = path.join(self.tempdir, 'test.xlsx')
+        wb.save(filename)
+
+        with self.assertRaisesRegex(ValueError, 'Errors are not supported'):
+            io.ExcelReader(filename, read_only=True).run()
+
     def test_excel_read_valid_types_empty(self):
         wb = openpyxl.Workbook()
         ws = wb.create_sheet('Sheet-1')
@@ -577,6 +754,103 @@ class TestIo(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'can have at most 1 value'):
             io.ExcelWriter(filename).run(wb, style=style)
 
+        style['Ws-0'] = io.WorksheetStyle(merge_ranges=[(0, 1, 0, 3), (1, 1, 2, 2), (2, 0, 3, 1)])
+        with self.assertRaisesRegex(ValueError, 'Merge ranges B2:C3 and A3:B4 of worksheet "Ws-0" overlap'):
+            io.ExcelWriter(filename).run(wb, style=style)
+
+        style['Ws-0'] = io.WorksheetStyle(merge_ranges=[(0, 3, 0, 2)])
+        with self.assertRaisesRegex(ValueError, 'Merge range D1:C1 of worksheet "Ws-0" is empty'):
+            io.ExcelWriter(filename).run(wb, style=style)
+
+    def test_merge_ranges(self):
+        ranges = io.MergeRanges([(5, 0, 5, 3), (0, 1, 2, 2), (0, 4, 0, 5), (1, 0, 4, 0), (2, 3, 3, 3)])
+        self.assertEqual(len(ranges), 5)
+        row_ranges = ranges.iter_row_ranges()
+        self.assertEqual([list(next(row_ranges)) for i_row in range(7)], [
+            [(0, 1, 2, 2), (0, 4, 0, 5)],
+            [(0, 1, 2, 2), (1, 0, 4, 0)],
+            [(0, 1, 2, 2), (1, 0, 4, 0), (2, 3, 3, 3)],
+            [(1, 0, 4, 0), (2, 3, 3, 3)],
+            [(1, 0, 4, 0)],
+            [(5, 0, 5, 3)],
+            [],
+        ])
+        ranges.validate('Ws')
+
+        for other_range in [(4, 0, 5, 0), (2, 2, 2, 3), (0, 0, 0, 1), (0, 5, 10, 5), (3, 1, 3, 5)]:
+            with self.assertRaisesRegex(ValueError, 'overlap'):
+                io.MergeRanges(ranges.ranges + [other_range]).validate('Ws')
+            with self.assertRaisesRegex(ValueError, 'overlap'):
+                io.MergeRanges([other_range] + list(reversed(ranges.ranges))).validate('Ws')
+        for other_range in [(3, 1, 4, 2), (6, 0, 6, 0), (1, 3, 1, 10)]:
+            io.MergeRanges(ranges.ranges + [other_range]).validate('Ws')
+
+        # many ranges
+        ranges = io.MergeRanges((i_row, i_col * 2, i_row + 1, i_col * 2 + 1)
+                                for i_row in range(0, 200, 2) for i_col in range(100))
+        ranges.validate('Ws')
+        with self.assertRaisesRegex(ValueError, 'Merge ranges GQ99:GR100 and GQ100:GQ100 of worksheet "Ws" overlap'):
+            io.MergeRanges(ranges.ranges + [(99, 198, 99, 198)]).validate('Ws')
+
+    def test_write_excel_constant_memory(self):
+        style = self.style
+        style['Ws-0'] = io.WorksheetStyle(title_rows=1, head_rows=1, head_columns=1,
+                                          merge_ranges=[(0, 1, 0, 2)],
+                                          hyperlinks=[io.Hyperlink(2, 0, 'https://google.com', tip='Click to view b0')],
+                                          extra_rows=2, extra_columns=2)
+        self.wk['Ws-0'][0][2] = None
+        validation = io.WorkbookValidation()
+        validation['Ws-1'] = io.WorksheetValidation(fields=[
+            io.FieldValidation(input_title='Enter a identifier', input_message='A unique string',
+                               type=io.FieldValidationType.length,
+                               criterion=io.FieldValidationCriterion['<='],
+                               allowed_scalar_value=255),
+        ])
+
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.ExcelWriter(filename).run(self.wk, style=style, validation=validation)
+        wk = io.ExcelReader(filename).run()
+
+        filename_2 = path.join(self.tempdir, 'test-2.xlsx')
+        io.ExcelWriter(filename_2, constant_memory=True).run(self.wk, style=style, validation=validation)
+        self.assertEqual(io.ExcelReader(filename_2).run(), wk)
+
+        xls_wb = openpyxl.load_workbook(filename_2)
+        self.assertEqual([str(range) for range in xls_wb['Ws-0'].merged_cells.ranges], ['B1:C1'])
+        self.assertEqual(xls_wb['Ws-0'].cell(3, 1).hyperlink.target, 'https://google.com')
+        self.assertEqual(len(xls_wb['Ws-1'].data_validations.dataValidation), 1)
+
+    def test_write_excel_constant_memory_iterators(self):
+        wk = Workbook()
+        for sheet_name, ws in self.wk.items():
+            wk[sheet_name] = (row for row in ws)
+
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.ExcelWriter(filename, constant_memory=True).run(wk, style=self.style)
+        self.assertEqual(io.ExcelReader(filename).run(), self.wk)
+
+        wk = Workbook()
+        wk['Ws-0'] = iter([])
+        io.ExcelWriter(filename, constant_memory=True).run(wk)
+        self.assertEqual(io.ExcelReader(filename).run(), Workbook({'Ws-0': Worksheet()}))
+
+    def test_write_excel_constant_memory_errors(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+
+        wk = Workbook()
+        wk['Ws-0'] = iter([Row(['a', 'b']), Row(['c', 'd', 'e'])])
+        with self.assertRaisesRegex(ValueError, 'Row 2 of worksheet "Ws-0" is wider than the first row'):
+            io.ExcelWriter(filename, constant_memory=True).run(wk)
+
+        style = io.WorkbookStyle()
+        style['Ws-0'] = io.WorksheetStyle(merge_ranges=[(1, 1, 2, 2)])
+        with self.assertRaisesRegex(ValueError, 'Merge range B2:C3 of worksheet "Ws-0" spans multiple rows'):
+            io.ExcelWriter(filename, constant_memory=True).run(self.wk, style=style)
+
+        style['Ws-0'] = io.WorksheetStyle(merge_ranges=[(10, 1, 10, 2)])
+        with self.assertRaisesRegex(ValueError, 'Merge range B11:C11 of worksheet "Ws-0" is beyond the data'):
+            io.ExcelWriter(filename, constant_memory=True).run(self.wk, style=style)
+
     def test_formula_hyperlink(self):
         wb = Workbook()
         ws0 = wb['Ws'] = Worksheet()
@@ -674,6 +948,74 @@ class TestIo(unittest.TestCase):
 
         self.assertEqual(wk, self.wk)
 
+    def test_write_separated_values_same_as_pyexcel(self):
+        wk = deepcopy(self.wk)
+        ws = wk['Ws-3'] = Worksheet()
+        ws.append(Row(['x\ty\nz', 'q"r', 1e20, 1.5e-7, float('nan'), datetime(2019, 1, 2, 3, 4, 5)]))
+        ws.append(Row([Formula('="abc"', 'abc'), None, '']))
+        ws.append(Row())
+        ws.append(Row([None, None]))
+        wk['Ws-4'] = Worksheet()
+
+        for ext in ['csv', 'tsv']:
+            filename_csv = path.join(self.tempdir, 'test-csv-*.' + ext)
+            filename_pyexcel = path.join(self.tempdir, 'test-pyexcel-*.' + ext)
+            io.SeparatedValuesWriter(filename_csv).run(wk)
+            io.SeparatedValuesWriter(filename_pyexcel, use_pyexcel=True).run(wk)
+            for sheet_name in wk.keys():
+                with open(filename_csv.replace('*', sheet_name), 'rb') as file:
+                    content_csv = file.read()
+                with open(filename_pyexcel.replace('*', sheet_name), 'rb') as file:
+                    content_pyexcel = file.read()
+                self.assertEqual(content_csv, content_pyexcel)
+
+    def test_read_separated_values_same_as_pyexcel(self):
+        texts = ['007', '0', '0.5', '.5', '1_000', '1_000.5', '1,000', '12,34', '-1_000', ' 12 ', '+5', '-3.5', '1e5',
+                 'nan', 'NaN', 'inf', '-Infinity', 'True', 'False', 'abc', 'a b', '', '\u0661\u0662', '\xa012',
+                 '2019-01-02', '2019-01-02 03:04:05', '2019-01-02 03:04:05.123456', '2019-13-02', '12345678901',
+                 'x\ty\nz', 'q"r']
+
+        for ext, separator in [('csv', ','), ('tsv', '\t')]:
+            filename = path.join(self.tempdir, 'test.' + ext)
+            with open(filename, 'w', newline='', encoding='utf-8') as file:
+                writer = io.csv.writer(file, dialect=io.get_separated_values_dialect(filename))
+                for text in texts:
+                    writer.writerow([text, 'end'])
+                writer.writerow(texts)
+                writer.writerow([])
+                writer.writerow(['', ''])
+
+            for kwargs in [{}, {'ignore_empty_final_rows': False, 'ignore_empty_final_cols': False}]:
+                ws_csv = io.SeparatedValuesReader(filename).read_worksheet('', **kwargs)
+                ws_pyexcel = io.SeparatedValuesReader(filename, use_pyexcel=True).read_worksheet('', **kwargs)
+                self.assertEqual(ws_csv, ws_pyexcel)
+                for row_csv, row_pyexcel in zip(ws_csv, ws_pyexcel):
+                    self.assertEqual([type(cell) for cell in row_csv], [type(cell) for cell in row_pyexcel])
+
+    def test_read_column(self):
+        reader = io.SeparatedValuesReader(path.join(self.tempdir, 'test.csv'))
+        texts = ['', '0', '00', '01', '-0', '-01', '-5', '+5', ' 5', '1,000', '1_000', '123456789012345678',
+                 '1234567890123456789', '1.5', '-.5', '5.', '.', '-', '0.', '00.5', '1e5', '1e999', 'nan',
+                 'True', 'False', 'true', 'abc', '2019-11-14', '\u0663', '\u20ac5', '5\x00', '1.2.3']
+        for column in [texts, ['1'] * 10 + texts, ['a'] * 10 + texts, ['1.5'] * 200 + texts, ['True'] * 100 + texts]:
+            values = [reader.read_cell(reader.parse_cell(text)) for text in column]
+            self.assertEqual([(value.__class__, value) for value in reader.read_column(column)],
+                             [(value.__class__, value) for value in values])
+
+            typed_column = reader.read_column(column, typed=True)
+            expected_column = WorksheetColumn.from_values(values)
+            self.assertEqual(typed_column.values.dtype, expected_column.values.dtype)
+            self.assertEqual(typed_column, expected_column)
+            self.assertEqual(typed_column.to_list(), values)
+
+        self.assertEqual(reader.read_column([]), [])
+        self.assertEqual(reader.read_column(['', '']), [None, None])
+
+        column = reader.read_column(['Val', '1', '', '3', '5', '4.5'], typed=True)
+        self.assertEqual(column.values.dtype, numpy.int64)
+        self.assertEqual(column.mask.tolist(), [True, False, True, False, False, True])
+        self.assertEqual(column.others, {0: 'Val', 5: 4.5})
+
     def test_read_write_csv_no_glob(self):
         wb = Workbook()
         ws = wb['Sheet1'] = Worksheet()
@@ -725,6 +1067,363 @@ class TestIo(unittest.TestCase):
         wk = io.read(file)
         self.assertEqual(wk, self.wk)
 
+    def test_read_write_columnar(self):
+        for filename in ['test.xlsx', 'test-*.csv']:
+            filename = path.join(self.tempdir, filename)
+            io.write(filename, self.wk, style=self.style)
+
+            wk = io.read(filename, columnar=True)
+            self.assertEqual(list(wk.keys()), list(self.wk.keys()))
+            for sheet_name, ws in wk.items():
+                self.assertIsInstance(ws, ColumnarWorksheet)
+                self.assertEqual(ws.to_worksheet(), self.wk[sheet_name])
+            self.assertEqual(wk['Ws-1'].columns[1].values[1:].tolist(), [1, 3, 5])
+
+            # columnar worksheets can be written
+            filename_2 = filename.replace('test', 'test-2')
+            io.write(filename_2, wk, style=self.style)
+            self.assertEqual(io.read(filename_2), self.wk)
+
+    def test_read_with_cache(self):
+        for filename in ['test.xlsx', 'test-*.csv']:
+            filename = path.join(self.tempdir, filename)
+            io.write(filename, self.wk, style=self.style)
+            cache_filename = io.get_cache_filename(filename)
+            self.assertEqual(path.dirname(cache_filename), self.tempdir)
+
+            # the cache is created by the first read
+            self.assertEqual(io.read(filename, cache=True), self.wk)
+            self.assertTrue(path.isfile(cache_filename))
+
+            # valid caches are used
+            wk = deepcopy(self.wk)
+            wk['Ws-0'][0][0] = 'Cached'
+            io.binary.dump(wk, cache_filename, key=io.get_source_digest(filename))
+            self.assertEqual(io.read(filename, cache=True), wk)
+            self.assertNotEqual(io.read(filename), wk)
+
+            wk = io.read(filename, cache=True, columnar=True)
+            self.assertIsInstance(wk['Ws-0'], ColumnarWorksheet)
+            self.assertEqual(wk['Ws-0'][0][0], 'Cached')
+
+            # stale caches are ignored and replaced
+            wk = deepcopy(self.wk)
+            wk['Ws-1'][1][1] = 10
+            io.write(filename, wk, style=self.style)
+            self.assertEqual(io.read(filename, cache=True), wk)
+            self.assertEqual(io.binary.load(cache_filename, key=io.get_source_digest(filename)), wk)
+
+            # invalid caches are ignored
+            with open(cache_filename, 'wb') as file:
+                file.write(b'invalid')
+            self.assertEqual(io.read(filename, cache=True), wk)
+
+            # corrupt caches with valid headers are ignored
+            with open(cache_filename, 'rb') as file:
+                data = file.read()
+            with open(cache_filename, 'wb') as file:
+                file.write(data[0:io.binary.HEADER.size] + b'\xff' * (len(data) - io.binary.HEADER.size))
+            self.assertEqual(io.read(filename, cache=True), wk)
+
+    def test_read_lazily(self):
+        for filename in ['test.xlsx', 'test-*.csv']:
+            filename = path.join(self.tempdir, filename)
+            io.write(filename, self.wk, style=self.style)
+
+            with io.read(filename, lazy=True) as wk:
+                self.assertEqual(list(wk.keys()), list(self.wk.keys()))
+                self.assertEqual(wk['Ws-1'], self.wk['Ws-1'])
+                self.assertTrue(wk.is_loaded('Ws-1'))
+                self.assertFalse(wk.is_loaded('Ws-0'))
+                self.assertEqual(wk, self.wk)
+            with self.assertRaisesRegex(ValueError, 'has been closed'):
+                wk.unload('Ws-0')
+
+            wk = io.read(filename, lazy=True, columnar=True)
+            self.assertIsInstance(wk['Ws-0'], ColumnarWorksheet)
+            wk.close()
+
+            with self.assertRaisesRegex(ValueError, 'both cached and read lazily'):
+                io.read(filename, lazy=True, cache=True)
+            with self.assertRaisesRegex(ValueError, 'both read concurrently and read lazily'):
+                io.read(filename, lazy=True, max_workers=2)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                with self.assertRaisesRegex(ValueError, 'both read concurrently and read lazily'):
+                    io.read(filename, lazy=True, executor=executor)
+
+    def test_read_columns_and_rows(self):
+        for filename in ['test.xlsx', 'test-*.csv']:
+            filename = path.join(self.tempdir, filename)
+            io.write(filename, self.wk, style=self.style)
+
+            wk = io.read(filename, columns=['Val-2', 0])
+            self.assertEqual(wk['Ws-0'], Worksheet([
+                Row(['Val-2', 'Id']),
+                Row([2., 'a0\taa0\naaa0']),
+                Row([4., u'b0\u20ac']),
+                Row([6., 'c0']),
+            ]))
+            self.assertEqual(wk['Ws-1'], Worksheet([Row([row[2], row[0]]) for row in self.wk['Ws-1']]))
+
+            # empty final columns and rows are trimmed after the columns are selected
+            wk = io.read(filename, columns={'Ws-0': ['Val-3', 10]})
+            self.assertEqual(wk['Ws-0'], Worksheet([Row(['Val-3']), Row([True]), Row([False])]))
+            self.assertEqual(wk['Ws-1'], self.wk['Ws-1'])
+
+            def row_filter(row):
+                return row[1] != 3
+            wk = io.read(filename, columns=['Id', 'Val-1'], row_filter=row_filter)
+            self.assertEqual(wk['Ws-2'], Worksheet([Row(['Id', 'Val-1']), Row(['a2', 1]), Row(['c2', 5])]))
+
+            wk = io.read(filename, row_filter=row_filter, cache=True)
+            self.assertEqual(wk['Ws-2'], Worksheet([self.wk['Ws-2'][i_row] for i_row in [0, 1, 3]]))
+            wk = io.read(filename, columns=['Id', 'Val-1'], row_filter=row_filter, cache=True, columnar=True)
+            self.assertIsInstance(wk['Ws-2'], ColumnarWorksheet)
+            self.assertEqual(wk['Ws-2'].to_worksheet(), Worksheet([Row(['Id', 'Val-1']), Row(['a2', 1]), Row(['c2', 5])]))
+
+            with io.read(filename, lazy=True, columns=['Val-1']) as wk:
+                self.assertEqual(wk['Ws-1'], Worksheet([Row([row[1]]) for row in self.wk['Ws-1']]))
+
+            with self.assertRaisesRegex(ValueError, 'does not have column "Val-4"'):
+                io.read(filename, columns=['Val-4'])
+            with self.assertRaisesRegex(ValueError, 'must be non-negative'):
+                io.read(filename, columns=[-1])
+
+        filename = path.join(self.tempdir, 'test-*.csv')
+        wk = io.SeparatedValuesReader(filename, use_pyexcel=True).run(columns=['Val-2', 0])
+        self.assertEqual(wk['Ws-1'], Worksheet([Row([row[2], row[0]]) for row in self.wk['Ws-1']]))
+
+        wk = io.read(filename, max_workers=2, columns=['Val-2', 0])
+        self.assertEqual(wk['Ws-1'], Worksheet([Row([row[2], row[0]]) for row in self.wk['Ws-1']]))
+
+    def test_read_merged_cells_columns(self):
+        wb = Workbook()
+        wb['Ws-0'] = Worksheet([
+            Row(['Id', 'Val-1', 'Val-2', 'Val-3']),
+            Row(['a', 'Vals 1-2', 'Vals 1-2', 1]),
+            Row(['b', 'Vals 1-2', 'Vals 1-2', 2]),
+        ])
+        style = io.WorkbookStyle()
+        style['Ws-0'] = io.WorksheetStyle(merge_ranges=[(1, 1, 2, 2)])
+
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.write(filename, wb, style=style)
+        for read_only in [False, True]:
+            wb_2 = io.ExcelReader(filename, read_only=read_only).run(columns=['Val-2', 'Id'])
+            self.assertEqual(wb_2['Ws-0'], Worksheet([
+                Row(['Val-2', 'Id']),
+                Row(['Vals 1-2', 'a']),
+                Row(['Vals 1-2', 'b']),
+            ]))
+
+    def test_read_incrementally(self):
+        for filename in ['test.xlsx', 'test-*.csv']:
+            filename = path.join(self.tempdir, filename)
+            io.write(filename, self.wk, style=self.style)
+
+            reader = io.IncrementalReader(filename)
+            wk = reader.run()
+            self.assertEqual(wk, self.wk)
+            sheets = dict(wk)
+
+            # unchanged files aren't read again
+            self.assertIs(reader.run(), wk)
+            for name, ws in sheets.items():
+                self.assertIs(wk[name], ws)
+
+            # only changed worksheets are read again
+            wk_2 = deepcopy(self.wk)
+            wk_2['Ws-1'][3][1] = 7
+            io.write(filename, wk_2, style=self.style)
+            self.assertIs(reader.run(), wk)
+            self.assertEqual(wk, wk_2)
+            self.assertEqual(list(wk.keys()), ['Ws-0', 'Ws-1', 'Ws-2'])
+            self.assertIs(wk['Ws-0'], sheets['Ws-0'])
+            self.assertIsNot(wk['Ws-1'], sheets['Ws-1'])
+            self.assertIs(wk['Ws-2'], sheets['Ws-2'])
+
+            # worksheets aren't read again when only the strings of other worksheets change
+            sheets = dict(wk)
+            wk_2['Ws-1'][1][0] = 'new string'
+            io.write(filename, wk_2, style=self.style)
+            self.assertIs(reader.run(), wk)
+            self.assertEqual(wk, wk_2)
+            self.assertIs(wk['Ws-0'], sheets['Ws-0'])
+            self.assertIsNot(wk['Ws-1'], sheets['Ws-1'])
+
+        # added and removed files
+        os.remove(filename.replace('*', 'Ws-0'))
+        io.write(filename.replace('*', 'Ws-3'), Workbook({'': self.wk['Ws-0']}))
+        self.assertIs(reader.run(), wk)
+        self.assertEqual(list(wk.keys()), ['Ws-1', 'Ws-2', 'Ws-3'])
+        self.assertEqual(wk['Ws-3'], self.wk['Ws-0'])
+        self.assertIs(wk['Ws-2'], sheets['Ws-2'])
+
+        # digests of Excel worksheets don't depend on the mode of the reader
+        filename = path.join(self.tempdir, 'test.xlsx')
+        with io.ExcelReader(filename) as reader:
+            digests = reader.get_sheet_digests(['Ws-0', 'Ws-1'])
+        with io.ExcelReader(filename, read_only=True) as reader:
+            self.assertEqual(reader.get_sheet_digests(['Ws-0', 'Ws-1']), digests)
+        self.assertNotEqual(digests['Ws-0'], digests['Ws-1'])
+
+    def test_excel_sheet_digests_styles(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+
+        # the digests reflect the number formats of the cells, which determine whether their values are dates
+        xls_workbook = xlsxwriter.Workbook(filename)
+        for sheet_name in ['Ws-0', 'Ws-1']:
+            xls_workbook.add_worksheet(sheet_name).write_number(0, 0, 1)
+        xls_workbook.close()
+        with io.ExcelReader(filename) as reader:
+            digests = reader.get_sheet_digests(['Ws-0', 'Ws-1'])
+
+        xls_workbook = xlsxwriter.Workbook(filename)
+        xls_workbook.add_worksheet('Ws-0').write_number(0, 0, 1)
+        xls_workbook.add_worksheet('Ws-1').write_number(0, 0, 1, xls_workbook.add_format({'num_format': 'yyyy-mm-dd'}))
+        xls_workbook.close()
+        with io.ExcelReader(filename) as reader:
+            digests_2 = reader.get_sheet_digests(['Ws-0', 'Ws-1'])
+        self.assertEqual(digests_2['Ws-0'], digests['Ws-0'])
+        self.assertNotEqual(digests_2['Ws-1'], digests['Ws-1'])
+
+    def test_read_concurrently(self):
+        filename = path.join(self.tempdir, 'test-*.tsv')
+        io.write(filename, self.wk)
+
+        wk = io.read(filename, max_workers=2)
+        self.assertEqual(wk, self.wk)
+        self.assertEqual(list(wk.keys()), ['Ws-0', 'Ws-1', 'Ws-2'])
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            wk = io.read(filename, executor=executor)
+        self.assertEqual(wk, self.wk)
+        self.assertEqual(list(wk.keys()), ['Ws-0', 'Ws-1', 'Ws-2'])
+
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.write(filename, self.wk, style=self.style)
+        wk = io.ExcelReader(filename, read_only=True).run(max_workers=2)
+        self.assertEqual(wk, self.wk)
+        self.assertEqual(list(wk.keys()), ['Ws-0', 'Ws-1', 'Ws-2'])
+
+    def test_write_concurrently(self):
+        filename = path.join(self.tempdir, 'test-*.csv')
+        io.write(filename, self.wk, max_workers=2)
+        self.assertEqual(io.read(filename), self.wk)
+
+        filename = path.join(self.tempdir, 'test-2-*.tsv')
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            io.SeparatedValuesWriter(filename, use_pyexcel=True).run(self.wk, executor=executor)
+        self.assertEqual(io.read(filename), self.wk)
+
+        with self.assertRaisesRegex(ValueError, 'must have a glob pattern'):
+            io.write(path.join(self.tempdir, 'test.csv'), self.wk, max_workers=2)
+
+        # errors are raised from the workers
+        wk = deepcopy(self.wk)
+        wk['Ws-1'].append(None)
+        with self.assertRaises(TypeError):
+            io.write(path.join(self.tempdir, 'test-3-*.csv'), wk, max_workers=2)
+
+        # the worksheets of Excel files are written sequentially
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.write(filename, self.wk, style=self.style, max_workers=2)
+        self.assertEqual(io.read(filename), self.wk)
+
+    def test_read_concurrently_error(self):
+        filename = path.join(self.tempdir, 'test-*.csv')
+        io.write(filename, self.wk)
+        with open(path.join(self.tempdir, 'test-Ws-3.csv'), 'wb') as file:
+            file.write(b'\xff\xfe\x00')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(UnicodeDecodeError):
+                io.read(filename, executor=executor)
+
+    def test_iter_rows(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.write(filename, self.wk, style=self.style)
+        rows = io.iter_rows(filename, 'Ws-0')
+        self.assertEqual(next(rows)[0:4], self.wk['Ws-0'][0])
+        self.assertEqual(Worksheet(row[0:4] for row in rows), self.wk['Ws-0'][1:])
+
+        for ext in ['csv', 'tsv']:
+            filename = path.join(self.tempdir, 'test-*.' + ext)
+            io.write(filename, self.wk)
+            self.assertEqual(Worksheet(io.iter_rows(filename, 'Ws-1')), self.wk['Ws-1'])
+
+        filename = path.join(self.tempdir, 'test.csv')
+        io.write(filename, Workbook({'': self.wk['Ws-2']}))
+        self.assertEqual(Worksheet(io.iter_rows(filename, '')), self.wk['Ws-2'])
+
+    def test_iter_rows_empty_final_rows(self):
+        wk = Workbook()
+        ws = wk['Ws'] = Worksheet()
+        ws.append(Row(['a', 'b']))
+        ws.append(Row([None, None]))
+        ws.append(Row(['c', None]))
+        ws.append(Row([None, None]))
+        ws.append(Row([None, None]))
+
+        filename = path.join(self.tempdir, 'test-*.csv')
+        io.write(filename, wk)
+        self.assertEqual(Worksheet(io.iter_rows(filename, 'Ws')), ws[0:3])
+        self.assertEqual(Worksheet(io.iter_rows(filename, 'Ws', ignore_empty_final_rows=False)), ws)
+
+    def test_iter_rows_merged_cells(self):
+        wb = Workbook()
+        ws = wb['Ws-0'] = Worksheet()
+        ws.append(Row([None, 'Vals', 'Vals', 'Vals']))
+        ws.append(Row([None, 'Vals 1-2', 'Vals 1-2', None]))
+        ws.append(Row([None, 'Vals 1-2', 'Vals 1-2', None]))
+        ws.append(Row(['Id', 'Val-1', 'Val-2', 'Val-3']))
+
+        style = io.WorkbookStyle()
+        style['Ws-0'] = io.WorksheetStyle(head_rows=4, merge_ranges=[(0, 1, 0, 3), (1, 1, 2, 2)],
+                                          extra_rows=0, extra_columns=0)
+
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.write(filename, wb, style=style)
+        self.assertEqual(Worksheet(io.iter_rows(filename, 'Ws-0')), ws)
+        with io.ExcelReader(filename) as reader:
+            self.assertEqual(Worksheet(reader.iter_rows('Ws-0')), ws)
+
+    def test_read_rows_default(self):
+        wk = self.wk
+
+        class WorkbookReader(io.Reader):
+            def initialize_workbook(self):
+                return Workbook()
+
+            def get_sheet_names(self):
+                return list(wk.keys())
+
+            def read_worksheet(self, sheet_name, ignore_empty_final_rows=True, ignore_empty_final_cols=True,
+                               columns=None, row_filter=None):
+                return deepcopy(wk[sheet_name])
+
+        reader = WorkbookReader('')
+        self.assertEqual(Worksheet(reader.read_rows('Ws-0')), wk['Ws-0'])
+        self.assertEqual(Worksheet(reader.read_rows('Ws-0', columns=['Val-2', 0])),
+                         Worksheet(Row([row[2], row[0]]) for row in wk['Ws-0']))
+        self.assertEqual(Worksheet(reader.iter_rows('Ws-1')), wk['Ws-1'])
+
+    def test_reader_context_manager(self):
+        filename = path.join(self.tempdir, 'test.xlsx')
+        io.write(filename, self.wk, style=self.style)
+
+        with io.ExcelReader(filename, read_only=True) as reader:
+            self.assertEqual(reader.get_sheet_names(), ['Ws-0', 'Ws-1', 'Ws-2'])
+            self.assertEqual(Worksheet(row[0:3] for row in reader.iter_rows('Ws-2')), self.wk['Ws-2'])
+            self.assertEqual(reader.read_worksheet('Ws-1'), self.wk['Ws-1'])
+        self.assertEqual(reader.xls_workbook._archive.fp, None)
+
+        filename = path.join(self.tempdir, 'test-*.csv')
+        io.write(filename, self.wk)
+        with io.SeparatedValuesReader(filename) as reader:
+            self.assertEqual(reader.get_sheet_names(), ['Ws-0', 'Ws-1', 'Ws-2'])
+            self.assertEqual(Worksheet(reader.iter_rows('Ws-2')), self.wk['Ws-2'])
+
     def test_convert(self):
         source = path.join(self.tempdir, 'test.xlsx')
         io.ExcelWriter(source).run(self.wk, style=self.style)
@@ -815,6 +1514,29 @@ class TestIo(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, ' missing worksheets:'):
             io.convert(source, dest, worksheet_order=['Ws-3'], ignore_extra_sheets=False)
 
+    def test_convert_concurrently(self):
+        source = path.join(self.tempdir, 'test.xlsx')
+        io.ExcelWriter(source).run(self.wk, style=self.style)
+
+        dest = path.join(self.tempdir, 'test-*.tsv')
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            io.convert(source, dest, worksheet_order=['Ws-2', 'Ws-3'], executor=executor)
+        self.assertEqual(io.read(dest), self.wk)
+
+        dest = path.join(self.tempdir, 'test-2-*.csv')
+        io.convert(source, dest, max_workers=2)
+        self.assertEqual(io.read(dest), self.wk)
+
+        # worksheets of Excel files are converted one at a time
+        dest_2 = path.join(self.tempdir, 'test-2.xlsx')
+        io.convert(dest, dest_2, worksheet_order=['Ws-2', 'Ws-0'], style=self.style, max_workers=2)
+        wk = io.read(dest_2)
+        self.assertEqual(wk, self.wk)
+        self.assertEqual(list(wk.keys()), ['Ws-2', 'Ws-0', 'Ws-1'])
+
+        with self.assertRaisesRegex(ValueError, "must have a glob pattern"):
+            io.convert(source, path.join(self.tempdir, 'test.csv'))
+
     def test_convert_exceptions(self):
         source = path.join(self.tempdir, 'test.xlsx')
         io.ExcelWriter(source).run(self.wk, style=self.style)
@@ -0,0 +1,209 @@
+""" Benchmarks of the workbook IO utilities
+
+:Author: agent <agent@local>
+:Date: 2026-10-16
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from shutil import rmtree
+from tempfile import mkdtemp
+from wc_utils.workbook import io
+from wc_utils.workbook.core import Workbook, Worksheet, Row
+import openpyxl
+import os
+import time
+import unittest
+
+
+class CountingExcelReader(io.ExcelReader):
+    """ Excel reader which counts the number of cells that it reads """
+
+    def __init__(self, *args, **kwargs):
+        super(CountingExcelReader, self).__init__(*args, **kwargs)
+        self.n_cell_reads = 0
+
+    def get_cell_value(self, *args, **kwargs):
+        self.n_cell_reads += 1
+        return super(CountingExcelReader, self).get_cell_value(*args, **kwargs)
+
+
+class CountingSeparatedValuesReader(io.SeparatedValuesReader):
+    """ Separated values reader which counts the number of cells that it reads """
+
+    def __init__(self, *args, **kwargs):
+        super(CountingSeparatedValuesReader, self).__init__(*args, **kwargs)
+        self.n_cell_reads = 0
+
+    def read_cell(self, *args, **kwargs):
+        self.n_cell_reads += 1
+        return super(CountingSeparatedValuesReader, self).read_cell(*args, **kwargs)
+
+
+class CellReadsBenchmarkTestCase(unittest.TestCase):
+    """ Each cell of a wide sheet with a sparse tail should be read exactly once, including the cells of the final
+    non-empty row and column which used to be read again to determine the extent of the sheet
+    """
+
+    N_ROWS = 200
+    N_COLS = 40
+    N_DATA_COLS = 5
+
+    def setUp(self):
+        self.tempdir = mkdtemp()
+
+        wb = self.wb = Workbook()
+        ws = wb['Ws'] = Worksheet()
+        for i_row in range(self.N_ROWS):
+            ws.append(Row(['Cell-{}-{}'.format(i_row, i_col) for i_col in range(self.N_DATA_COLS)] +
+                          [None] * (self.N_COLS - self.N_DATA_COLS)))
+        for i_row in range(self.N_ROWS):
+            ws.append(Row([None] * self.N_COLS))
+        ws[self.N_ROWS - 1][-1] = 'Corner'
+
+    def tearDown(self):
+        rmtree(self.tempdir)
+
+    def test_excel(self):
+        filename = os.path.join(self.tempdir, 'test.xlsx')
+        io.ExcelWriter(filename).run(self.wb, style=io.WorkbookStyle({
+            'Ws': io.WorksheetStyle(extra_rows=0, extra_columns=0)}))
+
+        for read_only in [False, True]:
+            reader = CountingExcelReader(filename, read_only=read_only)
+            wb = reader.run()
+            self.assertEqual(len(wb['Ws']), self.N_ROWS)
+            self.assertEqual(len(wb['Ws'][0]), self.N_COLS)
+            self.assertEqual(reader.n_cell_reads, 2 * self.N_ROWS * self.N_COLS)
+
+    def test_separated_values(self):
+        filename = os.path.join(self.tempdir, 'test-*.csv')
+        io.SeparatedValuesWriter(filename).run(self.wb)
+
+        # the cells are converted one column at a time; only the cells from which the types of the columns are
+        # inferred are read individually
+        reader = CountingSeparatedValuesReader(filename)
+        wb = reader.run()
+        self.assertEqual(len(wb['Ws']), self.N_ROWS)
+        self.assertEqual(len(wb['Ws'][0]), self.N_COLS)
+        self.assertEqual(reader.n_cell_reads, reader.N_TYPE_INFERENCE_ROWS * self.N_DATA_COLS)
+
+        reader = CountingSeparatedValuesReader(filename)
+        with reader:
+            rows = list(reader.iter_rows('Ws'))
+        self.assertEqual(len(rows), self.N_ROWS)
+        self.assertEqual(reader.n_cell_reads, 2 * self.N_ROWS * self.N_COLS)
+
+
+class SeparatedValuesThroughputBenchmarkTestCase(unittest.TestCase):
+    """ Compare the throughput (rows/sec) of reading and writing csv files with :obj:`csv` and with :obj:`pyexcel` """
+
+    N_ROWS = 5000
+    N_COLS = 10
+
+    def setUp(self):
+        self.tempdir = mkdtemp()
+
+        wb = self.wb = Workbook()
+        ws = wb['Ws'] = Worksheet()
+        ws.append(Row(['Col-{}'.format(i_col) for i_col in range(self.N_COLS)]))
+        for i_row in range(self.N_ROWS - 1):
+            ws.append(Row(['Id-{}'.format(i_row), i_row, i_row / 7., i_row % 2 == 0, None] +
+                          ['Value-{}-{}'.format(i_row, i_col) for i_col in range(5, self.N_COLS)]))
+
+    def tearDown(self):
+        rmtree(self.tempdir)
+
+    def test_throughput(self):
+        rates = {}
+        for use_pyexcel in [False, True]:
+            filename = os.path.join(self.tempdir, 'test-{}-*.csv'.format(use_pyexcel))
+
+            io.SeparatedValuesWriter(filename, use_pyexcel=use_pyexcel).run(self.wb)
+
+            start = time.time()
+            wb = io.SeparatedValuesReader(filename, use_pyexcel=use_pyexcel).run()
+            read_rate = self.N_ROWS / max(time.time() - start, 1e-6)
+
+            self.assertEqual(wb, self.wb)
+            rates[use_pyexcel] = read_rate
+
+        self.assertGreater(rates[False], rates[True])
+
+    def test_column_conversion_throughput(self):
+        filename = os.path.join(self.tempdir, 'test-*.csv')
+        io.SeparatedValuesWriter(filename).run(self.wb)
+        reader = io.SeparatedValuesReader(filename)
+
+        with reader:
+            ws_by_cell = reader.build_worksheet(reader.read_rows('Ws'))
+        ws_by_column = reader.read_worksheet('Ws')
+
+        self.assertEqual(ws_by_column, ws_by_cell)
+
+
+class ExcelExtraRowsColumnsBenchmarkTestCase(unittest.TestCase):
+    """ Compare the size of Excel files whose extra rows and columns are formatted by row and column
+    formats with those of equivalent files whose extra rows and columns are padded with blank cells, both when the
+    rows beyond the extra rows are hidden and when all rows are shown (the default)
+
+    The sheet is smaller than the 50,000 x 60 sheets with 1,000 extra rows that motivated this benchmark so that it can run
+    with the other tests.
+    """
+
+    N_ROWS = 2000
+    N_COLS = 60
+    EXTRA_ROWS = 1000
+    EXTRA_COLUMNS = 10
+
+    def setUp(self):
+        self.tempdir = mkdtemp()
+
+        wb = self.wb = Workbook()
+        ws = wb['Ws'] = Worksheet()
+        ws.append(Row(['Col-{}'.format(i_col) for i_col in range(self.N_COLS)]))
+        for i_row in range(self.N_ROWS - 1):
+            ws.append(Row([i_row * self.N_COLS + i_col for i_col in range(self.N_COLS)]))
+
+        # equivalent workbook padded with blank cells
+        padded_wb = self.padded_wb = Workbook()
+        padded_ws = padded_wb['Ws'] = Worksheet()
+        for row in ws:
+            padded_ws.append(Row(row + [None] * self.EXTRA_COLUMNS))
+        for i_row in range(self.EXTRA_ROWS):
+            padded_ws.append(Row([None] * (self.N_COLS + self.EXTRA_COLUMNS)))
+
+    def tearDown(self):
+        rmtree(self.tempdir)
+
+    def test_size(self):
+        filename = os.path.join(self.tempdir, 'test.xlsx')
+        io.ExcelWriter(filename).run(self.wb, style=io.WorkbookStyle({
+            'Ws': io.WorksheetStyle(head_rows=1, extra_rows=self.EXTRA_ROWS, extra_columns=self.EXTRA_COLUMNS)}))
+        size = os.path.getsize(filename)
+
+        padded_filename = os.path.join(self.tempdir, 'test-padded.xlsx')
+        io.ExcelWriter(padded_filename).run(self.padded_wb, style=io.WorkbookStyle({
+            'Ws': io.WorksheetStyle(head_rows=1, extra_rows=0, extra_columns=0)}))
+        padded_size = os.path.getsize(padded_filename)
+
+        self.assertLess(size, padded_size)
+        self.assertEqual(io.ExcelReader(filename).run(), self.wb)
+
+    def test_size_all_rows_shown(self):
+        filename = os.path.join(self.tempdir, 'test.xlsx')
+        io.ExcelWriter(filename).run(self.wb, style=io.WorkbookStyle({
+            'Ws': io.WorksheetStyle(head_rows=1, extra_columns=self.EXTRA_COLUMNS)}))
+        size = os.path.getsize(filename)
+
+        padded_wb = Workbook()
+        padded_wb['Ws'] = Worksheet(self.padded_wb['Ws'][0:self.N_ROWS])
+        padded_filename = os.path.join(self.tempdir, 'test-padded.xlsx')
+        io.ExcelWriter(padded_filename).run(padded_wb, style=io.WorkbookStyle({
+            'Ws': io.WorksheetStyle(head_rows=1, extra_columns=0)}))
+        padded_size = os.path.getsize(padded_filename)
+
+        # the extra cells aren't written
+        self.assertLess(size, padded_size)
+        self.assertEqual(openpyxl.load_workbook(filename)['Ws'].max_column, self.N_COLS)
+        self.assertEqual(io.ExcelReader(filename).run(), self.wb)
@@ -6,32 +6,569 @@
 :License: MIT
 """
 
+import atexit
+import collections
+import concurrent.futures
 import diskcache
 import functools
 import glob
 import hashlib
 import inspect
+import mmap
 import os
+import pickle
+import queue
+import threading
+import time
 import types
 
 
+class MemoryCache(object):
+    """ In-process, least-recently-used cache of values
+
+    The cache holds references to values rather than copies, e.g., so that large NumPy arrays are not copied. Callers
+    therefore shouldn't modify cached values.
+
+    Attributes:
+        max_size (:obj:`int`): maximum number of values
+        _items (:obj:`collections.OrderedDict`): dictionary which maps each key to a tuple of its value and its
+            expiration time, ordered from the least to the most recently used key
+        _lock (:obj:`threading.Lock`): lock
+    """
+
+    def __init__(self, max_size):
+        """
+        Args:
+            max_size (:obj:`int`): maximum number of values
+        """
+        self.max_size = max_size
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """ Get the value of a key
+
+        Args:
+            key (:obj:`object`): key
+            default (:obj:`object`, optional): value to return if the key isn't cached or has expired
+
+        Returns:
+            :obj:`object`: value
+        """
+        with self._lock:
+            item = self._items.get(key, None)
+            if item is None:
+                return default
+
+            value, expire_time = item
+            if expire_time is not None and expire_time <= time.time():
+                del self._items[key]
+                return default
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, expire_time=None):
+        """ Set the value of a key, and evict the least recently used keys if the cache is full
+
+        Args:
+            key (:obj:`object`): key
+            value (:obj:`object`): value
+            expire_time (:obj:`float`, optional): time when the value expires
+        """
+        with self._lock:
+            self._items[key] = (value, expire_time)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key):
+        """ Remove the value of a key
+
+        Args:
+            key (:obj:`object`): key
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the key was cached
+        """
+        with self._lock:
+            return self._items.pop(key, None) is not None
+
+    def expire(self):
+        """ Remove the expired values
+
+        Returns:
+            :obj:`int`: number of values removed
+        """
+        now = time.time()
+        with self._lock:
+            keys = [key for key, (_, expire_time) in self._items.items()
+                    if expire_time is not None and expire_time <= now]
+            for key in keys:
+                del self._items[key]
+        return len(keys)
+
+    def clear(self):
+        """ Remove all values """
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        """ Get the number of cached values
+
+        Returns:
+            :obj:`int`: number of cached values
+        """
+        return len(self._items)
+
+
+class PickledValue(object):
+    """ Value which has already been pickled
+
+    Pickling a pickled value copies its pickle into the outer pickle rather than pickling the value again, and
+    unpickling the outer pickle returns the original value. This enables a value which has been pickled once to be
+    written to a :obj:`diskcache.Cache` without being pickled a second time.
+
+    Attributes:
+        pickle (:obj:`bytes`): pickle of the value
+        _value (:obj:`object`): unpickled copy of the value, or :obj:`diskcache.core.ENOVAL` if the pickle hasn't
+            been unpickled
+    """
+
+    __slots__ = ('pickle', '_value')
+
+    def __init__(self, value):
+        """
+        Args:
+            value (:obj:`object`): value
+
+        Raises:
+            :obj:`Exception`: if the value can't be pickled
+        """
+        self.pickle = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._value = diskcache.core.ENOVAL
+
+    def get_value(self):
+        """ Get a copy of the value; the pickle is only unpickled once
+
+        Returns:
+            :obj:`object`: copy of the value
+        """
+        value = self._value
+        if value is diskcache.core.ENOVAL:
+            value = self._value = pickle.loads(self.pickle)
+        return value
+
+    def __reduce__(self):
+        """ Pickle the value as its pickle
+
+        Returns:
+            :obj:`tuple`: function which unpickles the value and its arguments
+        """
+        return (pickle.loads, (self.pickle,))
+
+
+class BackgroundWriter(object):
+    """ Writer which writes values to a cache on a background thread
+
+    Values are pickled when they are queued so that later modifications of the values by callers aren't written. The
+    pickles are written to the cache as they are, without pickling the values again. Values are queued until they
+    are written. Until then, they can be read from the writer; each queued pickle is unpickled at most once, and
+    reads return the same copy, which callers therefore shouldn't modify. Values are written when the writer is
+    flushed, e.g., when the interpreter exits.
+
+    Errors which occur while writing values are deferred until the writer is flushed or closed.
+
+    Attributes:
+        cache (:obj:`diskcache.FanoutCache`): cache
+        max_size (:obj:`int`): maximum number of queued values; writers wait for space in the queue
+        _queue (:obj:`queue.Queue`): queue of values to write
+        _pending (:obj:`dict`): dictionary which maps the in-memory key of each queued value to a tuple of its key,
+            :obj:`PickledValue`, seconds until it expires, tag and expiration time; values which are no longer pending
+            (e.g., because they were discarded) aren't written
+        _errors (:obj:`list` of :obj:`Exception`): errors which occurred while writing values
+        _lock (:obj:`threading.Lock`): lock
+        _write_lock (:obj:`threading.Lock`): lock which is held while a value is written
+        _thread (:obj:`threading.Thread`): thread which writes the values, or :obj:`None` if the thread isn't
+            running
+    """
+
+    def __init__(self, cache, max_size):
+        """
+        Args:
+            cache (:obj:`diskcache.FanoutCache`): cache
+            max_size (:obj:`int`): maximum number of queued values
+        """
+        self.cache = cache
+        self.max_size = max_size
+        self._queue = queue.Queue(max_size)
+        self._pending = {}
+        self._errors = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._thread = None
+
+    def get(self, memory_key, default=None):
+        """ Get a queued value
+
+        Args:
+            memory_key (:obj:`bytes`): in-memory key of the value
+            default (:obj:`object`, optional): value to return if the key isn't queued or has expired
+
+        Returns:
+            :obj:`object`: copy of the value
+        """
+        with self._lock:
+            item = self._pending.get(memory_key, None)
+        if item is None:
+            return default
+
+        expire_time = item[4]
+        if expire_time is not None and expire_time <= time.time():
+            return default
+        return item[1].get_value()
+
+    def set(self, key, memory_key, value, expire=None, tag=None):
+        """ Queue a value to be written
+
+        Args:
+            key (:obj:`object`): key
+            memory_key (:obj:`bytes`): in-memory key of the value
+            value (:obj:`object`): value
+            expire (:obj:`float`, optional): seconds until the value expires
+            tag (:obj:`str`, optional): text to associate with the value
+
+        Raises:
+            :obj:`Exception`: if the value can't be pickled
+        """
+        expire_time = None if expire is None else time.time() + expire
+        item = (key, PickledValue(value), expire, tag, expire_time)
+        with self._lock:
+            self._pending[memory_key] = item
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+        self._queue.put((memory_key, item))
+
+    def wait(self):
+        """ Wait until all queued values have been written, deferring any errors until the next flush """
+        self._queue.join()
+
+    def flush(self):
+        """ Wait until all queued values have been written
+
+        Raises:
+            :obj:`Exception`: the first error which occurred while writing values since the last flush
+        """
+        self.wait()
+        with self._lock:
+            errors = self._errors
+            self._errors = []
+        if errors:
+            raise errors[0]
+
+    def discard(self):
+        """ Discard the queued values which haven't been written, and the errors which occurred while writing values
+        since the last flush
+
+        Waits until the value which is being written, if any, has been written.
+        """
+        with self._write_lock:
+            with self._lock:
+                self._pending.clear()
+                self._errors = []
+
+    def close(self):
+        """ Write all queued values and stop the background thread
+
+        Raises:
+            :obj:`Exception`: the first error which occurred while writing values since the last flush
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        atexit.unregister(self.flush)
+        self._queue.put(None)
+        thread.join()
+        self.flush()
+
+    def _run(self):
+        """ Write queued values until the writer is closed """
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                self._queue.task_done()
+                return
+
+            memory_key, item = entry
+            key, pickled_value, expire, tag, _ = item
+            try:
+                with self._write_lock:
+                    with self._lock:
+                        is_pending = self._pending.get(memory_key, None) is item
+                    if is_pending:
+                        try:
+                            self.cache.set(key, pickled_value, expire=expire, tag=tag, retry=True)
+                        except Exception as error:
+                            with self._lock:
+                                self._errors.append(error)
+                        finally:
+                            with self._lock:
+                                if self._pending.get(memory_key, None) is item:
+                                    del self._pending[memory_key]
+            finally:
+                self._queue.task_done()
+
+
+class MemoizeStatistics(object):
+    """ Numbers of hits and misses of a memoized function
+
+    Attributes:
+        memory_hits (:obj:`int`): number of calls whose values were found in memory, including values which are
+            queued to be written to disk
+        disk_hits (:obj:`int`): number of calls whose values were found on disk
+        misses (:obj:`int`): number of calls whose values had to be computed
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """ Reset the counters """
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+
 class Cache(diskcache.FanoutCache):
     """ Cache that shards keys (including the file content of keys that represent file names) and values 
 
+    The hashes of the content of file arguments are indexed by the paths of the files, together with their inodes,
+    sizes and modification times, so that files are only re-hashed when they change. The index holds one hash per
+    path, and is persisted in the cache directory so that it is shared across processes.
+
+    The content of files is hashed with a configurable algorithm, e.g., SHA-1 (default), BLAKE2b or, if the optional
+    :obj:`xxhash` package is installed, xxHash. Optionally, large files are divided into chunks which are hashed
+    concurrently and combined into a tree hash.
+
+    Optionally, the values of memoized functions are also cached in memory. Values are written through to disk,
+    and values read from disk are cached in memory until they expire. Values which are removed from disk (e.g., by
+    :obj:`delete`, :obj:`pop`, :obj:`evict`, :obj:`expire`, :obj:`cull` or :obj:`clear`) are also removed from
+    memory.
+
+    Optionally, the values of memoized functions are written to disk on a background thread so that callers don't
+    wait for the values to be committed. The values are pickled before they are queued so that the written values
+    are the values returned by the functions, even if callers later modify them. Until the values are written,
+    they are visible to the memoized functions of the same process. :obj:`flush` waits until all values are
+    written, and is called when the interpreter exits. Values are removed (e.g., by :obj:`delete`) after the queued
+    values are written, whereas :obj:`clear` discards the queued values.
+
     Attributes:
         hash_block_size (:obj:`int`): block size to use for hashing the content of file arguments
+        hash_algorithm (:obj:`str`): name of the algorithm to use for hashing the content of file arguments, e.g.,
+            :obj:`sha1`, the name of another algorithm of :obj:`hashlib` such as :obj:`blake2b`, or the name of an
+            algorithm of :obj:`xxhash` such as :obj:`xxh3_64`
+        hash_chunk_size (:obj:`int`): if positive, files larger than this size are divided into chunks of this
+            size which are hashed concurrently and combined into a tree hash
+        hash_max_workers (:obj:`int`): maximum number of threads to use to hash the chunks of a file
+        fingerprints (:obj:`diskcache.Cache`): index of the hashes of the content of files; maps the path of each
+            file and the hashing settings to a tuple of the inode, size and modification time of the file and the
+            hash of its content
+        memory (:obj:`MemoryCache`): in-process cache of the values of memoized functions, or :obj:`None` if
+            values are only cached on disk
+        writer (:obj:`BackgroundWriter`): background writer of the values of memoized functions, or :obj:`None`
+            if values are written synchronously
     """
 
     DEFAULT_DIRECTORY = os.path.expanduser('~/.wc/cache/')
 
-    def __init__(self, directory=DEFAULT_DIRECTORY, hash_block_size=65536, **kwargs):
+    def __init__(self, directory=DEFAULT_DIRECTORY, hash_block_size=65536, hash_algorithm='sha1', hash_chunk_size=0,
+                 hash_max_workers=None, memory_size=0, write_queue_size=0, **kwargs):
         """
         Args:
             directory (:obj:`str`, optional): cache directory
+            hash_block_size (:obj:`int`, optional): block size to use for hashing the content of file arguments
+            hash_algorithm (:obj:`str`, optional): name of the algorithm to use for hashing the content of file
+                arguments
+            hash_chunk_size (:obj:`int`, optional): if positive, files larger than this size are divided into
+                chunks of this size which are hashed concurrently and combined into a tree hash
+            hash_max_workers (:obj:`int`, optional): maximum number of threads to use to hash the chunks of a file;
+                if :obj:`None`, the default number of workers of :obj:`concurrent.futures.ThreadPoolExecutor`
+            memory_size (:obj:`int`, optional): maximum number of values of memoized functions to cache in memory;
+                if 0, values are only cached on disk
+            write_queue_size (:obj:`int`, optional): if positive, write the values of memoized functions on a
+                background thread, queueing at most this number of values; if 0, write values synchronously. Errors
+                which occur while values are written on the background thread are deferred: they are raised by the
+                next call to :obj:`flush` or :obj:`close`, and are discarded by :obj:`clear`.
             kwargs (:obj:`dict`, optional): arguments to :obj:`diskcache.FanoutCache`
         """
-        super(Cache, self).__init__(directory, **kwargs)
         self.hash_block_size = hash_block_size
+        self.hash_algorithm = hash_algorithm
+        self.hash_chunk_size = hash_chunk_size
+        self.hash_max_workers = hash_max_workers
+        self._new_hasher()
+        super(Cache, self).__init__(directory, **kwargs)
+        self.fingerprints = self.cache('fingerprints')
+        self.memory = MemoryCache(memory_size) if memory_size else None
+        self.writer = BackgroundWriter(self, write_queue_size) if write_queue_size else None
+
+    def flush(self):
+        """ Wait until the values of memoized functions which are written on a background thread are written
+
+        Raises:
+            :obj:`Exception`: the first error which occurred while writing values since the last flush
+        """
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        """ Write the queued values of memoized functions, and close the cache """
+        if self.writer is not None:
+            self.writer.close()
+        super(Cache, self).close()
+
+    def clear(self, *args, **kwargs):
+        """ Remove all values from the cache, including the values cached in memory and the index of the hashes of
+        the content of files, and discard the values which are queued to be written and any deferred errors which
+        occurred while writing values
+
+        Args:
+            args (:obj:`list`, optional): positional arguments to :obj:`diskcache.FanoutCache.clear`
+            kwargs (:obj:`dict`, optional): keyword arguments to :obj:`diskcache.FanoutCache.clear`
+
+        Returns:
+            :obj:`int`: number of values removed from disk
+        """
+        if self.writer is not None:
+            self.writer.discard()
+        if self.memory is not None:
+            self.memory.clear()
+        self.fingerprints.clear(*args, **kwargs)
+        return super(Cache, self).clear(*args, **kwargs)
+
+    def delete(self, key, retry=False):
+        """ Remove the value of a key from the cache, including from memory
+
+        Args:
+            key (:obj:`object`): key
+            retry (:obj:`bool`, optional): if :obj:`True`, retry if a database timeout occurs
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the key was removed from disk
+        """
+        self._wait_for_writes()
+        deleted = super(Cache, self).delete(key, retry=retry)
+        self._delete_from_memory(key)
+        return deleted
+
+    def __delitem__(self, key):
+        """ Remove the value of a key from the cache, including from memory
+
+        Args:
+            key (:obj:`object`): key
+
+        Raises:
+            :obj:`KeyError`: if the key isn't cached on disk
+        """
+        self._wait_for_writes()
+        try:
+            super(Cache, self).__delitem__(key)
+        finally:
+            self._delete_from_memory(key)
+
+    def pop(self, key, default=None, expire_time=False, tag=False, retry=False):
+        """ Remove the value of a key from the cache, including from memory, and return the value
+
+        Args:
+            key (:obj:`object`): key
+            default (:obj:`object`, optional): value to return if the key isn't cached on disk
+            expire_time (:obj:`bool`, optional): if :obj:`True`, also return the expiration time of the value
+            tag (:obj:`bool`, optional): if :obj:`True`, also return the tag of the value
+            retry (:obj:`bool`, optional): if :obj:`True`, retry if a database timeout occurs
+
+        Returns:
+            :obj:`object`: value, or a tuple of the value and its expiration time and/or tag
+        """
+        self._wait_for_writes()
+        result = super(Cache, self).pop(key, default=default, expire_time=expire_time, tag=tag, retry=retry)
+        self._delete_from_memory(key)
+        return result
+
+    def evict(self, tag, retry=False):
+        """ Remove the values with a tag from the cache, and all values from memory, which doesn't track tags
+
+        Args:
+            tag (:obj:`str`): tag
+            retry (:obj:`bool`, optional): if :obj:`True`, retry if a database timeout occurs
+
+        Returns:
+            :obj:`int`: number of values removed from disk
+        """
+        self._wait_for_writes()
+        count = super(Cache, self).evict(tag, retry=retry)
+        if self.memory is not None:
+            self.memory.clear()
+        return count
+
+    def expire(self, retry=False):
+        """ Remove the expired values from the cache, including from memory
+
+        Args:
+            retry (:obj:`bool`, optional): if :obj:`True`, retry if a database timeout occurs
+
+        Returns:
+            :obj:`int`: number of values removed from disk
+        """
+        self._wait_for_writes()
+        count = super(Cache, self).expire(retry=retry)
+        if self.memory is not None:
+            self.memory.expire()
+        return count
+
+    def cull(self, retry=False):
+        """ Remove the expired values from the cache and evict values until the cache is within its size limit,
+        and remove all values from memory, which doesn't track which values were evicted from disk
+
+        Args:
+            retry (:obj:`bool`, optional): if :obj:`True`, retry if a database timeout occurs
+
+        Returns:
+            :obj:`int`: number of values removed from disk
+        """
+        self._wait_for_writes()
+        count = super(Cache, self).cull(retry=retry)
+        if self.memory is not None:
+            self.memory.clear()
+        return count
+
+    def _wait_for_writes(self):
+        """ Wait until the values which are queued to be written have been written, so that they can be removed """
+        if self.writer is not None:
+            self.writer.wait()
+
+    def _delete_from_memory(self, key):
+        """ Remove the value of a key from memory
+
+        Args:
+            key (:obj:`object`): key
+        """
+        if self.memory is not None:
+            self.memory.delete(self._get_memory_key(key))
+
+    @staticmethod
+    def _get_memory_key(key):
+        """ Get the key of a value in memory
+
+        Args:
+            key (:obj:`object`): key
+
+        Returns:
+            :obj:`bytes`: in-memory key
+        """
+        return pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
 
     def memoize(self, name=None, typed=False, expire=None, tag=None, filename_args=None, filename_kwargs=None):
         """ Memoizing cache decorator
@@ -41,11 +578,13 @@ class Cache(diskcache.FanoutCache):
             typed (:obj:`bool`, optional): cache different types separately
             expire (:obj:`float`, optional): seconds until arguments expire
             tag (:obj:`str`, optional): text to associate with arguments
-            filename_args (:obj:`list`, optional): list of indices of arguments that represent filenames
+            filename_args (:obj:`list`, optional): list of positions of positional arguments that represent filenames
             filename_kwargs (:obj:`list`, optional): list of keys of keyword arguments that represent filenames
 
         Returns:
-            :obj:`types.FunctionType`: callable decorator
+            :obj:`types.FunctionType`: callable decorator; the numbers of hits and misses of each decorated function
+                are available from its :obj:`statistics` attribute (:obj:`MemoizeStatistics`), and the key of the
+                value of each call is available from its :obj:`__cache_key__` method
         """
         if callable(name):
             raise TypeError('name cannot be callable')
@@ -68,93 +607,297 @@ class Cache(diskcache.FanoutCache):
                 reference = name
 
             reference = (reference,)
+            build_key = self._compile_key_builder(function, reference, typed)
+            statistics = MemoizeStatistics()
 
-            @functools.wraps(function)
-            def wrapper(*args, **kwargs):
-                "Wrapper for callable to cache arguments and return values."
-
-                # match arguments to function signature
-                func_signature = inspect.signature(function)
-                proc_args = []
-                proc_kwargs = {}
-                for i_param, (name, param) in enumerate(func_signature.parameters.items()):
-                    if param.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD:
-                        raise NotImplementedError('Memoize decorator only supports positional-or-keyword arguments. '
-                                                  'Submit issue to request support for optional arguments')
-
-                    if param.default is inspect._empty:
-                        if i_param < len(args):
-                            val = args[i_param]
-                        elif param.name in kwargs:
-                            val = kwargs[param.name]
-                        else:
-                            raise TypeError("{} missing required positional argument '{}'".format(function.__name__, param.name))
-                        proc_args.append(val)
-                    else:
-                        if i_param < len(args):
-                            val = args[i_param]
-                        elif param.name in kwargs:
-                            val = kwargs[param.name]
-                        else:
-                            val = param.default
-                        proc_kwargs[param.name] = val
+            def make_key(*args, **kwargs):
+                "Make key for cache given function arguments."
 
                 # generate key from arguments
-                key = reference + tuple(proc_args)
+                key, positional_vals, proc_kwargs = build_key(args, kwargs)
 
-                if proc_kwargs:
-                    key += (diskcache.core.ENOVAL,)
-                    sorted_items = sorted(proc_kwargs.items())
+                for filename_arg in filename_args:
+                    key += self._get_file_fingerprints(positional_vals[filename_arg])
 
-                    for item in sorted_items:
-                        key += item
+                for filename_kwarg in filename_kwargs:
+                    if filename_kwarg in proc_kwargs:
+                        key += self._get_file_fingerprints(proc_kwargs[filename_kwarg])
 
-                if typed:
-                    key += tuple(type(arg) for arg in proc_args)
+                return key
 
-                    if proc_kwargs:
-                        key += tuple(type(value) for _, value in sorted_items)
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                "Wrapper for callable to cache arguments and return values."
 
-                for filename_arg in filename_args:
-                    stats = []
-                    for filename in glob.glob(proc_args[filename_arg]):
-                        stats.append((os.path.getmtime(filename), self._hash_file_content(filename)))
-                    key += tuple(stats)
+                key = make_key(*args, **kwargs)
 
-                for filename_kwarg in filename_kwargs:
-                    if filename_kwarg in proc_kwargs:
-                        stats = []
-                        for filename in glob.glob(proc_kwargs[filename_kwarg]):
-                            stats.append((os.path.getmtime(filename), self._hash_file_content(filename)))
-                        key += tuple(stats)
+                memory = self.memory
+                writer = self.writer
+                if memory is not None or writer is not None:
+                    memory_key = self._get_memory_key(key)
 
-                result = self.get(key, default=diskcache.core.ENOVAL, retry=True)
+                if memory is not None:
+                    result = memory.get(memory_key, default=diskcache.core.ENOVAL)
+                    if result is not diskcache.core.ENOVAL:
+                        statistics.memory_hits += 1
+                        return result
+
+                if writer is not None:
+                    result = writer.get(memory_key, default=diskcache.core.ENOVAL)
+                    if result is not diskcache.core.ENOVAL:
+                        statistics.memory_hits += 1
+                        return result
+
+                result, expire_time = self.get(key, default=diskcache.core.ENOVAL, expire_time=True, retry=True)
 
                 if result is diskcache.core.ENOVAL:
+                    statistics.misses += 1
                     result = function(*args, **kwargs)
-                    self.set(key, result, expire=expire, tag=tag, retry=True)
+                    if writer is None:
+                        self.set(key, result, expire=expire, tag=tag, retry=True)
+                    else:
+                        writer.set(key, memory_key, result, expire=expire, tag=tag)
+                    expire_time = None if expire is None else time.time() + expire
+                else:
+                    statistics.disk_hits += 1
+
+                if memory is not None:
+                    memory.set(memory_key, result, expire_time=expire_time)
 
                 return result
 
+            wrapper.statistics = statistics
+            wrapper.__cache_key__ = make_key
+
             return wrapper
 
         return decorator
 
-    def _hash_file_content(self, path):
+    @staticmethod
+    def _compile_key_builder(function, reference, typed=False):
+        """ Analyze the signature of a function once and compile a function which matches the arguments of each
+        call to the signature and generates the key of the call
+
+        Required positional arguments, positional-only arguments and additional positional arguments
+        (:obj:`*args`) are keyed by their position. Positional arguments with defaults, keyword-only arguments and
+        additional keyword arguments (:obj:`**kwargs`) are keyed by their name.
+
+        Args:
+            function (:obj:`types.FunctionType`): function
+            reference (:obj:`tuple`): prefix of the keys, e.g., the name of the function
+            typed (:obj:`bool`, optional): if :obj:`True`, include the types of the arguments in the keys
+
+        Returns:
+            :obj:`types.FunctionType`: function which maps the positional and keyword arguments of a call to a
+                tuple of its key, the values of its positional parameters (including those with defaults) and its
+                additional positional arguments in the order of their positions, and its arguments keyed by their
+                name
+        """
+        function_name = function.__name__
+
+        positional_params = []
+        keyword_only_params = []
+        var_positional = False
+        var_keyword = False
+        for param in inspect.signature(function).parameters.values():
+            required = param.default is inspect.Parameter.empty
+            if param.kind is inspect.Parameter.POSITIONAL_ONLY:
+                positional_params.append((param.name, required, False, param.default))
+            elif param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                positional_params.append((param.name, required, True, param.default))
+            elif param.kind is inspect.Parameter.VAR_POSITIONAL:
+                var_positional = True
+            elif param.kind is inspect.Parameter.KEYWORD_ONLY:
+                keyword_only_params.append((param.name, required, param.default))
+            else:
+                var_keyword = True
+        positional_params = tuple(positional_params)
+        keyword_only_params = tuple(keyword_only_params)
+        n_positional = len(positional_params)
+        keyword_names = frozenset([name for name, _, by_keyword, _ in positional_params if by_keyword] +
+                                  [name for name, _, _ in keyword_only_params])
+
+        def build_key(args, kwargs):
+            n_args = len(args)
+            if n_args > n_positional and not var_positional:
+                raise TypeError('{} takes {} positional arguments but {} were given'.format(
+                    function_name, n_positional, n_args))
+
+            # match arguments to function signature
+            proc_args = []
+            proc_kwargs = {}
+            positional_vals = []
+            for i_param, (name, required, by_keyword, default) in enumerate(positional_params):
+                if i_param < n_args:
+                    val = args[i_param]
+                    if by_keyword and name in kwargs:
+                        raise TypeError("{} got multiple values for argument '{}'".format(function_name, name))
+                elif by_keyword and name in kwargs:
+                    val = kwargs[name]
+                elif required:
+                    raise TypeError("{} missing required positional argument '{}'".format(function_name, name))
+                else:
+                    val = default
+                positional_vals.append(val)
+                if required or not by_keyword:
+                    proc_args.append(val)
+                else:
+                    proc_kwargs[name] = val
+
+            if n_args > n_positional:
+                proc_args.extend(args[n_positional:])
+                positional_vals.extend(args[n_positional:])
+
+            for name, required, default in keyword_only_params:
+                if name in kwargs:
+                    proc_kwargs[name] = kwargs[name]
+                elif required:
+                    raise TypeError("{} missing required keyword-only argument '{}'".format(function_name, name))
+                else:
+                    proc_kwargs[name] = default
+
+            for name, val in kwargs.items():
+                if name not in keyword_names:
+                    if not var_keyword:
+                        raise TypeError("{} got an unexpected keyword argument '{}'".format(function_name, name))
+                    proc_kwargs[name] = val
+
+            # generate key from arguments
+            key = reference + tuple(proc_args)
+
+            if proc_kwargs:
+                key += (diskcache.core.ENOVAL,)
+                sorted_items = sorted(proc_kwargs.items())
+
+                for item in sorted_items:
+                    key += item
+
+            if typed:
+                key += tuple(type(arg) for arg in proc_args)
+
+                if proc_kwargs:
+                    key += tuple(type(value) for _, value in sorted_items)
+
+            return key, positional_vals, proc_kwargs
+
+        return build_key
+
+    def _get_file_fingerprints(self, pattern):
+        """ Get the modification times and hashes of the content of the files which match a glob pattern
+
+        Args:
+            pattern (:obj:`str`): glob pattern
+
+        Returns:
+            :obj:`tuple` of :obj:`tuple`: modification time and hash of the content of each file
+        """
+        fingerprints = []
+        for filename in glob.glob(pattern):
+            stat = os.stat(filename)
+            fingerprints.append((stat.st_mtime, self._hash_file_content(filename, stat=stat)))
+        return tuple(fingerprints)
+
+    def _hash_file_content(self, path, stat=None):
+        """ Hash the content of a file, reusing the hash of the file from the fingerprint index if the inode, size
+        and modification time of the file are unchanged
+
+        Args:
+            path (:obj:`str`): path to the file to hash the contents of
+            stat (:obj:`os.stat_result`, optional): status of the file
+
+        Returns:
+            :obj:`str`: hash of the content of the file
+        """
+        if stat is None:
+            stat = os.stat(path)
+        status = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        fingerprint = (os.path.abspath(path), self.hash_algorithm, self.hash_chunk_size)
+
+        # the index holds the latest hash of each path, so that it doesn't grow when files are modified
+        item = self.fingerprints.get(fingerprint, retry=True)
+        if item is not None and item[0] == status:
+            return item[1]
+
+        digest = self._hash_file(path)
+
+        # only index the hash if the file didn't change while it was hashed
+        new_stat = os.stat(path)
+        if status == (new_stat.st_ino, new_stat.st_size, new_stat.st_mtime_ns):
+            self.fingerprints.set(fingerprint, (status, digest), retry=True)
+
+        return digest
+
+    def _new_hasher(self):
+        """ Create a hasher for :obj:`hash_algorithm`
+
+        Returns:
+            :obj:`object`: hasher
+
+        Raises:
+            :obj:`ValueError`: if the algorithm isn't supported
+        """
+        if self.hash_algorithm.startswith('xxh'):
+            import xxhash  # optional dependency
+            hasher_cls = getattr(xxhash, self.hash_algorithm, None)
+            if hasher_cls is None:
+                raise ValueError('Unsupported hash algorithm {}'.format(self.hash_algorithm))
+            return hasher_cls()
+        return hashlib.new(self.hash_algorithm)
+
+    def _hash_file(self, path):
         """ Hash the content of a file
 
+        Files are read into a reused buffer of :obj:`hash_block_size` bytes. If :obj:`hash_chunk_size` is positive,
+        the chunks of files larger than :obj:`hash_chunk_size` are hashed concurrently and the digests of the
+        chunks are hashed into the hash of the file.
+
         Args:
             path (:obj:`str`): path to the file to hash the contents of
 
         Returns:
             :obj:`str`: hash of the content of the file
         """
-        hasher = hashlib.sha1()
-        with open(path, 'rb') as file:
-            buffer = file.read(self.hash_block_size)
-            while len(buffer) > 0:
-                hasher.update(buffer)
-                buffer = file.read(self.hash_block_size)
+        with open(path, 'rb', buffering=0) as file:
+            size = os.fstat(file.fileno()).st_size
+            if self.hash_chunk_size > 0 and size > self.hash_chunk_size:
+                return self._hash_file_chunks(file, size)
+
+            hasher = self._new_hasher()
+            buffer = bytearray(self.hash_block_size)
+            view = memoryview(buffer)
+            n_bytes = file.readinto(buffer)
+            while n_bytes:
+                hasher.update(view[0:n_bytes])
+                n_bytes = file.readinto(buffer)
+        return hasher.hexdigest()
+
+    def _hash_file_chunks(self, file, size):
+        """ Hash the chunks of a file concurrently, and combine the digests of the chunks into a tree hash
+
+        Args:
+            file (:obj:`io.FileIO`): file
+            size (:obj:`int`): size of the file
+
+        Returns:
+            :obj:`str`: hash of the content of the file
+        """
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(buffer) as view:
+                def hash_chunk(start):
+                    hasher = self._new_hasher()
+                    end = min(start + self.hash_chunk_size, size)
+                    for block_start in range(start, end, self.hash_block_size):
+                        hasher.update(view[block_start:min(block_start + self.hash_block_size, end)])
+                    return hasher.digest()
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self.hash_max_workers) as executor:
+                    digests = list(executor.map(hash_chunk, range(0, size, self.hash_chunk_size)))
+        finally:
+            buffer.close()
+
+        hasher = self._new_hasher()
+        hasher.update(b''.join(digests))
         return hasher.hexdigest()
 
 
@@ -1,4 +1,6 @@
-from .core import (Workbook, Worksheet, Row, Formula,
+from .core import (Workbook, LazyWorkbook, Worksheet, Row, Formula,
+                   ColumnarWorksheet, WorksheetColumn,
                    WorkbookDifference, WorksheetDifference,
                    RowDifference, CellDifference)
+from . import binary
 from . import io
@@ -0,0 +1,332 @@
+""" Compact binary format for workbooks, e.g., to cache parsed workbooks
+
+A binary workbook consists of a header followed by sections of typed arrays. Each section is aligned to 8 bytes so
+that the arrays can be read directly from a memory-mapped file.
+
+* Header: magic number, format version, key (e.g., a digest of the source of the workbook), and the numbers of
+  sheets, rows, cells, formulas and strings and the size of the text of the strings
+* Sheets: index of the name of each sheet in the string table, and number of rows of each sheet
+* Rows: number of cells of each row
+* Cells: type code and 64-bit value of each cell. The value of each string, big integer, date, time or datetime is
+  the index of its (ISO) representation in the string table. The value of each formula is its index in the formula
+  table.
+* Formulas: index of the formula in the string table, and type code and value of the value of each formula
+* String table: offsets of the strings within the text of the strings, and the text of the strings (UTF-8)
+
+:Author: agent <agent@local>
+:Date: 2026-10-16
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_utils.workbook.core import Workbook, Worksheet, Row, Formula
+import datetime
+import mmap
+import numpy
+import os
+import struct
+import tempfile
+
+MAGIC = b'WCWB'
+# :obj:`bytes`: magic number of binary workbooks
+
+VERSION = 1
+# :obj:`int`: version of the format
+
+KEY_SIZE = 32
+# :obj:`int`: size of keys in bytes
+
+HEADER = struct.Struct('<4sI{}s6Q'.format(KEY_SIZE))
+# :obj:`struct.Struct`: structure of the header
+
+
+class CellType(object):
+    """ Type codes of cells """
+    none = 0
+    str = 1
+    bool = 2
+    int = 3
+    float = 4
+    big_int = 5
+    date = 6
+    time = 7
+    datetime = 8
+    formula = 9
+
+
+def dump(workbook, filename, key=b''):
+    """ Save a workbook to a binary file
+
+    The file is written to a temporary file which is then moved to :obj:`filename` so that readers never observe
+    partially written files.
+
+    Args:
+        workbook (:obj:`Workbook`): workbook; each cell must be a string, boolean, integer, float, date, time,
+            datetime, :obj:`Formula`, or :obj:`None`
+        filename (:obj:`str`): path to save the workbook
+        key (:obj:`bytes`, optional): key of the workbook, e.g., a digest of its source, of up to
+            :obj:`KEY_SIZE` bytes
+
+    Raises:
+        :obj:`ValueError`: if the key is too long or a cell has an unsupported type
+    """
+    if len(key) > KEY_SIZE:
+        raise ValueError('Key must be at most {} bytes'.format(KEY_SIZE))
+
+    strings = []
+    string_indices = {}
+
+    def get_string_index(value):
+        i_string = string_indices.get(value, None)
+        if i_string is None:
+            i_string = string_indices[value] = len(strings)
+            strings.append(value)
+        return i_string
+
+    def encode(value):
+        cls = value.__class__
+        if value is None:
+            return CellType.none, 0
+        if cls is str:
+            return CellType.str, get_string_index(value)
+        if cls is bool:
+            return CellType.bool, int(value)
+        if cls is int:
+            if -2 ** 63 <= value < 2 ** 63:
+                return CellType.int, value
+            return CellType.big_int, get_string_index(str(value))
+        if cls is float:
+            return CellType.float, struct.unpack('<q', struct.pack('<d', value))[0]
+        if cls is datetime.datetime:
+            return CellType.datetime, get_string_index(value.isoformat())
+        if cls is datetime.date:
+            return CellType.date, get_string_index(value.isoformat())
+        if cls is datetime.time:
+            return CellType.time, get_string_index(value.isoformat())
+        raise ValueError('Unsupported type {}'.format(cls.__name__))
+
+    sheet_names = []
+    sheet_n_rows = []
+    row_lengths = []
+    cell_types = []
+    cell_values = []
+    formula_texts = []
+    formula_types = []
+    formula_values = []
+    for sheet_name, sheet in workbook.items():
+        sheet_names.append(get_string_index(sheet_name))
+        sheet_n_rows.append(len(sheet))
+        for row in sheet:
+            row_lengths.append(len(row))
+            for cell in row:
+                if cell.__class__ is Formula:
+                    cell_type, value = encode(cell.value)
+                    formula_texts.append(get_string_index(cell.formula))
+                    formula_types.append(cell_type)
+                    formula_values.append(value)
+                    cell_types.append(CellType.formula)
+                    cell_values.append(len(formula_texts) - 1)
+                else:
+                    cell_type, value = encode(cell)
+                    cell_types.append(cell_type)
+                    cell_values.append(value)
+
+    string_offsets = [0]
+    for string in strings:
+        string_offsets.append(string_offsets[-1] + len(string))
+    text = ''.join(strings).encode('utf-8', 'surrogatepass')
+
+    sections = [
+        numpy.array(sheet_names, dtype='<u8'),
+        numpy.array(sheet_n_rows, dtype='<u8'),
+        numpy.array(row_lengths, dtype='<u8'),
+        numpy.array(cell_types, dtype='u1'),
+        numpy.array(cell_values, dtype='<i8'),
+        numpy.array(formula_texts, dtype='<u8'),
+        numpy.array(formula_types, dtype='u1'),
+        numpy.array(formula_values, dtype='<i8'),
+        numpy.array(string_offsets, dtype='<u8'),
+        text,
+    ]
+
+    dirname = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_filename = tempfile.mkstemp(dir=dirname, prefix='.' + os.path.basename(filename) + '.')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, key.ljust(KEY_SIZE, b'\0'),
+                                   len(sheet_names), len(row_lengths), len(cell_types), len(formula_texts),
+                                   len(strings), len(text)))
+            for section in sections:
+                data = section if isinstance(section, bytes) else section.tobytes()
+                file.write(data)
+                file.write(b'\0' * (-len(data) % 8))
+        os.replace(tmp_filename, filename)
+    except Exception:
+        os.remove(tmp_filename)
+        raise
+
+
+def load(filename, key=None):
+    """ Load a workbook from a binary file
+
+    Args:
+        filename (:obj:`str`): path to the workbook
+        key (:obj:`bytes`, optional): if not :obj:`None`, the expected key of the workbook
+
+    Returns:
+        :obj:`Workbook`: workbook
+
+    Raises:
+        :obj:`ValueError`: if the file isn't a binary workbook of the current version, if its key isn't
+            :obj:`key`, or if it is truncated or corrupt
+    """
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            raise ValueError("'{}' is not a binary workbook".format(filename))
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return _load(buffer, filename, key)
+        finally:
+            try:
+                buffer.close()
+            except BufferError:  # pragma: no cover
+                # arrays of the buffer are still referenced, e.g., by a traceback; the buffer is closed when they
+                # are garbage collected
+                pass
+
+
+def _load(buffer, filename, key):
+    """ Load a workbook from a buffer
+
+    Args:
+        buffer (:obj:`mmap.mmap`): buffer
+        filename (:obj:`str`): path to the workbook
+        key (:obj:`bytes`): if not :obj:`None`, the expected key of the workbook
+
+    Returns:
+        :obj:`Workbook`: workbook
+
+    Raises:
+        :obj:`ValueError`: if the file isn't a binary workbook of the current version, if its key isn't
+            :obj:`key`, or if it is truncated or corrupt
+    """
+    magic, version, file_key, n_sheets, n_rows, n_cells, n_formulas, n_strings, text_size = \
+        HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("'{}' is not a binary workbook".format(filename))
+    if version != VERSION:
+        raise ValueError("'{}' has version {} rather than version {}".format(filename, version, VERSION))
+    if key is not None and file_key != key.ljust(KEY_SIZE, b'\0'):
+        raise ValueError("'{}' has a different key".format(filename))
+
+    section_sizes = [8 * n_sheets, 8 * n_sheets, 8 * n_rows, n_cells, 8 * n_cells,
+                     8 * n_formulas, n_formulas, 8 * n_formulas, 8 * (n_strings + 1), text_size]
+    if HEADER.size + sum(size + (-size % 8) for size in section_sizes) > len(buffer):
+        raise ValueError("'{}' is truncated".format(filename))
+
+    offset = HEADER.size
+
+    def read_section(dtype, count):
+        nonlocal offset
+        array = numpy.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+        offset += array.nbytes + (-array.nbytes % 8)
+        return array
+
+    sheet_names = read_section('<u8', n_sheets)
+    sheet_n_rows = read_section('<u8', n_sheets)
+    row_lengths = read_section('<u8', n_rows)
+    cell_types = read_section('u1', n_cells)
+    cell_values = read_section('<i8', n_cells)
+    formula_texts = read_section('<u8', n_formulas)
+    formula_types = read_section('u1', n_formulas)
+    formula_values = read_section('<i8', n_formulas)
+    string_offsets = read_section('<u8', n_strings + 1).tolist()
+    text = read_section('u1', text_size).tobytes().decode('utf-8', 'surrogatepass')
+
+    # check the sizes, offsets and indices so that corrupt files are reported as invalid
+    def check(valid, description):
+        if not valid:
+            raise ValueError("'{}' is corrupt: {}".format(filename, description))
+
+    check(sum(sheet_n_rows.tolist()) == n_rows, 'the numbers of rows of the sheets are inconsistent')
+    check(sum(row_lengths.tolist()) == n_cells, 'the lengths of the rows are inconsistent')
+    check(string_offsets[0] == 0 and string_offsets[-1] == len(text)
+          and all(start <= end for start, end in zip(string_offsets[:-1], string_offsets[1:])),
+          'the offsets of the strings are invalid')
+    check(not (sheet_names >= n_strings).any(), 'the names of the sheets are invalid')
+    check(not (formula_texts >= n_strings).any(), 'the texts of the formulas are invalid')
+    check(not (formula_types >= CellType.formula).any(), 'the types of the values of the formulas are invalid')
+    _check_values(formula_types, formula_values, n_strings, n_formulas, check)
+    check(not (cell_types > CellType.formula).any(), 'the types of the cells are invalid')
+    _check_values(cell_types, cell_values, n_strings, n_formulas, check)
+
+    strings = numpy.empty(n_strings, dtype=object)
+    strings[:] = [text[start:end] for start, end in zip(string_offsets[:-1], string_offsets[1:])]
+
+    formulas = decode(formula_types, formula_values, strings)
+    for i_formula, (formula_text, value) in enumerate(zip(formula_texts.tolist(), formulas)):
+        formulas[i_formula] = Formula(strings[formula_text], value)
+    cells = decode(cell_types, cell_values, strings, formulas)
+
+    workbook = Workbook()
+    row_ends = numpy.cumsum(row_lengths).tolist()
+    i_row = 0
+    for sheet_name, n_rows in zip(sheet_names.tolist(), sheet_n_rows.tolist()):
+        rows = []
+        start = row_ends[i_row - 1] if i_row else 0
+        for end in row_ends[i_row:i_row + n_rows]:
+            rows.append(Row(cells[start:end]))
+            start = end
+        workbook[strings[sheet_name]] = Worksheet(rows)
+        i_row += n_rows
+    return workbook
+
+
+def _check_values(types, values, n_strings, n_formulas, check):
+    """ Check that the values of cells which refer to the string or formula table are valid indices
+
+    Args:
+        types (:obj:`numpy.ndarray`): type codes
+        values (:obj:`numpy.ndarray`): values
+        n_strings (:obj:`int`): number of strings
+        n_formulas (:obj:`int`): number of formulas
+        check (:obj:`callable`): function which raises a :obj:`ValueError` if its first argument is :obj:`False`
+    """
+    string_values = values[numpy.isin(types, [CellType.str, CellType.big_int, CellType.date, CellType.time,
+                                              CellType.datetime])]
+    check(not ((string_values < 0) | (string_values >= n_strings)).any(), 'the indices of strings are invalid')
+    formula_values = values[types == CellType.formula]
+    check(not ((formula_values < 0) | (formula_values >= n_formulas)).any(), 'the indices of formulas are invalid')
+
+
+def decode(types, values, strings, formulas=None):
+    """ Decode the type codes and values of cells
+
+    Args:
+        types (:obj:`numpy.ndarray`): type codes
+        values (:obj:`numpy.ndarray`): values
+        strings (:obj:`numpy.ndarray`): string table
+        formulas (:obj:`list` of :obj:`Formula`, optional): formula table
+
+    Returns:
+        :obj:`list`: values of cells
+    """
+    cells = numpy.empty(len(types), dtype=object)
+
+    for cell_type, decode_values in (
+            (CellType.str, lambda values: strings[values]),
+            (CellType.bool, lambda values: values != 0),
+            (CellType.int, lambda values: values),
+            (CellType.float, lambda values: values.view('<f8')),
+            (CellType.big_int, lambda values: [int(value) for value in strings[values]]),
+            (CellType.date, lambda values: [datetime.date.fromisoformat(value) for value in strings[values]]),
+            (CellType.time, lambda values: [datetime.time.fromisoformat(value) for value in strings[values]]),
+            (CellType.datetime, lambda values: [datetime.datetime.fromisoformat(value)
+                                                for value in strings[values]]),
+            (CellType.formula, lambda values: [formulas[value] for value in values.tolist()]),
+    ):
+        mask = types == cell_type
+        if mask.any():
+            cells[mask] = decode_values(values[mask])
+
+    return cells.tolist()
@@ -7,7 +7,13 @@
 """
 
 from openpyxl.utils import get_column_letter
+from itertools import chain
+import bisect
 import collections
+import collections.abc
+import hashlib
+import numpy
+import weakref
 
 
 class Workbook(collections.OrderedDict):
@@ -22,7 +28,7 @@ class Workbook(collections.OrderedDict):
         Returns:
             :obj:`bool`: true if workbooks are semantically equal
         """
-        if other.__class__ is not self.__class__:
+        if _get_comparison_class(other) is not _get_comparison_class(self):
             return False
 
         if set(self.keys()) != set(other.keys()):
@@ -45,11 +51,15 @@ class Workbook(collections.OrderedDict):
         """
         return not self.__eq__(other)
 
-    def difference(self, other):
+    def difference(self, other, align=False, key_column=None):
         """ Get difference with another workbook
 
         Args:
             other (:obj:`Workbook`): other workbook
+            align (:obj:`bool`, optional): if :obj:`True`, align the rows of the worksheets (see
+                :obj:`Worksheet.difference`)
+            key_column (:obj:`int`, optional): index of the column whose values are used to align the rows of the
+                worksheets (see :obj:`Worksheet.difference`)
 
         Returns:
             :obj:`dict`: dictionary of differences, grouped by worksheet
@@ -58,13 +68,15 @@ class Workbook(collections.OrderedDict):
             :obj:`ValueError`: if other is not an instance of `workbook`
         """
 
-        if other.__class__ is not self.__class__:
+        if _get_comparison_class(other) is not _get_comparison_class(self):
             raise ValueError('`other` must be an instance of `Workbook`')
 
         diff = WorkbookDifference()
         for name, sheet in self.items():
             if name in other:
-                sheet_diff = sheet.difference(other[name])
+                if sheet == other[name]:
+                    continue
+                sheet_diff = sheet.difference(other[name], align=align, key_column=key_column)
                 if sheet_diff:
                     diff[name] = sheet_diff
             else:
@@ -76,9 +88,290 @@ class Workbook(collections.OrderedDict):
 
         return diff
 
+    def get_digest(self, compute=True):
+        """ Get a digest of the content of the workbook
+
+        Computing the digest of a workbook caches the digests of its rows, which accelerates subsequent comparisons
+        of the workbook with other workbooks whose digests have also been computed.
+
+        Args:
+            compute (:obj:`bool`, optional): if :obj:`False`, only use the cached digests of the rows
+
+        Returns:
+            :obj:`bytes`: digest, or :obj:`None` if the digest of a worksheet is :obj:`None` (see
+                :obj:`Worksheet.get_digest`)
+        """
+        digest = hashlib.blake2b(digest_size=Row.DIGEST_SIZE)
+        for name in sorted(self.keys()):
+            sheet = self[name]
+            if sheet.__class__ is not Worksheet:
+                return None
+            sheet_digest = sheet.get_digest(compute=compute)
+            if sheet_digest is None:
+                return None
+            digest.update(repr(name).encode())
+            digest.update(sheet_digest)
+        return digest.digest()
+
+
+class LazyWorkbook(Workbook):
+    """ Workbook whose worksheets are loaded on their first access
+
+    Iterating over the names of the worksheets doesn't load them. Accessing a worksheet, e.g., with
+    :obj:`__getitem__`, :obj:`get`, :obj:`values`, or :obj:`items`, loads the worksheet and caches it.
+    Comparisons with other workbooks load the worksheets which are needed. Copies of lazy workbooks are
+    instances of :obj:`Workbook` with all of their worksheets loaded.
+
+    Attributes:
+        _load_worksheet (:obj:`callable`): function which loads a worksheet, given its name
+        _close (:obj:`callable`): function which releases the resources used to load worksheets
+        _lazy_names (:obj:`set` of :obj:`str`): names of the worksheets which can be (re)loaded
+        _closed (:obj:`bool`): if :obj:`True`, worksheets can no longer be loaded
+    """
+
+    class _Unloaded(object):
+        """ Placeholder for worksheets which haven't been loaded """
+
+        def __repr__(self):
+            return '<unloaded>'
+
+    UNLOADED = _Unloaded()
+    # :obj:`_Unloaded`: placeholder for worksheets which haven't been loaded
+
+    def __init__(self, sheet_names=(), load_worksheet=None, close=None):
+        """
+        Args:
+            sheet_names (:obj:`list` of :obj:`str`, optional): names of the worksheets
+            load_worksheet (:obj:`callable`, optional): function which loads a worksheet, given its name
+            close (:obj:`callable`, optional): function which releases the resources used to load worksheets
+        """
+        super(LazyWorkbook, self).__init__()
+        self._load_worksheet = load_worksheet
+        self._close = close
+        self._lazy_names = set(sheet_names)
+        self._closed = False
+        for sheet_name in sheet_names:
+            super(LazyWorkbook, self).__setitem__(sheet_name, self.UNLOADED)
+
+    def __getitem__(self, sheet_name):
+        """ Get a worksheet, loading it if it hasn't been loaded
+
+        Args:
+            sheet_name (:obj:`str`): name of the worksheet
+
+        Returns:
+            :obj:`Worksheet`: worksheet
+
+        Raises:
+            :obj:`ValueError`: if the worksheet hasn't been loaded and the workbook has been closed
+        """
+        sheet = super(LazyWorkbook, self).__getitem__(sheet_name)
+        if sheet is self.UNLOADED:
+            if self._closed:
+                raise ValueError('Worksheet "{}" cannot be loaded because the workbook has been closed'.format(
+                    sheet_name))
+            sheet = self._load_worksheet(sheet_name)
+            super(LazyWorkbook, self).__setitem__(sheet_name, sheet)
+        return sheet
+
+    def __setitem__(self, sheet_name, sheet):
+        self._lazy_names.discard(sheet_name)
+        super(LazyWorkbook, self).__setitem__(sheet_name, sheet)
+
+    def __delitem__(self, sheet_name):
+        self._lazy_names.discard(sheet_name)
+        super(LazyWorkbook, self).__delitem__(sheet_name)
+
+    def get(self, sheet_name, default=None):
+        if sheet_name in self:
+            return self[sheet_name]
+        return default
+
+    def setdefault(self, sheet_name, default=None):
+        if sheet_name in self:
+            return self[sheet_name]
+        self[sheet_name] = default
+        return default
+
+    def pop(self, sheet_name, *args):
+        if sheet_name in self:
+            sheet = self[sheet_name]
+            del self[sheet_name]
+            return sheet
+        return super(LazyWorkbook, self).pop(sheet_name, *args)
+
+    def popitem(self, last=True):
+        if not self:
+            raise KeyError('dictionary is empty')
+        sheet_name = next(reversed(self)) if last else next(iter(self))
+        return sheet_name, self.pop(sheet_name)
+
+    def values(self):
+        return collections.abc.ValuesView(self)
+
+    def items(self):
+        return collections.abc.ItemsView(self)
+
+    def copy(self):
+        return Workbook(self.items())
+
+    def __reduce__(self):
+        return (Workbook, (), None, None, iter(self.items()))
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, list(super(LazyWorkbook, self).items()))
+
+    def is_loaded(self, sheet_name):
+        """ Determine whether a worksheet has been loaded
+
+        Args:
+            sheet_name (:obj:`str`): name of the worksheet
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the worksheet has been loaded
+        """
+        return super(LazyWorkbook, self).__getitem__(sheet_name) is not self.UNLOADED
+
+    def load(self):
+        """ Load all of the worksheets """
+        for sheet_name in self:
+            self[sheet_name]
+
+    def unload(self, sheet_name):
+        """ Release the memory of a worksheet; the worksheet is loaded again on its next access
+
+        Args:
+            sheet_name (:obj:`str`): name of the worksheet
+
+        Raises:
+            :obj:`ValueError`: if the worksheet can't be loaded again because it was set rather than loaded, or
+                because the workbook has been closed
+        """
+        if sheet_name not in self._lazy_names:
+            raise ValueError('Worksheet "{}" cannot be unloaded because it was not loaded lazily'.format(sheet_name))
+        if self._closed:
+            raise ValueError('Worksheet "{}" cannot be unloaded because the workbook has been closed'.format(
+                sheet_name))
+        super(LazyWorkbook, self).__setitem__(sheet_name, self.UNLOADED)
+
+    def close(self):
+        """ Release the resources used to load worksheets; worksheets which haven't been loaded can no longer be
+        loaded """
+        if not self._closed:
+            self._closed = True
+            if self._close is not None:
+                self._close()
+
+    def __enter__(self):
+        """ Enter a context in which worksheets can be loaded
+
+        Returns:
+            :obj:`LazyWorkbook`: workbook
+        """
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """ Release the resources used to load worksheets
+
+        Args:
+            type (:obj:`type`): type of exception, if any
+            value (:obj:`Exception`): exception, if any
+            traceback (:obj:`traceback`): traceback, if any
+        """
+        self.close()
+
+
+def _get_comparison_class(obj):
+    """ Get the class of an object for comparisons; lazy workbooks are compared as workbooks
+
+    Args:
+        obj (:obj:`object`): object
+
+    Returns:
+        :obj:`type`: class
+    """
+    if isinstance(obj, LazyWorkbook):
+        return Workbook
+    return obj.__class__
+
 
 class Worksheet(list):
-    """ Represents a table of data, such as an Excel worksheet or a csv/tsv file"""
+    """ Represents a table of data, such as an Excel worksheet or a csv/tsv file
+
+    Worksheets can cache digests of their content (see :obj:`get_digest`). The cached digest of a worksheet is
+    invalidated when the worksheet or one of its rows is modified.
+    """
+
+    _digest_token = None
+    # :obj:`object`: token of the current state of the worksheet, used to validate its cached digest; reset when the
+    # worksheet or one of its rows is modified
+
+    _digest_cache = None
+    # :obj:`tuple`: token of the state of the worksheet when the digest was cached, and the cached digest
+
+    def _invalidate_digest(self):
+        """ Invalidate the cached digest of the worksheet """
+        self._digest_token = None
+
+    def __getstate__(self):
+        """ Get the state of the worksheet for pickling, excluding its cached digest, which is only valid within the
+        current process
+
+        Returns:
+            :obj:`dict`: state
+        """
+        state = dict(self.__dict__)
+        state.pop('_digest_token', None)
+        state.pop('_digest_cache', None)
+        return state
+
+    def __setitem__(self, key, value):
+        self._invalidate_digest()
+        super(Worksheet, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._invalidate_digest()
+        super(Worksheet, self).__delitem__(key)
+
+    def __iadd__(self, other):
+        self._invalidate_digest()
+        return super(Worksheet, self).__iadd__(other)
+
+    def __imul__(self, other):
+        self._invalidate_digest()
+        return super(Worksheet, self).__imul__(other)
+
+    def append(self, value):
+        self._invalidate_digest()
+        super(Worksheet, self).append(value)
+
+    def extend(self, values):
+        self._invalidate_digest()
+        super(Worksheet, self).extend(values)
+
+    def insert(self, index, value):
+        self._invalidate_digest()
+        super(Worksheet, self).insert(index, value)
+
+    def pop(self, *args):
+        self._invalidate_digest()
+        return super(Worksheet, self).pop(*args)
+
+    def remove(self, value):
+        self._invalidate_digest()
+        super(Worksheet, self).remove(value)
+
+    def clear(self):
+        self._invalidate_digest()
+        super(Worksheet, self).clear()
+
+    def sort(self, *args, **kwargs):
+        self._invalidate_digest()
+        super(Worksheet, self).sort(*args, **kwargs)
+
+    def reverse(self):
+        self._invalidate_digest()
+        super(Worksheet, self).reverse()
 
     def __getitem__(self, i_row):
         """ Get a row or a range of rows
@@ -110,6 +403,12 @@ class Worksheet(list):
         if len(self) != len(other):
             return False
 
+        digest_self = self.get_digest(compute=False)
+        if digest_self is not None:
+            digest_other = other.get_digest(compute=False)
+            if digest_other is not None:
+                return digest_self == digest_other
+
         for row_self, row_other in zip(self, other):
             if not row_self == row_other:
                 return False
@@ -127,11 +426,28 @@ class Worksheet(list):
         """
         return not self.__eq__(other)
 
-    def difference(self, other):
+    def difference(self, other, align=False, key_column=None):
         """ Get difference with another worksheet
 
+        By default, each row is compared with the row at the same position in the other worksheet. Optionally, the
+        rows can be aligned so that inserted and deleted rows don't cause the subsequent rows to be reported as
+        different:
+
+        * If :obj:`key_column` is not :obj:`None`, rows are matched by their values of this column. Rows with the
+          same key are matched in order, as are rows whose keys are blank. Rows whose relative order differs
+          between the worksheets are reported as moved.
+        * Otherwise, if :obj:`align` is :obj:`True`, rows are matched by a patience diff of the digests of their
+          content. Unmatched rows between matched rows are compared in order.
+
+        The differences of aligned worksheets are keyed by tuples of the indices of rows in the worksheet and in
+        the other worksheet. The index of the row in the worksheet is :obj:`None` for rows which are only in the
+        other worksheet, and vice versa.
+
         Args:
             other (:obj:`Worksheet`): other worksheet
+            align (:obj:`bool`, optional): if :obj:`True`, align the rows of the worksheets
+            key_column (:obj:`int`, optional): index of the column whose values are used to align the rows of the
+                worksheets
 
         Returns:
             :obj:`WorksheeDifference`: dictionary of differences, grouped by row
@@ -142,11 +458,19 @@ class Worksheet(list):
         if other.__class__ is not self.__class__:
             raise ValueError('`other` must be an instance of `Worksheet`')
 
+        if key_column is not None:
+            return self._difference_by_key(other, key_column)
+        if align:
+            return self._difference_by_content(other)
+
         diff = WorksheetDifference()
 
         for i_row, row_self in enumerate(self):
             if i_row < len(other):
-                diff_row = row_self.difference(other[i_row])
+                row_other = other[i_row]
+                if row_self == row_other:
+                    continue
+                diff_row = row_self.difference(row_other)
                 if diff_row:
                     diff[i_row] = diff_row
             else:
@@ -157,6 +481,238 @@ class Worksheet(list):
 
         return diff
 
+    def _difference_by_key(self, other, key_column):
+        """ Get difference with another worksheet whose rows are aligned by their values of a key column
+
+        Args:
+            other (:obj:`Worksheet`): other worksheet
+            key_column (:obj:`int`): index of the column whose values are used to align the rows of the worksheets
+
+        Returns:
+            :obj:`WorksheeDifference`: dictionary of differences, grouped by pairs of indices of rows
+        """
+        def get_key(row):
+            key = row[key_column] if key_column < len(row) else None
+            return None if key == '' else key
+
+        # queues of the indices of the rows of the other worksheet with each key, and of the rows without keys
+        i_rows_other = {}
+        i_unkeyed_rows_other = collections.deque()
+        for i_row_other, row_other in enumerate(other):
+            key = get_key(row_other)
+            if key is None:
+                i_unkeyed_rows_other.append(i_row_other)
+            else:
+                i_rows_other.setdefault(key, collections.deque()).append(i_row_other)
+
+        pairs = []
+        i_rows_self = set()
+        for i_row_self, row_self in enumerate(self):
+            key = get_key(row_self)
+            if key is None:
+                i_rows = i_unkeyed_rows_other
+            else:
+                i_rows = i_rows_other.get(key)
+            if i_rows:
+                pairs.append((i_row_self, i_rows.popleft()))
+                i_rows_self.add(i_row_self)
+
+        in_order = set(self._get_increasing_subsequence(pairs))
+
+        diff = WorksheetDifference()
+        i_pair = 0
+        for i_row_self, row_self in enumerate(self):
+            if i_row_self not in i_rows_self:
+                diff[(i_row_self, None)] = 'Row not in other'
+                continue
+
+            i_row_other = pairs[i_pair][1]
+            row_other = other[i_row_other]
+            diff_row = None if row_self == row_other else row_self.difference(row_other)
+            if diff_row:
+                diff[(i_row_self, i_row_other)] = diff_row
+            elif pairs[i_pair] not in in_order:
+                diff[(i_row_self, i_row_other)] = 'Row moved'
+            i_pair += 1
+
+        for i_row_other in sorted(chain(i_unkeyed_rows_other, *i_rows_other.values())):
+            diff[(None, i_row_other)] = 'Row not in self'
+
+        return diff
+
+    def _difference_by_content(self, other):
+        """ Get difference with another worksheet whose rows are aligned by a patience diff of their content
+
+        Args:
+            other (:obj:`Worksheet`): other worksheet
+
+        Returns:
+            :obj:`WorksheeDifference`: dictionary of differences, grouped by pairs of indices of rows
+        """
+        keys_self = self._get_row_keys()
+        keys_other = other._get_row_keys()
+
+        # match rows
+        matches = []
+        ranges = [(0, len(self), 0, len(other))]
+        while ranges:
+            start_self, end_self, start_other, end_other = ranges.pop()
+
+            # match common leading and trailing rows
+            while start_self < end_self and start_other < end_other \
+                    and keys_self[start_self] == keys_other[start_other]:
+                matches.append((start_self, start_other))
+                start_self += 1
+                start_other += 1
+            while start_self < end_self and start_other < end_other \
+                    and keys_self[end_self - 1] == keys_other[end_other - 1]:
+                end_self -= 1
+                end_other -= 1
+                matches.append((end_self, end_other))
+            if start_self == end_self or start_other == end_other:
+                continue
+
+            # match rows which are unique in both ranges, and recursively align the rows between them
+            counts = collections.Counter(keys_self[start_self:end_self])
+            i_rows_other = {}
+            for i_row_other in range(start_other, end_other):
+                key = keys_other[i_row_other]
+                if counts.get(key) == 1:
+                    i_rows_other[key] = None if key in i_rows_other else i_row_other
+            unique_pairs = []
+            for i_row_self in range(start_self, end_self):
+                i_row_other = i_rows_other.get(keys_self[i_row_self])
+                if i_row_other is not None:
+                    unique_pairs.append((i_row_self, i_row_other))
+
+            prev_self = start_self
+            prev_other = start_other
+            for i_row_self, i_row_other in self._get_increasing_subsequence(unique_pairs):
+                matches.append((i_row_self, i_row_other))
+                ranges.append((prev_self, i_row_self, prev_other, i_row_other))
+                prev_self = i_row_self + 1
+                prev_other = i_row_other + 1
+            if prev_self != start_self:
+                ranges.append((prev_self, end_self, prev_other, end_other))
+        matches.sort()
+
+        # compare unmatched rows between matched rows in order
+        diff = WorksheetDifference()
+        prev_self = 0
+        prev_other = 0
+        for end_self, end_other in chain(matches, [(len(self), len(other))]):
+            n_rows = min(end_self - prev_self, end_other - prev_other)
+            for i_row in range(n_rows):
+                row_self = self[prev_self + i_row]
+                row_other = other[prev_other + i_row]
+                if not row_self == row_other:
+                    diff_row = row_self.difference(row_other)
+                    if diff_row:
+                        diff[(prev_self + i_row, prev_other + i_row)] = diff_row
+            for i_row_self in range(prev_self + n_rows, end_self):
+                diff[(i_row_self, None)] = 'Row not in other'
+            for i_row_other in range(prev_other + n_rows, end_other):
+                diff[(None, i_row_other)] = 'Row not in self'
+            prev_self = end_self + 1
+            prev_other = end_other + 1
+
+        return diff
+
+    def _get_row_keys(self):
+        """ Get hashable keys of the content of the rows of the worksheet for aligning worksheets
+
+        Returns:
+            :obj:`list`: keys of the rows
+        """
+        keys = []
+        for row in self:
+            key = row.get_digest() if row.__class__ is Row else None
+            if key is None:
+                key = repr(list(row))
+            keys.append(key)
+        return keys
+
+    @staticmethod
+    def _get_increasing_subsequence(pairs):
+        """ Get a longest subsequence of pairs of row indices, sorted by their first elements, whose second elements
+        are also increasing
+
+        Args:
+            pairs (:obj:`list` of :obj:`tuple`): pairs of indices, sorted by their first elements
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: longest increasing subsequence
+        """
+        tails = []
+        tail_indices = []
+        predecessors = []
+        for i_pair, (_, value) in enumerate(pairs):
+            i_tail = bisect.bisect_left(tails, value)
+            if i_tail == len(tails):
+                tails.append(value)
+                tail_indices.append(i_pair)
+            else:
+                tails[i_tail] = value
+                tail_indices[i_tail] = i_pair
+            predecessors.append(tail_indices[i_tail - 1] if i_tail else None)
+
+        subsequence = []
+        i_pair = tail_indices[-1] if tail_indices else None
+        while i_pair is not None:
+            subsequence.append(pairs[i_pair])
+            i_pair = predecessors[i_pair]
+        subsequence.reverse()
+        return subsequence
+
+    def get_digest(self, compute=True):
+        """ Get a digest of the content of the worksheet
+
+        The digest is derived from the cached digests of the rows of the worksheet so that it reflects any
+        modifications of the rows. The rows notify the worksheet when they are modified (see
+        :obj:`Row._invalidate_digest`), which invalidates the cached digest of the worksheet, but not the cached
+        digests of other worksheets.
+
+        Args:
+            compute (:obj:`bool`, optional): if :obj:`False`, only use the cached digests of the rows
+
+        Returns:
+            :obj:`bytes`: digest, or :obj:`None` if the worksheet contains rows which aren't instances of
+                :obj:`Row`, whose content can't be digested (see :obj:`Row.get_digest`), or whose digests haven't
+                been computed and :obj:`compute` is :obj:`False`
+        """
+        token = self._digest_token
+        cache = self._digest_cache
+        if token is not None and cache is not None and cache[0] is token:
+            return cache[1]
+
+        # without computing digests, the digest is only available if the digests of all of the rows have been cached;
+        # otherwise, the worksheet isn't subscribed to its rows, e.g., when worksheets are compared (see :obj:`__eq__`)
+        if not compute:
+            for row in self:
+                if row.__class__ is not Row or row._digest is NotImplemented or row._digest is None:
+                    return None
+
+        # the token is issued and the rows are subscribed before their digests are read so that concurrent
+        # modifications of the rows invalidate the digest which is being computed
+        token = self._digest_token = object()
+        row_digests = []
+        for row in self:
+            if row.__class__ is not Row:
+                digest = None
+                break
+            row._subscribe(self)
+            row_digest = row.get_digest(compute=compute)
+            if row_digest is None:
+                digest = None
+                break
+            row_digests.append(row_digest)
+        else:
+            digest = hashlib.blake2b(b''.join(row_digests), digest_size=Row.DIGEST_SIZE).digest()
+
+        if digest is not None or compute:
+            self._digest_cache = (token, digest)
+        return digest
+
     def remove_empty_final_rows(self):
         """ Remove empty final rows """
         for row in reversed(self):
@@ -180,7 +736,159 @@ class Worksheet(list):
 
 
 class Row(list):
-    """ Represents a row in a table of data """
+    """ Represents a row in a table of data
+
+    Rows can cache digests of their content (see :obj:`get_digest`). When the digests of two rows have been
+    computed, the rows are compared by their digests rather than by their cells. The digests are invalidated when
+    the rows are modified.
+    """
+
+    DIGEST_SIZE = 16
+    # :obj:`int`: size of digests in bytes
+
+    _DIGEST_TYPES = frozenset((str, int, type(None)))
+    # :obj:`frozenset` of :obj:`type`: types of cells whose representations can be digested as is
+
+    _DIGEST_NORMALIZED_TYPES = frozenset((str, int, float, bool, type(None)))
+    # :obj:`frozenset` of :obj:`type`: types of cells which can be digested
+
+    _digest = NotImplemented
+    # :obj:`bytes`: cached digest; :obj:`NotImplemented` if the digest hasn't been computed
+
+    _worksheets = None
+    # :obj:`dict`: dictionary which maps the ids of the worksheets whose cached digests are derived from the digest of
+    # the row to weak references to the worksheets
+
+    def __getstate__(self):
+        """ Get the state of the row for pickling, excluding the worksheets which it notifies of modifications
+
+        Returns:
+            :obj:`dict`: state
+        """
+        state = dict(self.__dict__)
+        state.pop('_worksheets', None)
+        return state
+
+    def _subscribe(self, worksheet):
+        """ Notify a worksheet when the row is modified
+
+        Args:
+            worksheet (:obj:`Worksheet`): worksheet
+        """
+        worksheets = self._worksheets
+        if worksheets is None:
+            worksheets = self._worksheets = {}
+        worksheets[id(worksheet)] = weakref.ref(worksheet)
+
+    def get_digest(self, compute=True):
+        """ Get a digest of the content of the row
+
+        Semantically equal rows have the same digest (e.g., empty strings and :obj:`None` have the same digest, as do
+        equal booleans, integers and floats).
+
+        Computing a digest costs several times more than comparing two rows cell by cell. Therefore, digests are
+        only computed on request, e.g., for workbooks which are compared repeatedly.
+
+        Args:
+            compute (:obj:`bool`, optional): if :obj:`False`, only return the cached digest
+
+        Returns:
+            :obj:`bytes`: digest, or :obj:`None` if the row contains cells which can't be digested, i.e. cells whose
+                values aren't strings, booleans, integers, non-NaN floats, or :obj:`None`, or if the digest hasn't
+                been computed and :obj:`compute` is :obj:`False`
+        """
+        digest = self._digest
+        if digest is NotImplemented:
+            if not compute:
+                return None
+            digest = self._digest = self._compute_digest()
+        return digest
+
+    def _compute_digest(self):
+        """ Compute a digest of the content of the row
+
+        Returns:
+            :obj:`bytes`: digest, or :obj:`None` if the row contains cells which can't be digested
+        """
+        cell_types = set(map(type, self))
+        if cell_types.issubset(self._DIGEST_TYPES) and '' not in self:
+            keys = self
+        elif cell_types.issubset(self._DIGEST_NORMALIZED_TYPES):
+            keys = []
+            for cell in self:
+                cls = cell.__class__
+                if cls is float:
+                    if cell != cell:
+                        return None
+                    if cell.is_integer():
+                        cell = int(cell)
+                elif cls is bool:
+                    cell = int(cell)
+                elif cell == '':
+                    cell = None
+                keys.append(cell)
+        else:
+            return None
+        return hashlib.blake2b(list.__repr__(keys).encode(), digest_size=self.DIGEST_SIZE).digest()
+
+    def _invalidate_digest(self):
+        """ Invalidate the cached digests of the row and of the worksheets which contain it """
+        self._digest = NotImplemented
+        worksheets = self._worksheets
+        if worksheets:
+            self._worksheets = None
+            for worksheet_ref in list(worksheets.values()):
+                worksheet = worksheet_ref()
+                if worksheet is not None:
+                    worksheet._invalidate_digest()
+
+    def __setitem__(self, key, value):
+        self._invalidate_digest()
+        super(Row, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._invalidate_digest()
+        super(Row, self).__delitem__(key)
+
+    def __iadd__(self, other):
+        self._invalidate_digest()
+        return super(Row, self).__iadd__(other)
+
+    def __imul__(self, other):
+        self._invalidate_digest()
+        return super(Row, self).__imul__(other)
+
+    def append(self, value):
+        self._invalidate_digest()
+        super(Row, self).append(value)
+
+    def extend(self, values):
+        self._invalidate_digest()
+        super(Row, self).extend(values)
+
+    def insert(self, index, value):
+        self._invalidate_digest()
+        super(Row, self).insert(index, value)
+
+    def pop(self, *args):
+        self._invalidate_digest()
+        return super(Row, self).pop(*args)
+
+    def remove(self, value):
+        self._invalidate_digest()
+        super(Row, self).remove(value)
+
+    def clear(self):
+        self._invalidate_digest()
+        super(Row, self).clear()
+
+    def sort(self, *args, **kwargs):
+        self._invalidate_digest()
+        super(Row, self).sort(*args, **kwargs)
+
+    def reverse(self):
+        self._invalidate_digest()
+        super(Row, self).reverse()
 
     def __getitem__(self, i_cell):
         """ Get a cell or a range of cells
@@ -212,6 +920,12 @@ class Row(list):
         if len(self) != len(other):
             return False
 
+        digest_self = self._digest
+        if digest_self is not NotImplemented and digest_self is not None:
+            digest_other = other._digest
+            if digest_other is not NotImplemented and digest_other is not None:
+                return digest_self == digest_other
+
         for c_self, c_other in zip(self, other):
             if not (c_self == c_other or (c_self is None and c_other == '') or (c_self == '' and c_other is None)):
                 return False
@@ -276,6 +990,414 @@ class Row(list):
             return CellDifference('{} != {}'.format(cell_self, cell_other))
 
 
+class ColumnarWorksheet(object):
+    """ Represents a table of data, such as an Excel worksheet or a csv/tsv file, as typed columns
+
+    Columns whose values are mostly booleans, integers, or floats are stored in NumPy arrays, together with masks
+    of their empty cells; the few cells of these columns which have values of other types (e.g., headings) are stored
+    separately. All other columns are stored in arrays of objects. Rows are materialized on demand, and modifying
+    them doesn't modify the worksheet.
+
+    Attributes:
+        columns (:obj:`list` of :obj:`WorksheetColumn`): columns
+    """
+
+    def __init__(self, columns=None, n_rows=None):
+        """
+        Args:
+            columns (:obj:`list` of :obj:`WorksheetColumn`, optional): columns
+            n_rows (:obj:`int`, optional): number of rows; only needed if the worksheet has no columns
+
+        Raises:
+            :obj:`ValueError`: if the columns have different lengths
+        """
+        self.columns = list(columns or [])
+        if self.columns:
+            n_rows = len(self.columns[0])
+            if any(len(column) != n_rows for column in self.columns):
+                raise ValueError('Columns must have the same length')
+        self._n_rows = n_rows or 0
+
+    @classmethod
+    def from_rows(cls, rows):
+        """ Create a columnar worksheet from rows; short rows are padded with empty cells
+
+        Args:
+            rows (:obj:`iterable` of :obj:`Row`): rows
+
+        Returns:
+            :obj:`ColumnarWorksheet`: columnar worksheet
+        """
+        rows = list(rows)
+        n_cols = max((len(row) for row in rows), default=0)
+        columns = []
+        for i_col in range(n_cols):
+            columns.append(WorksheetColumn.from_values(row[i_col] if i_col < len(row) else None for row in rows))
+        return cls(columns, n_rows=len(rows))
+
+    def to_worksheet(self):
+        """ Get a row-oriented copy of the worksheet
+
+        Returns:
+            :obj:`Worksheet`: row-oriented worksheet
+        """
+        return Worksheet(self)
+
+    def __len__(self):
+        """ Get the number of rows
+
+        Returns:
+            :obj:`int`: number of rows
+        """
+        return self._n_rows
+
+    def __iter__(self):
+        """ Iterate over the rows
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`Row`: rows
+        """
+        if not self.columns:
+            for i_row in range(self._n_rows):
+                yield Row()
+            return
+
+        for row in zip(*(column.to_list() for column in self.columns)):
+            yield Row(row)
+
+    def __getitem__(self, i_row):
+        """ Get a row or a range of rows
+
+        Args:
+            i_row (:obj:`int` of :obj:`slice`): row index or range
+                of row indices
+
+        Returns:
+            :obj:`Row` or :obj:`ColumnarWorksheet`: row or range of rows
+        """
+        if isinstance(i_row, slice):
+            return self.__class__([column[i_row] for column in self.columns],
+                                  n_rows=len(range(self._n_rows)[i_row]))
+
+        if i_row < -self._n_rows or i_row >= self._n_rows:
+            raise IndexError('Row index out of range')
+        return Row(column[i_row] for column in self.columns)
+
+    def __eq__(self, other):
+        """ Compare two worksheets
+
+        Args:
+            other (:obj:`ColumnarWorksheet`): other worksheet
+
+        Returns:
+            :obj:`bool`: True if worksheets are semantically equal
+        """
+        if other.__class__ is not self.__class__:
+            return False
+
+        if len(self) != len(other) or len(self.columns) != len(other.columns):
+            return False
+
+        for column_self, column_other in zip(self.columns, other.columns):
+            if not column_self == column_other:
+                return False
+
+        return True
+
+    def __ne__(self, other):
+        """ Compare two worksheets
+
+        Args:
+            other (:obj:`ColumnarWorksheet`): other worksheet
+
+        Returns:
+            :obj:`bool`: True if worksheets are semantically unequal
+        """
+        return not self.__eq__(other)
+
+    def difference(self, other, align=False, key_column=None):
+        """ Get difference with another worksheet
+
+        Args:
+            other (:obj:`ColumnarWorksheet`): other worksheet
+            align (:obj:`bool`, optional): if :obj:`True`, align the rows of the worksheets (see
+                :obj:`Worksheet.difference`)
+            key_column (:obj:`int`, optional): index of the column whose values are used to align the rows of the
+                worksheets (see :obj:`Worksheet.difference`)
+
+        Returns:
+            :obj:`WorksheeDifference`: dictionary of differences, grouped by row
+
+        Raises:
+            :obj:`ValueError`: if other is not an instance of `ColumnarWorksheet`
+        """
+        if other.__class__ is not self.__class__:
+            raise ValueError('`other` must be an instance of `ColumnarWorksheet`')
+
+        return self.to_worksheet().difference(other.to_worksheet(), align=align, key_column=key_column)
+
+    def remove_empty_final_rows(self):
+        """ Remove empty final rows """
+        n_rows = max((column.get_extent() for column in self.columns), default=0)
+        self.columns = [column[0:n_rows] for column in self.columns]
+        self._n_rows = n_rows
+
+    def remove_empty_final_cols(self):
+        """ Remove empty final columns """
+        while self.columns and self.columns[-1].get_extent() == 0:
+            self.columns.pop()
+
+    def to_numpy(self, head_rows=0):
+        """ Get the data of the worksheet as a two-dimensional NumPy array
+
+        If the data columns have the same numeric or boolean type and no empty cells, the array has this type.
+        Otherwise, the array is an array of objects. The array of a single such column is a view of the column.
+
+        Args:
+            head_rows (:obj:`int`, optional): number of head rows to exclude
+
+        Returns:
+            :obj:`numpy.ndarray`: data
+        """
+        columns = [column[head_rows:] for column in self.columns]
+        n_rows = max(self._n_rows - head_rows, 0)
+
+        if columns and all(column.is_dense() for column in columns) \
+                and len(set(column.values.dtype for column in columns)) == 1:
+            if len(columns) == 1:
+                return columns[0].values.reshape((n_rows, 1))
+            return numpy.column_stack([column.values for column in columns])
+
+        array = numpy.empty((n_rows, len(columns)), dtype=object)
+        for i_col, column in enumerate(columns):
+            array[:, i_col] = column.to_list()
+        return array
+
+    def to_pandas(self, head_rows=1):
+        """ Get the data of the worksheet as a :obj:`pandas.DataFrame`
+
+        Typed columns are passed to pandas as typed arrays rather than as Python objects: dense columns as NumPy
+        arrays and columns with empty cells as pandas masked arrays, which share the values and masks of the columns.
+
+        Args:
+            head_rows (:obj:`int`, optional): number of head rows; the last is used for the names of the columns
+
+        Returns:
+            :obj:`pandas.DataFrame`: data
+        """
+        import pandas  # optional dependency
+
+        columns = [column[head_rows:] for column in self.columns]
+        if head_rows:
+            names = list(self[head_rows - 1])
+        else:
+            names = list(range(len(columns)))
+
+        masked_array_types = {
+            'b': pandas.arrays.BooleanArray,
+            'i': pandas.arrays.IntegerArray,
+            'f': getattr(pandas.arrays, 'FloatingArray', None),
+        }
+
+        data = {}
+        for i_col, column in enumerate(columns):
+            masked_array_type = masked_array_types[column.values.dtype.kind] if column.mask is not None else None
+            if column.is_dense():
+                data[i_col] = column.values
+            elif masked_array_type and not column.others:
+                data[i_col] = masked_array_type(column.values, column.mask)
+            else:
+                values = numpy.empty((len(column),), dtype=object)
+                values[:] = column.to_list()
+                data[i_col] = values
+
+        data_frame = pandas.DataFrame(data, index=range(max(self._n_rows - head_rows, 0)))
+        data_frame.columns = names
+        return data_frame
+
+
+class WorksheetColumn(object):
+    """ Column of a :obj:`ColumnarWorksheet`
+
+    Attributes:
+        values (:obj:`numpy.ndarray`): values; for typed columns, the values of empty cells and cells in
+            :obj:`others` are undefined
+        mask (:obj:`numpy.ndarray`): for typed columns, boolean array which indicates the cells whose values are not
+            in :obj:`values`; :obj:`None` for columns of objects
+        others (:obj:`dict`): for typed columns, dictionary which maps the indices of cells whose values have
+            other types to their values
+    """
+
+    TYPES = {
+        bool: numpy.bool_,
+        int: numpy.int64,
+        float: numpy.float64,
+    }
+    # :obj:`dict`: dictionary which maps the types of typed columns to NumPy data types
+
+    INT_MIN = int(numpy.iinfo(numpy.int64).min)
+    # :obj:`int`: minimum integer which can be stored in a typed column
+
+    INT_MAX = int(numpy.iinfo(numpy.int64).max)
+    # :obj:`int`: maximum integer which can be stored in a typed column
+
+    def __init__(self, values, mask=None, others=None):
+        """
+        Args:
+            values (:obj:`numpy.ndarray`): values
+            mask (:obj:`numpy.ndarray`, optional): for typed columns, boolean array which indicates the cells
+                whose values are not in :obj:`values`
+            others (:obj:`dict`, optional): for typed columns, dictionary which maps the indices of cells whose
+                values have other types to their values
+        """
+        self.values = values
+        self.mask = mask
+        self.others = others or {}
+
+    @classmethod
+    def from_values(cls, values):
+        """ Create a column, inferring its type from its values
+
+        A column is typed if more than half of its non-empty cells are booleans, integers which fit in 64 bits, or
+        floats of the same type.
+
+        Args:
+            values (:obj:`iterable`): values
+
+        Returns:
+            :obj:`WorksheetColumn`: column
+        """
+        values = list(values)
+        counts = {type: 0 for type in cls.TYPES.keys()}
+        n_non_empty = 0
+        for value in values:
+            if value is None or value == '':
+                continue
+            n_non_empty += 1
+            if value.__class__ in counts and (value.__class__ is not int or cls.INT_MIN <= value <= cls.INT_MAX):
+                counts[value.__class__] += 1
+
+        type, count = max(counts.items(), key=lambda type_count: type_count[1])
+        if count * 2 <= n_non_empty:
+            array = numpy.empty((len(values),), dtype=object)
+            array[:] = values
+            return cls(array)
+
+        typed_values = []
+        mask = []
+        others = {}
+        for i_row, value in enumerate(values):
+            if value.__class__ is type and (type is not int or cls.INT_MIN <= value <= cls.INT_MAX):
+                typed_values.append(value)
+                mask.append(False)
+            else:
+                typed_values.append(False)
+                mask.append(True)
+                if value is not None and value != '':
+                    others[i_row] = value
+        return cls(numpy.array(typed_values, dtype=cls.TYPES[type]), numpy.array(mask, dtype=bool), others)
+
+    def __len__(self):
+        """ Get the number of cells
+
+        Returns:
+            :obj:`int`: number of cells
+        """
+        return self.values.shape[0]
+
+    def __getitem__(self, i_row):
+        """ Get the value of a cell or a range of cells
+
+        Args:
+            i_row (:obj:`int` or :obj:`slice`): row index or range of row indices
+
+        Returns:
+            :obj:`object` or :obj:`WorksheetColumn`: value or range of cells; ranges are views of the column
+        """
+        if isinstance(i_row, slice):
+            if self.mask is None:
+                return self.__class__(self.values[i_row])
+            rows = range(len(self))[i_row]
+            others = {rows.index(i): value for i, value in self.others.items() if i in rows}
+            return self.__class__(self.values[i_row], self.mask[i_row], others)
+
+        if self.mask is None:
+            return self.values[i_row]
+        if i_row < 0:
+            i_row += len(self)
+        if self.mask[i_row]:
+            return self.others.get(i_row, None)
+        return self.values[i_row].item()
+
+    def __eq__(self, other):
+        """ Compare two columns
+
+        Args:
+            other (:obj:`WorksheetColumn`): other column
+
+        Returns:
+            :obj:`bool`: True if columns are semantically equal
+        """
+        if other.__class__ is not self.__class__ or len(self) != len(other):
+            return False
+
+        if self.mask is not None and other.mask is not None and self.values.dtype == other.values.dtype:
+            return numpy.array_equal(self.mask, other.mask) \
+                and numpy.array_equal(self.values[~self.mask], other.values[~other.mask]) \
+                and self.others == other.others
+
+        return Row(self.to_list()) == Row(other.to_list())
+
+    def __ne__(self, other):
+        """ Compare two columns
+
+        Args:
+            other (:obj:`WorksheetColumn`): other column
+
+        Returns:
+            :obj:`bool`: True if columns are semantically unequal
+        """
+        return not self.__eq__(other)
+
+    def is_dense(self):
+        """ Determine whether all of the values of the column are in its typed array
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the column is typed and none of its cells are empty or have other types
+        """
+        return self.mask is not None and not self.mask.any()
+
+    def get_extent(self):
+        """ Get the number of cells up to and including the last non-empty cell
+
+        Returns:
+            :obj:`int`: number of cells up to and including the last non-empty cell
+        """
+        if self.mask is None:
+            for i_rev_row, value in enumerate(reversed(self.values.tolist())):
+                if value not in (None, ''):
+                    return len(self) - i_rev_row
+            return 0
+
+        i_rows = numpy.flatnonzero(~self.mask)
+        return max(int(i_rows[-1]) + 1 if i_rows.size else 0,
+                   max(self.others.keys(), default=-1) + 1)
+
+    def to_list(self):
+        """ Get the values of the column
+
+        Returns:
+            :obj:`list`: values; empty cells of typed columns are :obj:`None`
+        """
+        values = self.values.tolist()
+        if self.mask is not None:
+            for i_row in numpy.flatnonzero(self.mask).tolist():
+                values[i_row] = None
+            for i_row, value in self.others.items():
+                values[i_row] = value
+        return values
+
+
 class Formula(object):
     """ Formula for a cell
 
@@ -313,12 +1435,8 @@ class WorkbookDifference(dict):
         Returns:
             :obj:`str`: string representation
         """
-        diff = ''
-
-        for name, sheet in self.items():
-            diff += '\nSheet {}:\n  {}'.format(name, str(sheet).replace('\n', '\n  '))
-
-        return diff[1:]
+        return '\n'.join('Sheet {}:\n  {}'.format(name, str(sheet).replace('\n', '\n  '))
+                         for name, sheet in self.items())
 
 
 class WorksheetDifference(collections.OrderedDict):
@@ -330,12 +1448,29 @@ class WorksheetDifference(collections.OrderedDict):
         Returns:
             :obj:`str`: string representation
         """
-        diff = ''
+        return '\n'.join('{}:\n  {}'.format(self.get_row_label(i_row), str(row).replace('\n', '\n  '))
+                         for i_row, row in self.items())
+
+    @staticmethod
+    def get_row_label(i_row):
+        """ Get a label for the row(s) of a difference
+
+        Args:
+            i_row (:obj:`int` or :obj:`tuple`): index of a row, or pair of indices of a row in the worksheet and in
+                the other worksheet
 
-        for i_row, row in self.items():
-            diff += '\nRow {}:\n  {}'.format(i_row + 1, str(row).replace('\n', '\n  '))
+        Returns:
+            :obj:`str`: label
+        """
+        if not isinstance(i_row, tuple):
+            return 'Row {}'.format(i_row + 1)
 
-        return diff[1:]
+        i_row_self, i_row_other = i_row
+        if i_row_self is None:
+            return 'Row {} of other'.format(i_row_other + 1)
+        if i_row_other is None or i_row_other == i_row_self:
+            return 'Row {}'.format(i_row_self + 1)
+        return 'Row {} (row {} of other)'.format(i_row_self + 1, i_row_other + 1)
 
 
 class RowDifference(collections.OrderedDict):
@@ -347,12 +1482,8 @@ class RowDifference(collections.OrderedDict):
         Returns:
             :obj:`str`: string representation
         """
-        diff = ''
-
-        for i_col, cell_diff in self.items():
-            diff += '\nCell {}: {}'.format(get_column_letter(i_col + 1), cell_diff.replace('\n', '\n  '))
-
-        return diff[1:]
+        return '\n'.join('Cell {}: {}'.format(get_column_letter(i_col + 1), cell_diff.replace('\n', '\n  '))
+                         for i_col, cell_diff in self.items())
 
 
 class CellDifference(str):
@@ -8,9 +8,11 @@
 """
 
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from glob import glob
-from itertools import chain
+from io import BytesIO
+from itertools import chain, zip_longest
 from math import isnan, isinf
 from natsort import natsorted, ns
 from openpyxl import load_workbook
@@ -18,14 +20,27 @@ from openpyxl.cell.cell import Cell
 from openpyxl.styles import Font, PatternFill
 from openpyxl.styles.colors import Color
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.xml.constants import SHEET_MAIN_NS, REL_NS, PKG_REL_NS
+from openpyxl.xml.functions import fromstring, iterparse, tostring
 from os.path import basename, dirname, splitext
 from shutil import copyfile
-from wc_utils.workbook.core import Workbook, Worksheet, Row, Formula
+from wc_utils.workbook import binary
+from wc_utils.workbook.core import (Workbook, LazyWorkbook, Worksheet, ColumnarWorksheet, WorksheetColumn, Row,
+                                    Formula)
+import bisect
 import copy
+import csv
 import enum
+import hashlib
+import heapq
+import numpy
+import os
 import openpyxl.cell.cell
-import pyexcel
+import posixpath
+import re
 import xlsxwriter
+import zipfile
 
 
 class Writer(object, metaclass=ABCMeta):
@@ -35,6 +50,10 @@ class Writer(object, metaclass=ABCMeta):
         path (:obj:`str`): path to file(s)
     """
 
+    INDEPENDENT_WORKSHEETS = False
+    # :obj:`bool`: if :obj:`True`, each worksheet is written to a separate file, and worksheets can be written
+    # concurrently
+
     def __init__(self, path, title=None, description=None, keywords=None, version=None, language=None, creator=None):
         """
         Args:
@@ -54,26 +73,57 @@ class Writer(object, metaclass=ABCMeta):
         self.language = language
         self.creator = creator
 
-    def run(self, data, style=None, validation=None, protected=False):
+    def run(self, data, style=None, validation=None, protected=False, max_workers=None, executor=None):
         """ Write workbook to file(s)
 
+        If each worksheet is written to a separate file (see :obj:`INDEPENDENT_WORKSHEETS`), worksheets can
+        optionally be written concurrently by a pool of workers. Each worker writes its worksheets with a copy of the
+        writer.
+
         Args:
             data (:obj:`Workbook`): python representation of data; each element must be a string, boolean, integer, float, or NoneType
             style (:obj:`WorkbookStyle`, optional): workbook style
             validation (:obj:`WorkbookValidation`, optional): validation
             protected (:obj:`bool`, optional): if :obj:`True`, protect the worksheet
+            max_workers (:obj:`int`, optional): if greater than 1 and worksheets are written to separate files, write
+                worksheets concurrently with a pool of up to this many processes
+            executor (:obj:`concurrent.futures.Executor`, optional): pool of workers to write worksheets to separate
+                files concurrently; takes precedence over :obj:`max_workers`
         """
         self.initialize_workbook()
 
         style = style or WorkbookStyle()
         validation = validation or WorkbookValidation()
-        for ws_name, ws_data in data.items():
-            ws_style = style.get(ws_name, None)
-            ws_validation = validation.get(ws_name, None)
-            self.write_worksheet(ws_name, ws_data, style=ws_style, validation=ws_validation, protected=protected)
+        concurrent = self.INDEPENDENT_WORKSHEETS and len(data) > 1
+        if concurrent and executor is not None:
+            self.write_worksheets_concurrently(data, style, validation, protected, executor)
+        elif concurrent and max_workers is not None and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(data))) as executor:
+                self.write_worksheets_concurrently(data, style, validation, protected, executor)
+        else:
+            for ws_name, ws_data in data.items():
+                ws_style = style.get(ws_name, None)
+                ws_validation = validation.get(ws_name, None)
+                self.write_worksheet(ws_name, ws_data, style=ws_style, validation=ws_validation, protected=protected)
 
         self.finalize_workbook()
 
+    def write_worksheets_concurrently(self, data, style, validation, protected, executor):
+        """ Write worksheets concurrently with a pool of workers
+
+        Args:
+            data (:obj:`Workbook`): python representation of data
+            style (:obj:`WorkbookStyle`): workbook style
+            validation (:obj:`WorkbookValidation`): validation
+            protected (:obj:`bool`): if :obj:`True`, protect the worksheets
+            executor (:obj:`concurrent.futures.Executor`): pool of workers
+        """
+        futures = [executor.submit(_write_worksheet, copy.copy(self), ws_name, ws_data,
+                                   style.get(ws_name, None), validation.get(ws_name, None), protected)
+                   for ws_name, ws_data in data.items()]
+        for future in futures:
+            future.result()
+
     @abstractmethod
     def initialize_workbook(self):
         """ Initialize workbook """
@@ -103,29 +153,74 @@ class Reader(object, metaclass=ABCMeta):
 
     Attributes:
         path (:obj:`str`): path to file(s)
+        columnar (:obj:`bool`): if :obj:`True`, read worksheets into instances of :obj:`ColumnarWorksheet`
     """
 
-    def __init__(self, path):
+    def __init__(self, path, columnar=False):
         """
         Args:
             path (:obj:`str`): path to file(s)
+            columnar (:obj:`bool`, optional): if :obj:`True`, read worksheets into instances of :obj:`ColumnarWorksheet`
         """
         self.path = path
+        self.columnar = columnar
 
-    def run(self):
+    def run(self, max_workers=None, executor=None, columns=None, row_filter=None):
         """ Read data from file(s)
 
+        Worksheets can optionally be read concurrently by a pool of workers. Each worker opens its own copy of
+        the file(s) with a copy of the reader, which makes this most useful for collections of comma separated (.csv)
+        or tab separated (.tsv) files.
+
+        Args:
+            max_workers (:obj:`int`, optional): if greater than 1, read worksheets concurrently with a pool of up to
+                this many processes
+            executor (:obj:`concurrent.futures.Executor`, optional): pool of workers to read the worksheets
+                concurrently; takes precedence over :obj:`max_workers`
+            columns (:obj:`list` or :obj:`dict`, optional): indices (0-based) and/or names of the columns to read
+                from each worksheet (see :obj:`read_worksheet`), or a dictionary which maps the names of worksheets
+                to the columns to read from them; worksheets which aren't in the dictionary are read entirely
+            row_filter (:obj:`callable`, optional): function which returns :obj:`True` for each row that should be
+                read (see :obj:`read_worksheet`); must be picklable to read worksheets concurrently with a pool of
+                processes
+
         Returns:
             :obj:`Workbook`: python representation of data
         """
         workbook = self.initialize_workbook()
 
         names = self.get_sheet_names()
-        for name in names:
-            workbook[name] = self.read_worksheet(name)
+        if len(names) > 1 and executor is not None:
+            self.read_worksheets_concurrently(workbook, names, executor, columns=columns, row_filter=row_filter)
+        elif len(names) > 1 and max_workers is not None and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+                self.read_worksheets_concurrently(workbook, names, executor, columns=columns, row_filter=row_filter)
+        else:
+            for name in names:
+                workbook[name] = self.read_worksheet(name, columns=get_sheet_columns(columns, name),
+                                                     row_filter=row_filter)
+
+        self.finalize_workbook()
 
         return workbook
 
+    def read_worksheets_concurrently(self, workbook, sheet_names, executor, columns=None, row_filter=None):
+        """ Read worksheets concurrently with a pool of workers and add them to a workbook in the order of their names
+
+        Args:
+            workbook (:obj:`Workbook`): workbook to add the worksheets to
+            sheet_names (:obj:`list` of :obj:`str`): names of the sheets to read
+            executor (:obj:`concurrent.futures.Executor`): pool of workers
+            columns (:obj:`list` or :obj:`dict`, optional): columns to read (see :obj:`run`)
+            row_filter (:obj:`callable`, optional): function which returns :obj:`True` for each row that should be
+                read
+        """
+        futures = [executor.submit(_read_worksheet, copy.copy(self), name,
+                                   get_sheet_columns(columns, name), row_filter)
+                   for name in sheet_names]
+        for name, future in zip(sheet_names, futures):
+            workbook[name] = future.result()
+
     @abstractmethod
     def initialize_workbook(self):
         """ Initialize workbook
@@ -145,29 +240,215 @@ class Reader(object, metaclass=ABCMeta):
         pass  # pragma: no cover
 
     @abstractmethod
-    def read_worksheet(self, sheet_name, ignore_empty_final_rows=True, ignore_empty_final_cols=True):
+    def read_worksheet(self, sheet_name, ignore_empty_final_rows=True, ignore_empty_final_cols=True,
+                       columns=None, row_filter=None):
         """ Read data from file
 
+        Optionally, only some of the columns and rows can be read. The selected columns are read in the order in
+        which they are listed. Columns can be selected by their indices (0-based) or by their names in the first
+        row of the worksheet. The row filter is applied to the selected columns of each row (including the first
+        row), and empty final rows and columns are ignored after the columns and rows have been selected.
+
         Args:
             sheet_name (:obj:`str`): sheet name
             ignore_empty_final_rows (:obj:`bool`, optional): if :obj:`True`, ignore empty final rows
             ignore_empty_final_cols (:obj:`bool`, optional): if :obj:`True`, ignore empty final columns
+            columns (:obj:`list` of :obj:`int` or :obj:`str`, optional): indices and/or names of the columns to read;
+                if :obj:`None`, read all of the columns
+            row_filter (:obj:`callable`, optional): function which returns :obj:`True` for each row that should be
+                read
 
         Returns:
             :obj:`Worksheet`: data
         """
         pass  # pragma: no cover
 
+    def get_sheet_digests(self, sheet_names):
+        """ Get digests of the content of worksheets, e.g., to determine whether they changed since they were
+        previously read
+
+        Args:
+            sheet_names (:obj:`list` of :obj:`str`): sheet names
+
+        Returns:
+            :obj:`dict`: dictionary which maps the name of each sheet to a digest of its content
+
+        Raises:
+            :obj:`NotImplementedError`: if the reader doesn't support digests
+        """
+        raise NotImplementedError('{} does not support digests of worksheets'.format(
+            self.__class__.__name__))  # pragma: no cover
+
+    def read_rows(self, sheet_name, columns=None):
+        """ Read the rows of a worksheet, one at a time, in a single pass
+
+        By default, the rows are read from the worksheet returned by :obj:`read_worksheet`. Readers which can read the
+        rows of a worksheet without materializing it should override this method.
+
+        Args:
+            sheet_name (:obj:`str`): sheet name
+            columns (:obj:`list` of :obj:`int` or :obj:`str`, optional): indices and/or names of the columns to read
+                (see :obj:`get_column_indices`); if :obj:`None`, read all of the columns
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`Row`: rows of the worksheet, including any empty final rows and columns
+        """
+        rows = self.read_worksheet(sheet_name, ignore_empty_final_rows=False, ignore_empty_final_cols=False)
+        if columns is not None:
+            rows = self.project_rows(sheet_name, rows, columns)
+        for row in rows:
+            yield row
+
+    def get_column_indices(self, sheet_name, columns, head_row):
+        """ Get the indices of columns selected by their indices and/or names
+
+        Args:
+            sheet_name (:obj:`str`): sheet name
+            columns (:obj:`list` of :obj:`int` or :obj:`str`): indices (0-based) and/or names of columns
+            head_row (:obj:`Row`): first row of the worksheet, which contains the names of its columns
+
+        Returns:
+            :obj:`list` of :obj:`int`: indices of the columns
+
+        Raises:
+            :obj:`ValueError`: if an index is negative or the worksheet doesn't have a column with a name
+        """
+        indices = []
+        for column in columns:
+            if isinstance(column, int) and not isinstance(column, bool):
+                if column < 0:
+                    raise ValueError('Column indices must be non-negative: {}'.format(column))
+                indices.append(column)
+            elif column in head_row:
+                indices.append(head_row.index(column))
+            else:
+                raise ValueError('Worksheet "{}" of {} does not have column "{}"'.format(sheet_name, self.path, column))
+        return indices
+
+    def project_rows(self, sheet_name, rows, columns):
+        """ Select columns of rows of cell values
+
+        Args:
+            sheet_name (:obj:`str`): sheet name
+            rows (:obj:`iterable` of :obj:`Row`): rows of cell values
+            columns (:obj:`list` of :obj:`int` or :obj:`str`): indices and/or names of the columns to select
+                (see :obj:`get_column_indices`)
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`Row`: selected columns of the rows
+        """
+        indices = None
+        for row in rows:
+            if indices is None:
+                indices = self.get_column_indices(sheet_name, columns, row)
+            n_cols = len(row)
+            yield Row([row[i_col] if i_col < n_cols else None for i_col in indices])
+
+    def iter_rows(self, sheet_name, ignore_empty_final_rows=True):
+        """ Iterate over the rows of a worksheet, one at a time, without materializing the worksheet
+
+        Empty rows are held back until a subsequent non-empty row is read so that empty final rows can be ignored.
+
+        Args:
+            sheet_name (:obj:`str`): sheet name
+            ignore_empty_final_rows (:obj:`bool`, optional): if :obj:`True`, ignore empty final rows
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`Row`: rows of the worksheet
+        """
+        empty_rows = []
+        for row in self.read_rows(sheet_name):
+            if ignore_empty_final_rows and next((False for cell in row if cell not in (None, '')), True):
+                empty_rows.append(row)
+            else:
+                for empty_row in empty_rows:
+                    yield empty_row
+                empty_rows = []
+                yield row
+
+    def build_worksheet(self, rows, ignore_empty_final_rows=True, ignore_empty_final_cols=True):
+        """ Build a worksheet from rows of cell values
+
+        The extent of the non-empty cells is tracked while the rows are materialized so that empty final rows and
+        columns can be trimmed without reading any cell a second time.
+
+        Args:
+            rows (:obj:`iterable` of :obj:`Row`): rows of cell values
+            ignore_empty_final_rows (:obj:`bool`, optional): if :obj:`True`, ignore empty final rows
+            ignore_empty_final_cols (:obj:`bool`, optional): if :obj:`True`, ignore empty final columns
+
+        Returns:
+            :obj:`Worksheet` or :obj:`ColumnarWorksheet`: data; a :obj:`ColumnarWorksheet` if :obj:`columnar` is
+                :obj:`True`
+        """
+        worksheet = Worksheet()
+
+        max_row = 0
+        max_col = 0
+        n_cols = 0
+        for i_row, row in enumerate(rows, 1):
+            worksheet.append(row)
+            n_cols = max(n_cols, len(row))
+            for i_rev_col, cell in enumerate(reversed(row)):
+                if cell not in (None, ''):
+                    max_row = i_row
+                    max_col = max(max_col, len(row) - i_rev_col)
+                    break
+
+        if ignore_empty_final_rows:
+            del worksheet[max_row:]
+
+        if not ignore_empty_final_cols:
+            max_col = n_cols
+
+        for i_row, row in enumerate(worksheet):
+            if len(row) > max_col:
+                worksheet[i_row] = row[0:max_col]
+            elif len(row) < max_col:
+                row.extend([None] * (max_col - len(row)))
+
+        if self.columnar:
+            return ColumnarWorksheet.from_rows(worksheet)
+        return worksheet
+
+    def finalize_workbook(self):
+        """ Finalize workbook, releasing any open file handles """
+        pass
+
+    def __enter__(self):
+        """ Open the file(s) for reading, e.g., with :obj:`iter_rows`
+
+        Returns:
+            :obj:`Reader`: reader
+        """
+        self.initialize_workbook()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """ Release the file(s)
+
+        Args:
+            type (:obj:`type`): type of exception, if any
+            value (:obj:`Exception`): exception, if any
+            traceback (:obj:`traceback`): traceback, if any
+        """
+        self.finalize_workbook()
+
 
 class ExcelWriter(Writer):
     """ Write data to Excel file
 
+    In constant memory mode, each row is flushed to the file as soon as the next row is written. In this mode,
+    worksheets can be iterators of rows. Because rows can't be revisited, merge ranges must be contained within
+    single rows and, for iterators, the width of each worksheet is determined by its first row.
+
     Attributes:
+        constant_memory (:obj:`bool`): if :obj:`True`, write rows in order and flush them to the file
         xls_workbook (:obj:`xlsxwriter.Workbook`): Excel workbook
     """
 
     def __init__(self, path, title=None, description=None, keywords=None, version=None, language=None,
-                 creator=None):
+                 creator=None, constant_memory=False):
         """
         Args:
             path (:obj:`str`): path to file(s)
@@ -177,6 +458,7 @@ class ExcelWriter(Writer):
             version (:obj:`str`, optional): version
             language (:obj:`str`, optional): language
             creator (:obj:`str`, optional): creator
+            constant_memory (:obj:`bool`, optional): if :obj:`True`, write rows in order and flush them to the file
 
         Raises:
             :obj:`ValueError`: if file extension is not '.xlsx'
@@ -188,18 +470,22 @@ class ExcelWriter(Writer):
         super(ExcelWriter, self).__init__(path,
                                           title=title, description=description,
                                           keywords=keywords, version=version, language=language, creator=creator)
+        self.constant_memory = constant_memory
         self.xls_workbook = None
         self._worksheet_styles = None
+        self._xls_formats = None
 
     def initialize_workbook(self):
         """ Initialize workbook """
         # Initialize workbook
+        self._xls_formats = {}
         self.xls_workbook = wb = xlsxwriter.Workbook(self.path, {
             'strings_to_numbers': False,
             'strings_to_formulas': False,
             'strings_to_urls': False,
             'nan_inf_to_errors': True,
             'default_date_format': 'yyyy-mm-dd',
+            'constant_memory': self.constant_memory,
         })
 
         # set metadata
@@ -221,11 +507,16 @@ class ExcelWriter(Writer):
 
         Args:
             sheet_name (:obj:`str`): sheet name
-            data (:obj:`Worksheet`): python representation of data; each element must be a string, boolean, integer, float, or NoneType
+            data (:obj:`Worksheet` or :obj:`iterator` of :obj:`Row`): python representation of data; each element must be
+                a string, boolean, integer, float, or NoneType
             style (:obj:`WorksheetStyle`, optional): worksheet style
             validation (:obj:`WorksheetValidation`, optional): worksheet validation
             protected (:obj:`bool`, optional): if :obj:`True`, protect the worksheet
             include_help_comments (:obj:`bool`, optional): if :obj:`True`, include help comments
+
+        Raises:
+            :obj:`ValueError`: if in constant memory mode, a merge range spans multiple rows or is beyond the data, or
+                a row of an iterator is wider than its first row
         """
         xls_worksheet = self.xls_workbook.add_worksheet(sheet_name)
 
@@ -256,124 +547,91 @@ class ExcelWriter(Writer):
 
         style = style or WorksheetStyle()
 
-        title_format = self.xls_workbook.add_format()
-        title_format.set_align('left')
-        title_format.set_align('top')
-        title_format.set_text_wrap(False)
-        title_format.set_font_name(style.font_family)
-        title_format.set_font_size(style.font_size)
-        title_format.set_bold(style.title_row_font_bold)
-        if style.title_row_fill_pattern:
-            if style.title_row_fill_pattern == 'solid':
-                title_format.set_pattern(1)
-            else:
-                raise ValueError('Unsupported pattern {}'.format(style.title_row_fill_pattern))
-        if style.title_row_fill_fgcolor:
-            title_format.set_fg_color('#' + style.title_row_fill_fgcolor)
-        title_format.set_locked(True)
-
-        head_format = self.xls_workbook.add_format()
-        head_format.set_align('left')
-        head_format.set_align('top')
-        head_format.set_text_wrap(True)
-        head_format.set_font_name(style.font_family)
-        head_format.set_font_size(style.font_size)
-        head_format.set_bold(style.head_row_font_bold)
-        if style.head_row_fill_pattern:
-            if style.head_row_fill_pattern == 'solid':
-                head_format.set_pattern(1)
-            else:
-                raise ValueError('Unsupported pattern {}'.format(style.head_row_fill_pattern))
-        if style.head_row_fill_fgcolor:
-            head_format.set_fg_color('#' + style.head_row_fill_fgcolor)
-        head_format.set_locked(True)
-
-        blank_head_format = self.xls_workbook.add_format()
-        blank_head_format.set_align('left')
-        blank_head_format.set_align('top')
-        blank_head_format.set_text_wrap(True)
-        blank_head_format.set_font_name(style.font_family)
-        blank_head_format.set_font_size(style.font_size)
-        blank_head_format.set_bold(True)
-        if style.head_row_fill_pattern:
-            if style.head_row_fill_pattern == 'solid':
-                blank_head_format.set_pattern(1)
-            else:  # pragma: no cover # unreachable because error already checked above
-                raise ValueError('Unsupported pattern {}'.format(style.head_row_fill_pattern))
-        if style.blank_head_fill_fgcolor:
-            blank_head_format.set_fg_color('#' + style.blank_head_fill_fgcolor)
-        blank_head_format.set_locked(True)
-
-        extra_head_format = self.xls_workbook.add_format()
-        extra_head_format.set_align('left')
-        extra_head_format.set_align('top')
-        extra_head_format.set_text_wrap(True)
-        extra_head_format.set_font_name(style.font_family)
-        extra_head_format.set_font_size(style.font_size)
-        extra_head_format.set_bold(True)
-        if style.head_row_fill_pattern:
-            if style.head_row_fill_pattern == 'solid':
-                extra_head_format.set_pattern(1)
-            else:  # pragma: no cover # unreachable because error already checked above
-                raise ValueError('Unsupported pattern {}'.format(style.head_row_fill_pattern))
-        if style.head_row_fill_fgcolor:
-            extra_head_format.set_fg_color('#' + style.head_row_fill_fgcolor)
-        extra_head_format.set_locked(False)
-
-        merged_head_format = self.xls_workbook.add_format()
-        merged_head_format.set_align('center')
-        merged_head_format.set_align('top')
-        merged_head_format.set_text_wrap(True)
-        merged_head_format.set_font_name(style.font_family)
-        merged_head_format.set_font_size(style.font_size)
-        merged_head_format.set_bold(True)
-        if style.head_row_fill_pattern:
-            if style.head_row_fill_pattern == 'solid':
-                merged_head_format.set_pattern(1)
-            else:  # pragma: no cover # unreachable because error already checked above
-                raise ValueError('Unsupported pattern {}'.format(style.head_row_fill_pattern))
-        if style.merged_head_fill_fgcolor:
-            merged_head_format.set_fg_color('#' + style.merged_head_fill_fgcolor)
-        merged_head_format.set_locked(True)
-
-        body_format = self.xls_workbook.add_format()
-        body_format.set_align('left')
-        body_format.set_align('top')
-        body_format.set_text_wrap(True)
-        body_format.set_font_name(style.font_family)
-        body_format.set_font_size(style.font_size)
-        body_format.set_bold(False)
-        body_format.set_locked(False)
-
-        merge_body_format = self.xls_workbook.add_format()
-        merge_body_format.set_align('center')
-        merge_body_format.set_align('vcenter')
-        merge_body_format.set_text_wrap(True)
-        merge_body_format.set_font_name(style.font_family)
-        merge_body_format.set_font_size(style.font_size)
-        merge_body_format.set_bold(False)
-        merge_body_format.set_locked(False)
-
-        n_rows = len(data)
-        if data:
-            n_cols = max(len(row) for row in data)
+        for fill_pattern in (style.title_row_fill_pattern, style.head_row_fill_pattern):
+            if fill_pattern and fill_pattern != 'solid':
+                raise ValueError('Unsupported pattern {}'.format(fill_pattern))
+
+        title_format = self.get_xls_format(
+            align='left', valign='top', text_wrap=False,
+            font_name=style.font_family, font_size=style.font_size, bold=style.title_row_font_bold,
+            pattern=1 if style.title_row_fill_pattern else None,
+            fg_color='#' + style.title_row_fill_fgcolor if style.title_row_fill_fgcolor else None,
+            locked=True)
+
+        head_format = self.get_xls_format(
+            align='left', valign='top', text_wrap=True,
+            font_name=style.font_family, font_size=style.font_size, bold=style.head_row_font_bold,
+            pattern=1 if style.head_row_fill_pattern else None,
+            fg_color='#' + style.head_row_fill_fgcolor if style.head_row_fill_fgcolor else None,
+            locked=True)
+
+        blank_head_format = self.get_xls_format(
+            align='left', valign='top', text_wrap=True,
+            font_name=style.font_family, font_size=style.font_size, bold=True,
+            pattern=1 if style.head_row_fill_pattern else None,
+            fg_color='#' + style.blank_head_fill_fgcolor if style.blank_head_fill_fgcolor else None,
+            locked=True)
+
+        extra_head_format = self.get_xls_format(
+            align='left', valign='top', text_wrap=True,
+            font_name=style.font_family, font_size=style.font_size, bold=True,
+            pattern=1 if style.head_row_fill_pattern else None,
+            fg_color='#' + style.head_row_fill_fgcolor if style.head_row_fill_fgcolor else None,
+            locked=False)
+
+        merged_head_format = self.get_xls_format(
+            align='center', valign='top', text_wrap=True,
+            font_name=style.font_family, font_size=style.font_size, bold=True,
+            pattern=1 if style.head_row_fill_pattern else None,
+            fg_color='#' + style.merged_head_fill_fgcolor if style.merged_head_fill_fgcolor else None,
+            locked=True)
+
+        body_format = self.get_xls_format(
+            align='left', valign='top', text_wrap=True,
+            font_name=style.font_family, font_size=style.font_size, bold=False,
+            locked=False)
+
+        merge_body_format = self.get_xls_format(
+            align='center', valign='vcenter', text_wrap=True,
+            font_name=style.font_family, font_size=style.font_size, bold=False,
+            locked=False)
+
+        if not hasattr(data, '__len__') and not self.constant_memory:
+            data = list(data)
+        if hasattr(data, '__len__'):
+            n_cols = max((len(row) for row in data), default=0)
         else:
-            n_cols = 0
+            # in constant memory mode, the width of an iterator of rows is determined by its first row
+            data = iter(data)
+            first_row = next(data, None)
+            if first_row is None:
+                n_cols = 0
+                data = []
+            else:
+                n_cols = len(first_row)
+                data = chain([first_row], data)
+
         frozen_rows = style.title_rows + style.head_rows
         frozen_columns = style.head_columns
         row_height = style.row_height
         col_width = style.col_width
 
-        if isinf(style.extra_rows):
-            extra_rows = min(100, 2**20 - n_rows)
-        else:
-            extra_rows = style.extra_rows
-
         if isinf(style.extra_columns):
             extra_columns = min(100, 2**14 - n_cols)
         else:
             extra_columns = style.extra_columns
 
+        # merge ranges
+        MergeRanges(style.merge_ranges).validate(sheet_name)
+        if self.constant_memory:
+            merge_ranges = {}
+            for merge_range in style.merge_ranges:
+                row_start, col_start, row_end, col_end = merge_range
+                if row_end != row_start:
+                    raise ValueError(('Merge range {} of worksheet "{}" spans multiple rows, which is not supported '
+                                      'in constant memory mode').format(MergeRanges.format_range(merge_range), sheet_name))
+                merge_ranges.setdefault(row_start, []).append(merge_range)
+
         # format rows
         if isnan(row_height):
             default_row_height = None
@@ -382,53 +640,113 @@ class ExcelWriter(Writer):
         hide_unused_rows = not isinf(style.extra_rows)
         xls_worksheet.set_default_row(default_row_height, hide_unused_rows)
 
-        # format columns
-        if not isnan(col_width) and n_cols >= 1 and not isinf(style.extra_columns):
-            result = xls_worksheet.set_column(0, n_cols - 1, width=col_width, options={'hidden': False})
+        # format columns; the formats of the extra columns are the formats of their blank cells. If the rows beyond
+        # the extra rows are hidden, the formats of the other columns are the formats of the blank cells of the extra
+        # rows. Otherwise, the other columns keep the default format so that the cells below the data keep the default
+        # format (e.g., they remain locked in protected worksheets). The extra cells of the head rows are formatted by
+        # the formats of the rows.
+        set_col_width = not isnan(col_width) and n_cols >= 1 and not isinf(style.extra_columns)
+        n_formatted_cols = n_cols + extra_columns
+        first_formatted_col = 0 if hide_unused_rows else n_cols
+        col_bounds = set([first_formatted_col, n_formatted_cols])
+        if first_formatted_col < frozen_columns < n_formatted_cols:
+            col_bounds.add(frozen_columns)
+        if set_col_width:
+            col_bounds.update([0, n_cols])
+        col_bounds = sorted(col_bounds)
+        for first_col, end_col in zip(col_bounds[:-1], col_bounds[1:]):
+            if set_col_width and end_col <= n_cols:
+                width = col_width
+            else:
+                width = None
+            if end_col <= first_formatted_col:
+                format = None
+            elif end_col <= frozen_columns:
+                format = extra_head_format
+            else:
+                format = body_format
+            result = xls_worksheet.set_column(first_col, end_col - 1, width, format, options={'hidden': False})
             if result == -1:
                 raise ValueError("Column is out of bounds")
             assert result in [0, None], "xlsxwriter error: {}".format(result)
 
         # hyperlinks
+        hyperlinks = {}
         for hyperlink in style.hyperlinks:
-            result = xls_worksheet.write_url(hyperlink.i_row, hyperlink.i_col, hyperlink.url, tip=hyperlink.tip)
-            if result == -1:
-                raise ValueError("Cell is out of bounds")
-            elif result == -2:
-                raise ValueError("String must be <= 32,000 characters")
-            elif result == -3:
-                raise ValueError("URL must be <= 2,079 characters")
-            elif result == -4:
-                raise ValueError("Worksheet must have <= 65,530 URLs")
-            assert result in [0, None], "xlsxwriter error: {}".format(result)
+            hyperlinks.setdefault(hyperlink.i_row, []).append(hyperlink)
+
+        def write_hyperlinks(i_row):
+            for hyperlink in hyperlinks.pop(i_row, []):
+                result = xls_worksheet.write_url(hyperlink.i_row, hyperlink.i_col, hyperlink.url, tip=hyperlink.tip)
+                if result == -1:
+                    raise ValueError("Cell is out of bounds")
+                elif result == -2:
+                    raise ValueError("String must be <= 32,000 characters")
+                elif result == -3:
+                    raise ValueError("URL must be <= 2,079 characters")
+                elif result == -4:
+                    raise ValueError("Worksheet must have <= 65,530 URLs")
+                assert result in [0, None], "xlsxwriter error: {}".format(result)
+
+        if not self.constant_memory:
+            for i_row in sorted(hyperlinks.keys()):
+                write_hyperlinks(i_row)
+
+        # help comments; in constant memory mode, these must be written before the rows that they annotate
+        if validation and self.constant_memory:
+            validation.apply_help_comments(xls_worksheet, frozen_rows, frozen_columns,
+                                           include_help_comments=include_help_comments)
 
         # write data
-        def get_format(i_row, i_col, style=style,
-                       title_format=title_format, blank_head_format=blank_head_format,
-                       head_format=head_format, body_format=body_format,
-                       frozen_rows=frozen_rows, frozen_columns=frozen_columns):
+        cell_writers = self.get_cell_writers(xls_worksheet)
+        title_formats = [title_format] * n_cols
+        head_formats = [head_format] * n_cols
+        blank_head_formats = [blank_head_format] * n_cols
+        body_formats = [head_format] * frozen_columns + [body_format] * (n_cols - frozen_columns)
+        blank_body_formats = [blank_head_format] * frozen_columns + [body_format] * (n_cols - frozen_columns)
+
+        n_rows = 0
+        for i_row, row in enumerate(data):
+            if len(row) > n_cols:
+                raise ValueError(('Row {} of worksheet "{}" is wider than the first row; in constant memory mode, '
+                                  'the width of a worksheet is determined by its first row').format(i_row + 1, sheet_name))
+
+            if self.constant_memory:
+                write_hyperlinks(i_row)
+
             if i_row < style.title_rows:
-                format = title_format
-            elif i_row < frozen_rows or i_col < frozen_columns:
-                if value is None or value == '':
-                    format = blank_head_format
-                else:
-                    format = head_format
+                formats = blank_formats = title_formats
+            elif i_row < frozen_rows:
+                formats = head_formats
+                blank_formats = blank_head_formats
             else:
-                format = body_format
-            return format
-
-        for i_row, row in enumerate(data):
-            for i_col, value in enumerate(row + [None] * (n_cols - len(row))):
-                format = get_format(i_row, i_col)
-                self.write_cell(xls_worksheet, sheet_name, i_row, i_col, value, format)
+                formats = body_formats
+                blank_formats = blank_body_formats
+            self.write_row(xls_worksheet, sheet_name, i_row, row, n_cols, formats, blank_formats, cell_writers)
 
-            if not isnan(row_height) and not isinf(style.extra_rows):
-                result = xls_worksheet.set_row(i_row, options={'hidden': False})
+            # format the extra cells of the head rows
+            if i_row < frozen_rows:
+                row_format = extra_head_format
+            else:
+                row_format = None
+            if row_format is not None or (not isnan(row_height) and not isinf(style.extra_rows)):
+                result = xls_worksheet.set_row(i_row, None, row_format, options={'hidden': False})
                 if result == -1:
                     raise ValueError("Row is out of bounds")
                 assert result in [0, None], "xlsxwriter error: {}".format(result)
 
+            if self.constant_memory:
+                for merge_range in merge_ranges.pop(i_row, []):
+                    self.write_merge_range(xls_worksheet, sheet_name, {i_row: row}, merge_range,
+                                           frozen_rows, frozen_columns, merged_head_format, merge_body_format)
+
+            n_rows += 1
+
+        if isinf(style.extra_rows):
+            extra_rows = min(100, 2**20 - n_rows)
+        else:
+            extra_rows = style.extra_rows
+
         # format extra columns
         if not isinf(style.extra_columns):
             result = xls_worksheet.set_column(n_cols + style.extra_columns, 2**14 - 1,
@@ -437,69 +755,47 @@ class ExcelWriter(Writer):
                 raise ValueError("Column is out of bounds")
             assert result in [0, None], "xlsxwriter error: {}".format(result)
 
-        for i_row in range(n_rows):
-            for i_col in range(n_cols, n_cols + extra_columns):
-                if i_row < frozen_rows or i_col < frozen_columns:
-                    format = extra_head_format
-                else:
-                    format = body_format
-                result = xls_worksheet.write_blank(i_row, i_col, None, format)
-                if result == -1:
-                    raise ValueError("Row is out of bounds")
-                assert result in [0, None], "xlsxwriter error: {}".format(result)
-
         # format extra rows
         if not isinf(style.extra_rows):
             for i_row in range(n_rows, n_rows + style.extra_rows):
-                result = xls_worksheet.set_row(i_row, options={'hidden': False})
+                if self.constant_memory:
+                    write_hyperlinks(i_row)
+
+                # the extra rows are shown (unlike the rows beyond them) and formatted by the formats of the columns,
+                # except for the extra head rows
+                if i_row < frozen_rows:
+                    row_format = extra_head_format
+                else:
+                    row_format = None
+                result = xls_worksheet.set_row(i_row, None, row_format, options={'hidden': False})
                 if result == -1:
                     raise ValueError("Row is out of bounds")
                 assert result in [0, None], "xlsxwriter error: {}".format(result)
 
-                for i_col in range(n_cols + extra_columns):
-                    if i_row < frozen_rows or i_col < frozen_columns:
-                        format = extra_head_format
-                    else:
-                        format = body_format
-                    result = xls_worksheet.write_blank(i_row, i_col, None, format)
-                    if result == -1:
-                        raise ValueError("Row is out of bounds")
-                    assert result in [0, None], "xlsxwriter error: {}".format(result)
+        for i_row in sorted(hyperlinks.keys()):
+            write_hyperlinks(i_row)
 
         # merge ranges
-        for row_start, col_start, row_end, col_end in style.merge_ranges:
-            # get data
-            value = set()
-            for i_row in range(row_start, row_end + 1):
-                for i_col in range(col_start, col_end + 1):
-                    if i_col < len(data[i_row]) and data[i_row][i_col] is not None:
-                        value.add(data[i_row][i_col])
-            if len(value) == 0:
-                value = None
-            elif len(value) == 1:
-                value = list(value)[0]
-            else:
-                raise ValueError('Merge range {}{}:{}{} with values {{"{}"}} can have at most 1 value'.format(
-                    get_column_letter(col_start + 1), row_start + 1,
-                    get_column_letter(col_end + 1), row_end + 1,
-                    '", "'.join(str(v) for v in value)))
-
-            if row_start <= frozen_rows or col_start <= frozen_columns:
-                format = merged_head_format
-            else:
-                format = merge_body_format
-            result = xls_worksheet.merge_range(row_start, col_start, row_end, col_end, None)
-            if result == -1:
-                raise ValueError("Range of out of bounds")
-            assert result in [0, None], "xlsxwriter error: {}".format(result)
-            self.write_cell(xls_worksheet, sheet_name, row_start, col_start, value, format)
+        if self.constant_memory:
+            if merge_ranges:
+                raise ValueError('Merge range {} of worksheet "{}" is beyond the data'.format(
+                    MergeRanges.format_range(min(merge_ranges.values())[0]), sheet_name))
+        else:
+            for merge_range in style.merge_ranges:
+                self.write_merge_range(xls_worksheet, sheet_name, data, merge_range,
+                                       frozen_rows, frozen_columns, merged_head_format, merge_body_format)
 
         # validation
         if validation:
-            validation.apply(xls_worksheet,
-                             frozen_rows, frozen_columns,
-                             n_rows + extra_rows - 1, n_cols + extra_columns - 1,
-                             include_help_comments=include_help_comments)
+            if self.constant_memory:
+                validation.apply_validations(xls_worksheet,
+                                             frozen_rows, frozen_columns,
+                                             n_rows + extra_rows - 1, n_cols + extra_columns - 1)
+            else:
+                validation.apply(xls_worksheet,
+                                 frozen_rows, frozen_columns,
+                                 n_rows + extra_rows - 1, n_cols + extra_columns - 1,
+                                 include_help_comments=include_help_comments)
 
         # freeze panes
         xls_worksheet.freeze_panes(frozen_rows, frozen_columns)
@@ -508,6 +804,128 @@ class ExcelWriter(Writer):
         if style.auto_filter and n_cols > 0 and n_cols > 0 and frozen_rows > 0:
             xls_worksheet.autofilter(frozen_rows - 1, 0, n_rows - 1, n_cols - 1)
 
+    def write_merge_range(self, xls_worksheet, sheet_name, data, merge_range,
+                          frozen_rows, frozen_columns, head_format, body_format):
+        """ Merge a range of cells
+
+        Args:
+            xls_worksheet (:obj:`xlsxwriter.Worksheet`): Excel worksheet
+            sheet_name (:obj:`str`): sheet name
+            data (:obj:`Worksheet` or :obj:`dict`): rows of the worksheet, indexed by their row numbers
+            merge_range (:obj:`tuple`): first row, first column, last row, and last column of the range
+            frozen_rows (:obj:`int`): number of frozen rows
+            frozen_columns (:obj:`int`): number of frozen columns
+            head_format (:obj:`xlsxwriter.Format`): format for merged head cells
+            body_format (:obj:`xlsxwriter.Format`): format for merged body cells
+
+        Raises:
+            :obj:`ValueError`: if the range has multiple values or is out of bounds
+        """
+        row_start, col_start, row_end, col_end = merge_range
+
+        # get data
+        value = set()
+        for i_row in range(row_start, row_end + 1):
+            value.update(data[i_row][col_start:col_end + 1])
+        value.discard(None)
+        if len(value) == 0:
+            value = None
+        elif len(value) == 1:
+            value = value.pop()
+        else:
+            raise ValueError('Merge range {} with values {{"{}"}} can have at most 1 value'.format(
+                MergeRanges.format_range(merge_range), '", "'.join(str(v) for v in value)))
+
+        if row_start <= frozen_rows or col_start <= frozen_columns:
+            format = head_format
+        else:
+            format = body_format
+        result = xls_worksheet.merge_range(row_start, col_start, row_end, col_end, None)
+        if result == -1:
+            raise ValueError("Range of out of bounds")
+        assert result in [0, None], "xlsxwriter error: {}".format(result)
+        self.write_cell(xls_worksheet, sheet_name, row_start, col_start, value, format)
+
+    def get_xls_format(self, **properties):
+        """ Get a format with the given properties
+
+        Formats are cached by their properties so that worksheets with the same styles share the same formats
+
+        Args:
+            **properties (:obj:`dict`): properties of the format (see :obj:`xlsxwriter.format.Format`); properties
+                whose values are :obj:`None` are left at their defaults
+
+        Returns:
+            :obj:`xlsxwriter.format.Format`: format
+        """
+        properties = {key: val for key, val in properties.items() if val is not None}
+        key = tuple(sorted(properties.items()))
+        format = self._xls_formats.get(key, None)
+        if format is None:
+            format = self._xls_formats[key] = self.xls_workbook.add_format(properties)
+        return format
+
+    @staticmethod
+    def get_cell_writers(xls_worksheet):
+        """ Get the methods which write values of the most common types to a worksheet
+
+        Args:
+            xls_worksheet (:obj:`xlsxwriter.Worksheet`): Excel worksheet
+
+        Returns:
+            :obj:`dict`: dictionary which maps types to methods of :obj:`xls_worksheet` which write values of
+                these types
+        """
+        # use xlsxwriter's undecorated methods, which skip the conversion of A1-style cell references, if available
+        write_string = getattr(xls_worksheet, '_write_string', xls_worksheet.write_string)
+        write_boolean = getattr(xls_worksheet, '_write_boolean', xls_worksheet.write_boolean)
+        write_number = getattr(xls_worksheet, '_write_number', xls_worksheet.write_number)
+        return {
+            str: write_string,
+            bool: write_boolean,
+            int: write_number,
+            float: write_number,
+        }
+
+    def write_row(self, xls_worksheet, sheet_name, i_row, row, n_cols, formats, blank_formats, cell_writers=None):
+        """ Write a row of values, padded with blank cells to :obj:`n_cols` columns
+
+        Values of the most common types are dispatched directly to the corresponding methods of
+        :obj:`xls_worksheet`; all other values (blanks, formulas, subclasses, unsupported types) are written with
+        :obj:`write_cell`.
+
+        Args:
+            xls_worksheet (:obj:`xlsxwriter.Worksheet`): Excel worksheet
+            sheet_name (:obj:`str`): sheet name
+            i_row (:obj:`int`): row to write
+            row (:obj:`Row`): values to write
+            n_cols (:obj:`int`): number of columns to write
+            formats (:obj:`list` of :obj:`xlsxwriter.Format`): format for each column
+            blank_formats (:obj:`list` of :obj:`xlsxwriter.Format`): format for each column for blank cells
+            cell_writers (:obj:`dict`, optional): dictionary which maps types to methods of :obj:`xls_worksheet`
+                which write values of these types (see :obj:`get_cell_writers`)
+        """
+        if cell_writers is None:
+            cell_writers = self.get_cell_writers(xls_worksheet)
+
+        for i_col, value in enumerate(row):
+            write = cell_writers.get(value.__class__, None)
+            if write is None or value == '':
+                if value is None or value == '':
+                    format = blank_formats[i_col]
+                else:
+                    format = formats[i_col]
+                self.write_cell(xls_worksheet, sheet_name, i_row, i_col, value, format)
+            else:
+                result = write(i_row, i_col, value, formats[i_col])
+                if result:
+                    self.check_cell_write_result(result, sheet_name, i_row, i_col, value)
+
+        for i_col in range(len(row), n_cols):
+            result = xls_worksheet.write_blank(i_row, i_col, None, blank_formats[i_col])
+            if result:
+                self.check_cell_write_result(result, sheet_name, i_row, i_col, None)
+
     def write_cell(self, xls_worksheet, sheet_name, i_row, i_col, value, format):
         """ Write a value to a cell
 
@@ -536,10 +954,27 @@ class ExcelWriter(Writer):
             raise ValueError('Unsupported type {} at {}:{}:{}{}'.format(
                 value.__class__.__name__,
                 self.path, sheet_name, get_column_letter(i_col + 1), i_row + 1))
+        self.check_cell_write_result(result, sheet_name, i_row, i_col, value)
+
+    def check_cell_write_result(self, result, sheet_name, i_row, i_col, value):
+        """ Check the return code of an xlsxwriter method which wrote a value to a cell
+
+        Args:
+            result (:obj:`int`): return code
+            sheet_name (:obj:`str`): sheet name
+            i_row (:obj:`int`): row of the cell
+            i_col (:obj:`int`): column of the cell
+            value (:obj:`object`): value written to the cell
+
+        Raises:
+            :obj:`ValueError`: if the cell is out of bounds or the value is too long
+        """
         if result == -1:
-            raise ValueError("Row is out of bounds")
+            raise ValueError("Row is out of bounds at {}:{}:{}{}".format(
+                self.path, sheet_name, get_column_letter(i_col + 1), i_row + 1))
         if result == -2:
-            raise ValueError("Value must be <= 32,000 characters")
+            raise ValueError("Value must be <= 32,000 characters at {}:{}:{}{}".format(
+                self.path, sheet_name, get_column_letter(i_col + 1), i_row + 1))
         assert result in [0, None], 'Error code {} when writing "{}" to worksheet "{}"'.format(
             result, value, sheet_name)
 
@@ -553,12 +988,38 @@ class ExcelReader(Reader):
 
     Attributes:
         xls_workbook (:obj:`Workbook`): Excel workbook
+        read_only (:obj:`bool`): if :obj:`True`, stream the rows of each worksheet with openpyxl's
+            read-only mode rather than loading the entire workbook into memory
     """
 
-    def __init__(self, path):
+    MERGE_CELL_TAG = '{%s}mergeCell' % SHEET_MAIN_NS
+    # :obj:`str`: XML tag of merged ranges within worksheet parts
+
+    CELL_TAG = '{%s}c' % SHEET_MAIN_NS
+    # :obj:`str`: XML tag of cells within worksheet parts
+
+    VALUE_TAG = '{%s}v' % SHEET_MAIN_NS
+    # :obj:`str`: XML tag of the values of cells within worksheet parts
+
+    SHARED_STRING_TAG = '{%s}si' % SHEET_MAIN_NS
+    # :obj:`str`: XML tag of strings within shared strings parts
+
+    DOCUMENT_REL_TYPE = REL_NS + '/officeDocument'
+    # :obj:`str`: type of the relationship of a package to its workbook part
+
+    SHARED_STRINGS_REL_TYPE = REL_NS + '/sharedStrings'
+    # :obj:`str`: type of the relationship of a workbook to its shared strings part
+
+    STYLES_REL_TYPE = REL_NS + '/styles'
+    # :obj:`str`: type of the relationship of a workbook to its styles part
+
+    def __init__(self, path, read_only=False, columnar=False):
         """
         Args:
             path (:obj:`str`): path to file(s)
+            read_only (:obj:`bool`, optional): if :obj:`True`, stream the rows of each worksheet with openpyxl's
+                read-only mode rather than loading the entire workbook into memory
+            columnar (:obj:`bool`, optional): if :obj:`True`, read worksheets into instances of :obj:`ColumnarWorksheet`
 
         Raises:
             :obj:`ValueError`: if file extension is not '.xlsx'
@@ -566,8 +1027,19 @@ class ExcelReader(Reader):
         _, ext = splitext(path)
         if ext != '.xlsx':
             raise ValueError("Extension of path '{}' must be '.xlsx'".format(path))
-        super(ExcelReader, self).__init__(path)
+        super(ExcelReader, self).__init__(path, columnar=columnar)
         self.xls_workbook = None
+        self.read_only = read_only
+
+    def __getstate__(self):
+        """ Get the state of the reader to copy it to another process, without its open workbook
+
+        Returns:
+            :obj:`dict`: state
+        """
+        state = dict(self.__dict__)
+        state['xls_workbook'] = None
+        return state
 
     def initialize_workbook(self):
         """ Initialize workbook
@@ -575,7 +1047,7 @@ class ExcelReader(Reader):
         Returns:
             :obj:`Workbook`: data
         """
-        self.xls_workbook = load_workbook(filename=self.path)
+        self.xls_workbook = load_workbook(filename=self.path, read_only=self.read_only)
         return Workbook()
 
     def get_sheet_names(self):
@@ -586,13 +1058,20 @@ class ExcelReader(Reader):
         """
         return self.xls_workbook.sheetnames
 
-    def read_worksheet(self, sheet_name, ignore_empty_final_rows=True, ignore_empty_final_cols=True):
+    def read_worksheet(self, sheet_name, ignore_empty_final_rows=True, ignore_empty_final_cols=True,
+                       columns=None, row_filter=None):
         """ Read data from Excel worksheet
 
+        Only the selected cells are converted to Python values (see :obj:`Reader.read_worksheet`).
+
         Args:
             sheet_name (:obj:`str`): sheet name
             ignore_empty_final_rows (:obj:`bool`, optional): if :obj:`True`, ignore empty final rows
             ignore_empty_final_cols (:obj:`bool`, optional): if :obj:`True`, ignore empty final columns
+            columns (:obj:`list` of :obj:`int` or :obj:`str`, optional): indices and/or names of the columns to read;
+                if :obj:`None`, read all of the columns
+            row_filter (:obj:`callable`, optional): function which returns :obj:`True` for each row that should be
+                read
 
         Returns:
             :obj:`Worksheet`: data
@@ -600,56 +1079,236 @@ class ExcelReader(Reader):
         Raises:
             :obj:`ValueError`:
         """
-        xls_worksheet = self.xls_workbook[sheet_name]
-        worksheet = Worksheet()
+        rows = self.read_rows(sheet_name, columns=columns)
+        if row_filter is not None:
+            rows = filter(row_filter, rows)
+        return self.build_worksheet(rows,
+                                    ignore_empty_final_rows=ignore_empty_final_rows,
+                                    ignore_empty_final_cols=ignore_empty_final_cols)
 
-        max_row = xls_worksheet.max_row
-        max_col = xls_worksheet.max_column
+    def get_sheet_digests(self, sheet_names):
+        """ Get digests of the content of Excel worksheets
 
-        if ignore_empty_final_rows:
-            real_max_row = None
-            for i_row in range(xls_worksheet.max_row, 0, -1):
-                for i_col in range(1, max_col + 1):
-                    value = self.read_cell(sheet_name, xls_worksheet, i_row, i_col)
-                    if value not in (None, ''):
-                        real_max_row = i_row
-                        break
-                if real_max_row is not None:
-                    break
-            if real_max_row is not None:
-                max_row = real_max_row
+        The digest of each worksheet is computed from its part of the archive of the file, together with the shared
+        strings and the number formats of the styles which it uses, and the date system of the workbook. Therefore,
+        the digests of worksheets don't change when strings or styles are only added to or changed for other
+        worksheets. Changes of styles which don't affect the values of cells (e.g., fonts) don't change the digests.
+
+        Args:
+            sheet_names (:obj:`list` of :obj:`str`): sheet names
+
+        Returns:
+            :obj:`dict`: dictionary which maps the name of each sheet to a digest of its content
+        """
+        with zipfile.ZipFile(self.path) as archive:
+            workbook_part = next(iter(self._get_archive_rels(archive, '')[self.DOCUMENT_REL_TYPE].values()))
+            workbook_rels = self._get_archive_rels(archive, workbook_part)
+            workbook_root = fromstring(archive.read(workbook_part))
+
+            sheet_parts = {}
+            rel_targets = {rel_id: target for targets in workbook_rels.values() for rel_id, target in targets.items()}
+            for element in workbook_root.iter('{%s}sheet' % SHEET_MAIN_NS):
+                sheet_parts[element.get('name')] = rel_targets[element.get('{%s}id' % REL_NS)]
+
+            workbook_properties = workbook_root.find('{%s}workbookPr' % SHEET_MAIN_NS)
+            date_1904 = workbook_properties is not None and workbook_properties.get('date1904') in ('1', 'true')
+
+            shared_strings = None
+            shared_strings_parts = list(workbook_rels.get(self.SHARED_STRINGS_REL_TYPE, {}).values())
+            number_formats = None
+            styles_parts = list(workbook_rels.get(self.STYLES_REL_TYPE, {}).values())
+
+            digests = {}
+            for sheet_name in sheet_names:
+                sheet_data = archive.read(sheet_parts[sheet_name])
+                string_ids = set()
+                style_ids = set()
+                for _, element in iterparse(BytesIO(sheet_data)):
+                    if element.tag == self.CELL_TAG:
+                        style_id = element.get('s')
+                        if style_id is not None:
+                            style_ids.add(int(style_id))
+                        if element.get('t') == 's':
+                            value = element.findtext(self.VALUE_TAG)
+                            if value:
+                                string_ids.add(int(value))
+                        element.clear()
+
+                if string_ids and shared_strings is None:
+                    shared_strings = self._get_archive_shared_strings(archive, shared_strings_parts)
+                if style_ids and number_formats is None:
+                    number_formats = self._get_archive_number_formats(archive, styles_parts)
+
+                digest = hashlib.blake2b(sheet_data)
+                digest.update(repr(date_1904).encode())
+                for string_id in sorted(string_ids):
+                    digest.update(repr(string_id).encode())
+                    if string_id < len(shared_strings):
+                        digest.update(shared_strings[string_id])
+                for style_id in sorted(style_ids):
+                    number_format = number_formats[style_id] if style_id < len(number_formats) else None
+                    digest.update(repr((style_id, number_format)).encode())
+                digests[sheet_name] = digest.digest()
+        return digests
+
+    @staticmethod
+    def _get_archive_rels(archive, part):
+        """ Get the relationships of a part of the archive of an Excel file
+
+        Args:
+            archive (:obj:`zipfile.ZipFile`): archive
+            part (:obj:`str`): name of the part, or an empty string for the package
+
+        Returns:
+            :obj:`dict`: dictionary which maps each type of relationship to a dictionary which maps the ids of the
+                relationships to the names of their target parts
+        """
+        dir_name, file_name = posixpath.split(part)
+        rels_part = posixpath.join(dir_name, '_rels', file_name + '.rels')
+        rels = {}
+        if rels_part not in archive.namelist():
+            return rels
+        for element in fromstring(archive.read(rels_part)).iter('{%s}Relationship' % PKG_REL_NS):
+            if element.get('TargetMode') == 'External':
+                continue
+            target = element.get('Target')
+            if target.startswith('/'):
+                target = target[1:]
             else:
-                max_row = 0
-
-        if ignore_empty_final_cols:
-            real_max_col = None
-            for i_col in range(max_col, 0, -1):
-                for i_row in range(1, max_row + 1):
-                    value = self.read_cell(sheet_name, xls_worksheet, i_row, i_col)
-                    if value not in (None, ''):
-                        real_max_col = i_col
-                        break
-                if real_max_col is not None:
-                    break
-            if real_max_col is not None:
-                max_col = real_max_col
+                target = posixpath.normpath(posixpath.join(dir_name, target))
+            rels.setdefault(element.get('Type'), {})[element.get('Id')] = target
+        return rels
+
+    @classmethod
+    def _get_archive_shared_strings(cls, archive, parts):
+        """ Get the serialized shared strings of an Excel file
+
+        Args:
+            archive (:obj:`zipfile.ZipFile`): archive
+            parts (:obj:`list` of :obj:`str`): names of the shared strings parts
+
+        Returns:
+            :obj:`list` of :obj:`bytes`: serialized shared strings
+        """
+        shared_strings = []
+        for part in parts:
+            with archive.open(part) as file:
+                for _, element in iterparse(file):
+                    if element.tag == cls.SHARED_STRING_TAG:
+                        shared_strings.append(tostring(element))
+                        element.clear()
+        return shared_strings
+
+    @classmethod
+    def _get_archive_number_formats(cls, archive, parts):
+        """ Get the number formats of the cell styles of an Excel file, which determine, e.g., whether the values of
+        cells are dates
+
+        Args:
+            archive (:obj:`zipfile.ZipFile`): archive
+            parts (:obj:`list` of :obj:`str`): names of the styles parts
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: id and custom code of the number format of each cell style
+        """
+        number_formats = []
+        for part in parts:
+            root = fromstring(archive.read(part))
+            format_codes = {}
+            for element in root.iter('{%s}numFmt' % SHEET_MAIN_NS):
+                format_codes[element.get('numFmtId')] = element.get('formatCode')
+            cell_styles = root.find('{%s}cellXfs' % SHEET_MAIN_NS)
+            if cell_styles is not None:
+                for element in cell_styles.iter('{%s}xf' % SHEET_MAIN_NS):
+                    format_id = element.get('numFmtId', '0')
+                    number_formats.append((format_id, format_codes.get(format_id, None)))
+        return number_formats
+
+    def read_rows(self, sheet_name, columns=None):
+        """ Read the rows of an Excel worksheet, one at a time, in a single pass
+
+        The value of the first cell of each merged range is copied to the other cells of the range as the rows of the
+        range are read. The merged ranges are indexed by their rows (see :obj:`MergeRanges`) so that each row is
+        only compared with the ranges which span it.
+
+        If columns are selected, all of the cells of the first row are converted to Python values to determine the
+        indices of the columns. Of the subsequent rows, only the selected cells and the first cells of merged ranges
+        are converted.
+
+        Args:
+            sheet_name (:obj:`str`): sheet name
+            columns (:obj:`list` of :obj:`int` or :obj:`str`, optional): indices and/or names of the columns to read
+                (see :obj:`Reader.get_column_indices`); if :obj:`None`, read all of the columns
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`Row`: rows of the worksheet, including any empty final rows and columns
+        """
+        get_cell_value = self.get_cell_value
+        xls_worksheet = self.xls_workbook[sheet_name]
+        merged_ranges = MergeRanges((min_row - 1, min_col - 1, max_row - 1, max_col - 1)
+                                    for min_row, min_col, max_row, max_col in self.get_merged_ranges(xls_worksheet))
+        merged_values = {}
+        indices = None
+        for (i_row, xls_row), row_merged_ranges in zip(enumerate(xls_worksheet.iter_rows()),
+                                                      merged_ranges.iter_row_ranges()):
+            if indices is None:
+                row = Row(get_cell_value(sheet_name, cell, i_row + 1, i_col) for i_col, cell in enumerate(xls_row, 1))
+
+                for merged_range in row_merged_ranges:
+                    min_row, min_col, _, max_col = merged_range
+                    if i_row == min_row:
+                        merged_values[merged_range] = row[min_col] if min_col < len(row) else None
+                    if max_col >= len(row):
+                        row.extend([None] * (max_col + 1 - len(row)))
+                    row[min_col:max_col + 1] = [merged_values[merged_range]] * (max_col + 1 - min_col)
+
+                if columns is not None:
+                    indices = self.get_column_indices(sheet_name, columns, row)
+                    row = Row([row[i_col] if i_col < len(row) else None for i_col in indices])
+
             else:
-                max_col = 0
+                n_cols = len(xls_row)
+                row = Row([get_cell_value(sheet_name, xls_row[i_col], i_row + 1, i_col + 1) if i_col < n_cols else None
+                           for i_col in indices])
 
-        for i_row in range(1, max_row + 1):
-            row = Row()
-            worksheet.append(row)
-            for i_col in range(1, max_col + 1):
-                value = self.read_cell(sheet_name, xls_worksheet, i_row, i_col)
-                row.append(value)
+                for merged_range in row_merged_ranges:
+                    min_row, min_col, _, max_col = merged_range
+                    if i_row == min_row:
+                        merged_values[merged_range] = get_cell_value(
+                            sheet_name, xls_row[min_col], i_row + 1, min_col + 1) if min_col < n_cols else None
+                    for i_proj_col, i_col in enumerate(indices):
+                        if min_col <= i_col <= max_col:
+                            row[i_proj_col] = merged_values[merged_range]
 
-        for cell in xls_worksheet.merged_cells.ranges:
-            value = worksheet[cell.min_row-1][cell.min_col-1]
-            for i_row in range(cell.min_row-1, cell.max_row):
-                for i_col in range(cell.min_col-1, cell.max_col):
-                    worksheet[i_row][i_col] = value
+            yield row
 
-        return worksheet
+    def get_merged_ranges(self, xls_worksheet):
+        """ Get the merged ranges of a worksheet
+
+        Args:
+            xls_worksheet (:obj:`openpyxl.Worksheet`): worksheet
+
+        Returns:
+            :obj:`list` of :obj:`tuple` of :obj:`int`: list of tuples of the start row, start column, end row, and end column (1-based)
+                of each merged range
+        """
+        if not self.read_only:
+            return [(cell_range.min_row, cell_range.min_col, cell_range.max_row, cell_range.max_col)
+                    for cell_range in xls_worksheet.merged_cells.ranges]
+
+        # read-only worksheets don't expose their merged ranges; scan the XML of the worksheet for them without
+        # constructing its cells
+        merged_ranges = []
+        src = xls_worksheet._get_source()
+        try:
+            for _, element in iterparse(src):
+                if element.tag == self.MERGE_CELL_TAG:
+                    cell_range = CellRange(element.get('ref'))
+                    merged_ranges.append((cell_range.min_row, cell_range.min_col, cell_range.max_row, cell_range.max_col))
+                element.clear()
+        finally:
+            src.close()
+        return merged_ranges
 
     def read_cell(self, sheet_name,  xls_worksheet, i_row, i_col):
         """ Read the value of a cell
@@ -664,7 +1323,20 @@ class ExcelReader(Reader):
             :obj:`object`: value of cell
         """
         cell = xls_worksheet.cell(row=i_row, column=i_col)
+        return self.get_cell_value(sheet_name, cell, i_row, i_col)
+
+    def get_cell_value(self, sheet_name, cell, i_row, i_col):
+        """ Get the value of a cell
+
+        Args:
+            sheet_name (:obj:`str`): worksheet name
+            cell (:obj:`openpyxl.cell.cell.Cell` or :obj:`openpyxl.cell.read_only.ReadOnlyCell`): cell
+            i_row (:obj:`int`): row number
+            i_col (:obj:`int`): column number
 
+        Returns:
+            :obj:`object`: value of cell
+        """
         if cell.data_type in (openpyxl.cell.cell.TYPE_STRING, openpyxl.cell.cell.TYPE_INLINE,
                               openpyxl.cell.cell.TYPE_NUMERIC, openpyxl.cell.cell.TYPE_NULL,
                               openpyxl.cell.cell.TYPE_BOOL):
@@ -691,11 +1363,28 @@ class ExcelReader(Reader):
 
         return value
 
+    def finalize_workbook(self):
+        """ Finalize workbook, closing the file of read-only workbooks """
+        if self.read_only and self.xls_workbook is not None:
+            self.xls_workbook.close()
+
 
 class SeparatedValuesWriter(Writer):
-    """ Write data to csv/tsv file(s) """
+    """ Write data to csv/tsv file(s)
 
-    def __init__(self, path, title=None, description=None, keywords=None, version=None, language=None, creator=None):
+    Attributes:
+        use_pyexcel (:obj:`bool`): if :obj:`True`, write files with :obj:`pyexcel` rather than with :obj:`csv`
+    """
+
+    INDEPENDENT_WORKSHEETS = True
+    # :obj:`bool`: if :obj:`True`, each worksheet is written to a separate file, and worksheets can be written
+    # concurrently
+
+    BUFFER_SIZE = 2 ** 20
+    # :obj:`int`: size of the buffer for writing files
+
+    def __init__(self, path, title=None, description=None, keywords=None, version=None, language=None, creator=None,
+                 use_pyexcel=False):
         """
         Args:
             path (:obj:`str`): path to file(s)
@@ -705,6 +1394,8 @@ class SeparatedValuesWriter(Writer):
             version (:obj:`str`, optional): version
             language (:obj:`str`, optional): language
             creator (:obj:`str`, optional): creator
+            use_pyexcel (:obj:`bool`, optional): if :obj:`True`, write files with :obj:`pyexcel` rather than with
+                :obj:`csv`
 
         Raises:
             :obj:`ValueError`: if file extension is not '.csv' or '.tsv' or if file name pattern
@@ -726,8 +1417,9 @@ class SeparatedValuesWriter(Writer):
         super(SeparatedValuesWriter, self).__init__(path,
                                                     title=title, description=description,
                                                     keywords=keywords, version=version, language=language, creator=creator)
+        self.use_pyexcel = use_pyexcel
 
-    def run(self, data, style=None, validation=None, protected=False):
+    def run(self, data, style=None, validation=None, protected=False, max_workers=None, executor=None):
         """ Write workbook to file(s)
 
         Args:
@@ -735,11 +1427,16 @@ class SeparatedValuesWriter(Writer):
             style (:obj:`WorkbookStyle`, optional): workbook style
             validation (:obj:`WorkbookValidation`, optional): validation
             protected (:obj:`bool`, optional): if :obj:`True`, protect the worksheet
+            max_workers (:obj:`int`, optional): if greater than 1, write worksheets concurrently with a pool of up to
+                this many processes
+            executor (:obj:`concurrent.futures.Executor`, optional): pool of workers to write the worksheets
+                concurrently; takes precedence over :obj:`max_workers`
         """
         if len(data) > 1 and basename(self.path).count('*') == 0:
             raise ValueError("path '{}' must have a glob pattern '*' in its base name".format(
                 self.path))
-        super(SeparatedValuesWriter, self).run(data, style=style, validation=validation, protected=protected)
+        super(SeparatedValuesWriter, self).run(data, style=style, validation=validation, protected=protected,
+                                               max_workers=max_workers, executor=executor)
 
     def initialize_workbook(self):
         """ Initialize workbook """
@@ -755,6 +1452,31 @@ class SeparatedValuesWriter(Writer):
             validation (:obj:`WorksheetValidation`, optional): worksheet validation
             protected (:obj:`bool`, optional): if :obj:`True`, protect the worksheet
         """
+        filename = self.path.replace('*', sheet_name)
+
+        if self.use_pyexcel:
+            self.write_worksheet_with_pyexcel(filename, data)
+            return
+
+        # like pyexcel, pad each row to the width of the widest row
+        n_cols = max((len(row) for row in data), default=0)
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=self.BUFFER_SIZE) as file:
+            writer = csv.writer(file, dialect=get_separated_values_dialect(self.path))
+            for row in data:
+                row_values = [cell.value if isinstance(cell, Formula) else cell for cell in row]
+                if len(row_values) < n_cols:
+                    row_values.extend([''] * (n_cols - len(row_values)))
+                writer.writerow(row_values)
+
+    def write_worksheet_with_pyexcel(self, filename, data):
+        """ Write worksheet to file with :obj:`pyexcel`
+
+        Args:
+            filename (:obj:`str`): path to file
+            data (:obj:`Worksheet`): python representation of data; each element must be a string, boolean, integer, float, or NoneType
+        """
+        import pyexcel  # imported on demand because it is slow to import
+
         data_values = []
         for row in data:
             row_values = Row(row)
@@ -768,7 +1490,7 @@ class SeparatedValuesWriter(Writer):
             else:
                 data_values.append(row)
 
-        pyexcel.save_as(array=data_values, dest_file_name=self.path.replace('*', sheet_name))
+        pyexcel.save_as(array=data_values, dest_file_name=filename)
 
     def finalize_workbook(self):
         """ Finalize workbook """
@@ -776,12 +1498,22 @@ class SeparatedValuesWriter(Writer):
 
 
 class SeparatedValuesReader(Reader):
-    """ Read data from csv/tsv file(s) """
+    """ Read data from csv/tsv file(s)
 
-    def __init__(self, path):
+    Attributes:
+        use_pyexcel (:obj:`bool`): if :obj:`True`, read files with :obj:`pyexcel` rather than with :obj:`csv`
+    """
+
+    BUFFER_SIZE = 2 ** 20
+    # :obj:`int`: size of the buffer for reading files
+
+    def __init__(self, path, use_pyexcel=False, columnar=False):
         """
         Args:
             path (:obj:`str`): path to file(s)
+            use_pyexcel (:obj:`bool`, optional): if :obj:`True`, read files with :obj:`pyexcel` rather than with
+                :obj:`csv`
+            columnar (:obj:`bool`, optional): if :obj:`True`, read worksheets into instances of :obj:`ColumnarWorksheet`
 
         Raises:
             :obj:`ValueError`: if file extension is not '.csv' or '.tsv' or if file name pattern
@@ -800,7 +1532,8 @@ class SeparatedValuesReader(Reader):
             raise ValueError("path '{}' cannot have multiple glob patterns '*' in its base name".format(
                 path))
 
-        super(SeparatedValuesReader, self).__init__(path)
+        super(SeparatedValuesReader, self).__init__(path, columnar=columnar)
+        self.use_pyexcel = use_pyexcel
 
     def initialize_workbook(self):
         """ Initialize workbook
@@ -830,64 +1563,206 @@ class SeparatedValuesReader(Reader):
                 raise ValueError("glob of path '{}' does not match any files".format(self.path))
             return names
 
-    def read_worksheet(self, sheet_name, ignore_empty_final_rows=True, ignore_empty_final_cols=True):
+    def read_worksheet(self, sheet_name, ignore_empty_final_rows=True, ignore_empty_final_cols=True,
+                       columns=None, row_filter=None):
         """ Read data from file
 
+        Unless the file is read with :obj:`pyexcel`, the fields of the file are parsed one column at a time (see
+        :obj:`read_column`), and only the selected fields are parsed (see :obj:`Reader.read_worksheet`). Columnar
+        worksheets are built directly from the typed arrays of the columns, unless rows are filtered.
+
         Args:
             sheet_name (:obj:`str`): sheet name
             ignore_empty_final_rows (:obj:`bool`, optional): if :obj:`True`, ignore empty final rows
             ignore_empty_final_cols (:obj:`bool`, optional): if :obj:`True`, ignore empty final columns
+            columns (:obj:`list` of :obj:`int` or :obj:`str`, optional): indices and/or names of the columns to read;
+                if :obj:`None`, read all of the columns
+            row_filter (:obj:`callable`, optional): function which returns :obj:`True` for each row that should be
+                read
 
         Returns:
-            :obj:`Worksheet`: data
+            :obj:`Worksheet` or :obj:`ColumnarWorksheet`: data
         """
-        worksheet = Worksheet()
+        if self.use_pyexcel:
+            rows = self.read_rows(sheet_name, columns=columns)
+            if row_filter is not None:
+                rows = filter(row_filter, rows)
+            return self.build_worksheet(rows,
+                                        ignore_empty_final_rows=ignore_empty_final_rows,
+                                        ignore_empty_final_cols=ignore_empty_final_cols)
+
+        # parse the fields of the selected columns into per-column buffers, padding short rows with empty fields
+        sv_columns = []
+        n_rows = 0
+        indices = None
+        filename = self.path.replace('*', sheet_name)
+        with open(filename, 'r', encoding='utf-8', buffering=self.BUFFER_SIZE) as file:
+            for sv_row in csv.reader(file, dialect=get_separated_values_dialect(self.path)):
+                if columns is not None:
+                    if indices is None:
+                        head_row = Row([self.read_cell(self.parse_cell(sv_cell)) for sv_cell in sv_row])
+                        indices = self.get_column_indices(sheet_name, columns, head_row)
+                    n_cols = len(sv_row)
+                    sv_row = [sv_row[i_col] if i_col < n_cols else '' for i_col in indices]
+
+                if len(sv_row) > len(sv_columns):
+                    sv_columns.extend([''] * n_rows for i_col in range(len(sv_row) - len(sv_columns)))
+                for sv_column, sv_cell in zip_longest(sv_columns, sv_row, fillvalue=''):
+                    sv_column.append(sv_cell)
+                n_rows += 1
+
+        if self.columnar and row_filter is None:
+            worksheet = ColumnarWorksheet([self.read_column(sv_column, typed=True) for sv_column in sv_columns],
+                                          n_rows=n_rows)
+            if ignore_empty_final_rows:
+                worksheet.remove_empty_final_rows()
+            if ignore_empty_final_cols:
+                worksheet.remove_empty_final_cols()
+            return worksheet
+
+        if sv_columns:
+            rows = map(Row, zip(*(self.read_column(sv_column) for sv_column in sv_columns)))
+        else:
+            rows = (Row() for i_row in range(n_rows))
+        if row_filter is not None:
+            rows = filter(row_filter, rows)
+        return self.build_worksheet(rows,
+                                    ignore_empty_final_rows=ignore_empty_final_rows,
+                                    ignore_empty_final_cols=ignore_empty_final_cols)
+
+    def get_sheet_digests(self, sheet_names):
+        """ Get digests of the content of files
+
+        Args:
+            sheet_names (:obj:`list` of :obj:`str`): sheet names
+
+        Returns:
+            :obj:`dict`: dictionary which maps the name of each sheet to a digest of its content
+        """
+        digests = {}
+        for sheet_name in sheet_names:
+            digest = hashlib.blake2b()
+            with open(self.path.replace('*', sheet_name), 'rb') as file:
+                for block in iter(lambda: file.read(self.BUFFER_SIZE), b''):
+                    digest.update(block)
+            digests[sheet_name] = digest.digest()
+        return digests
+
+    def read_rows(self, sheet_name, columns=None):
+        """ Read the rows of a file, one at a time, in a single pass
+
+        If columns are selected, all of the fields of the first row are parsed to determine the indices of the
+        columns. Of the subsequent rows, only the selected fields are parsed.
+
+        Args:
+            sheet_name (:obj:`str`): sheet name
+            columns (:obj:`list` of :obj:`int` or :obj:`str`, optional): indices and/or names of the columns to read
+                (see :obj:`Reader.get_column_indices`); if :obj:`None`, read all of the columns
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`Row`: rows of the file, including any empty final rows and columns
+        """
+        filename = self.path.replace('*', sheet_name)
+
+        if self.use_pyexcel:
+            rows = self.read_rows_with_pyexcel(filename)
+            if columns is not None:
+                rows = self.project_rows(sheet_name, rows, columns)
+            for row in rows:
+                yield row
+            return
+
+        read_cell = self.read_cell
+        parse_cell = self.parse_cell
+        with open(filename, 'r', encoding='utf-8', buffering=self.BUFFER_SIZE) as file:
+            sv_rows = csv.reader(file, dialect=get_separated_values_dialect(self.path))
+            for sv_row in sv_rows:
+                row = Row([read_cell(parse_cell(sv_cell)) for sv_cell in sv_row])
+                if columns is None:
+                    yield row
+                    continue
+
+                indices = self.get_column_indices(sheet_name, columns, row)
+                yield Row([row[i_col] if i_col < len(row) else None for i_col in indices])
+                for sv_row in sv_rows:
+                    n_cols = len(sv_row)
+                    yield Row([read_cell(parse_cell(sv_row[i_col])) if i_col < n_cols else None
+                               for i_col in indices])
+
+    def read_rows_with_pyexcel(self, filename):
+        """ Read the rows of a file with :obj:`pyexcel`
+
+        Args:
+            filename (:obj:`str`): path to file
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`Row`: rows of the file, including any empty final rows and columns
+        """
+        import pyexcel  # imported on demand because it is slow to import
+
         # todo: skip_empty_rows=False is the default for pyexcel-io v >= 0.3.2
         # when it's available on pypi, set pyexcel>=0.4.0  pyexcel-io>=0.3.2 & remove skip_empty_rows option
-        sv_worksheet = pyexcel.get_sheet(file_name=self.path.replace('*', sheet_name),
-                                         skip_empty_rows=False)
+        sv_worksheet = pyexcel.get_sheet(file_name=filename, skip_empty_rows=False)
+        for sv_row in sv_worksheet.rows():
+            yield Row(self.read_cell(sv_cell) for sv_cell in sv_row)
 
-        rows = list(sv_worksheet.rows())
-        max_row = len(rows)
-        if max_row:
-            max_col = len(rows[0])
-        else:
-            max_col = 0
+    INT_PEP_515_PATTERN = re.compile(r'([0-9]+_)+[0-9]+$')
+    # :obj:`re.Pattern`: integers with underscores, which are not parsed as numbers
 
-        if ignore_empty_final_rows:
-            real_max_row = None
-            for i_row, row in enumerate(reversed(rows)):
-                for i_col, cell in enumerate(row):
-                    value = self.read_cell(cell)
-                    if value not in (None, ''):
-                        real_max_row = max_row - i_row
-                        break
-                if real_max_row is not None:
-                    break
-            if real_max_row is not None:
-                max_row = real_max_row
-
-        if ignore_empty_final_cols:
-            real_max_col = None
-            for i_col in range(max_col - 1, 0, -1):
-                for i_row in range(0, max_row):
-                    cell = rows[i_row][i_col]
-                    value = self.read_cell(cell)
-                    if value not in (None, ''):
-                        real_max_col = i_col + 1
-                        break
-                if real_max_col is not None:
-                    break
-            if real_max_col is not None:
-                max_col = real_max_col
+    INT_THOUSANDS_PATTERN = re.compile(r'([0-9]+,)*[0-9]+$')
+    # :obj:`re.Pattern`: integers with thousands separators
 
-        for sv_row in rows[0:max_row]:
-            row = Row()
-            worksheet.append(row)
-            for sv_cell in sv_row[0:max_col]:
-                row.append(self.read_cell(sv_cell))
+    FLOAT_PEP_515_PATTERN = re.compile(r'([0-9]+_)+[0-9]+.[0-9]*$')
+    # :obj:`re.Pattern`: floats with underscores, which are not parsed as numbers
 
-        return worksheet
+    NUMBER_START_CHARS = frozenset('0123456789+-. \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f')
+    # :obj:`frozenset` of :obj:`str`: ASCII characters which can begin a number or date
+
+    def parse_cell(self, text):
+        """ Parse the text of a cell into an integer, float, date, datetime, or string with the same rules as
+        :obj:`pyexcel`
+
+        Args:
+            text (:obj:`str`): text of a cell
+
+        Returns:
+            :obj:`object`: value
+        """
+        if text == '' or (text[0] < '\x80' and text[0] not in self.NUMBER_START_CHARS):
+            return text
+
+        # integer
+        if not (text.startswith('0') and len(text) > 1) and not self.INT_PEP_515_PATTERN.match(text):
+            try:
+                return int(text)
+            except ValueError:
+                if self.INT_THOUSANDS_PATTERN.match(text):
+                    return int(text.replace(',', ''))
+
+        # float
+        if not (text.startswith('0') and not text.startswith('0.')) \
+                and not self.FLOAT_PEP_515_PATTERN.match(text) \
+                and text.lower() != 'nan':
+            try:
+                value = float(text)
+            except ValueError:
+                pass
+            else:
+                if value not in (float('inf'), float('-inf')):
+                    return value
+
+        # date or datetime
+        try:
+            if len(text) == 10:
+                return datetime.strptime(text, '%Y-%m-%d').date()
+            elif len(text) == 19:
+                return datetime.strptime(text, '%Y-%m-%d %H:%M:%S')
+            elif len(text) > 19:
+                return datetime.strptime(text[0:26], '%Y-%m-%d %H:%M:%S.%f')
+        except ValueError:
+            pass
+
+        return text
 
     def read_cell(self, value):
         """ Read the value of a cell
@@ -906,6 +1781,287 @@ class SeparatedValuesReader(Reader):
             value = False
         return value
 
+    N_TYPE_INFERENCE_ROWS = 100
+    # :obj:`int`: number of rows from which the types of columns are inferred
+
+    MAX_NUMBER_LENGTH = 24
+    # :obj:`int`: maximum length of the numbers which are parsed in bulk
+
+    NUMBER_START_CODES = numpy.array(sorted(ord(char) for char in NUMBER_START_CHARS), dtype=numpy.uint32)
+    # :obj:`numpy.ndarray`: code points of :obj:`NUMBER_START_CHARS`
+
+    def infer_column_type(self, texts):
+        """ Infer the type of a column from the fields of its first rows (see :obj:`N_TYPE_INFERENCE_ROWS`)
+
+        Args:
+            texts (:obj:`list` of :obj:`str`): fields of the column
+
+        Returns:
+            :obj:`type`: most frequent type of the values of the non-empty fields, or :obj:`None` if the fields are
+                empty
+        """
+        counts = {}
+        for text in texts[0:self.N_TYPE_INFERENCE_ROWS]:
+            if text != '':
+                type = self.read_cell(self.parse_cell(text)).__class__
+                counts[type] = counts.get(type, 0) + 1
+        return max(counts.keys(), key=counts.get, default=None)
+
+    def read_column(self, texts, typed=False):
+        """ Parse the fields of a column into values with the same rules as :obj:`parse_cell` and :obj:`read_cell`
+
+        Rather than parsing each field with :obj:`parse_cell`, the fields are classified with vectorized operations
+        on their code points. Empty fields, booleans, and fields which can't begin numbers or dates are resolved
+        directly. If the type of the column is inferred to be numeric (see :obj:`infer_column_type`), decimal
+        integers and floats without exponents are validated and parsed in bulk by NumPy. The remaining fields are
+        parsed with :obj:`parse_cell`.
+
+        Args:
+            texts (:obj:`list` of :obj:`str`): fields of the column
+            typed (:obj:`bool`, optional): if :obj:`True`, return a :obj:`WorksheetColumn`, whose booleans,
+                integers, or floats are stored in a NumPy array if they are the majority of its values (see
+                :obj:`WorksheetColumn.from_values`)
+
+        Returns:
+            :obj:`list` or :obj:`WorksheetColumn`: values
+        """
+        n_rows = len(texts)
+        lengths = numpy.fromiter(map(len, texts), dtype=numpy.int64, count=n_rows)
+        first_codes = numpy.array(texts, dtype='<U1').view(numpy.uint32) if n_rows else lengths
+        objects = numpy.empty((n_rows,), dtype=object)
+        objects[:] = texts
+
+        is_empty = lengths == 0
+        is_true = objects == 'True'
+        is_false = objects == 'False'
+        is_text = (first_codes < 0x80) & ~numpy.isin(first_codes, self.NUMBER_START_CODES) \
+            & ~is_empty & ~is_true & ~is_false
+        is_unparsed = ~(is_empty | is_true | is_false | is_text)
+
+        values = numpy.empty((n_rows,), dtype=object)
+        values[is_true] = True
+        values[is_false] = False
+        values[is_text] = objects[is_text]
+
+        i_ints = i_floats = numpy.empty((0,), dtype=numpy.int64)
+        ints = numpy.empty((0,), dtype=numpy.int64)
+        floats = numpy.empty((0,), dtype=numpy.float64)
+        if self.infer_column_type(texts) in (int, float):
+            i_candidates = numpy.flatnonzero(is_unparsed & (lengths <= self.MAX_NUMBER_LENGTH))
+            candidates = objects[i_candidates].astype('<U{}'.format(self.MAX_NUMBER_LENGTH))
+            codes = candidates.view(numpy.uint32).reshape((i_candidates.size, self.MAX_NUMBER_LENGTH))
+            candidate_lengths = lengths[i_candidates]
+
+            # a field is an integer or float if it consists of an optional minus sign followed by digits and, for
+            # floats, one decimal point; like :obj:`parse_cell`, fields which begin with leading zeros are not
+            # numbers
+            is_neg = codes[:, 0] == ord('-')
+            is_in_field = numpy.arange(self.MAX_NUMBER_LENGTH) < candidate_lengths[:, numpy.newaxis]
+            is_in_field[:, 0] &= ~is_neg
+            is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+            is_point = codes == ord('.')
+            n_digits = (is_digit & is_in_field).sum(axis=1)
+            n_points = (is_point & is_in_field).sum(axis=1)
+            has_other_chars = (is_in_field & ~is_digit & ~is_point).any(axis=1)
+            is_leading_zero = (codes[:, 0] == ord('0')) & (candidate_lengths > 1)
+
+            is_int = ~has_other_chars & (n_points == 0) & (n_digits >= 1) & (n_digits <= 18) & ~is_leading_zero
+            is_float = ~has_other_chars & (n_points == 1) & (n_digits >= 1) \
+                & ~(is_leading_zero & (codes[:, 1] != ord('.')))
+
+            i_ints = i_candidates[is_int]
+            ints = candidates[is_int].astype(numpy.int64)
+            i_floats = i_candidates[is_float]
+            floats = candidates[is_float].astype(numpy.float64)
+            values[i_ints] = ints
+            values[i_floats] = floats
+            is_unparsed[i_ints] = False
+            is_unparsed[i_floats] = False
+
+        i_others = numpy.flatnonzero(is_unparsed).tolist()
+        for i_row in i_others:
+            values[i_row] = self.read_cell(self.parse_cell(texts[i_row]))
+
+        if not typed:
+            return values.tolist()
+
+        # select the type of the column in the same way as :obj:`WorksheetColumn.from_values`
+        type_rows = {
+            bool: [numpy.flatnonzero(is_true | is_false)],
+            int: [i_ints],
+            float: [i_floats],
+        }
+        for i_row in i_others:
+            value = values[i_row]
+            if value.__class__ in type_rows and (value.__class__ is not int
+                                                 or WorksheetColumn.INT_MIN <= value <= WorksheetColumn.INT_MAX):
+                type_rows[value.__class__].append(i_row)
+        counts = {type: sum(numpy.size(rows) for rows in type_rows[type]) for type in type_rows}
+        type, count = max(counts.items(), key=lambda type_count: type_count[1])
+        if count * 2 <= n_rows - int(is_empty.sum()):
+            return WorksheetColumn(values)
+
+        i_typed = numpy.concatenate([numpy.asarray(rows, dtype=numpy.int64).reshape((-1,))
+                                     for rows in type_rows[type]])
+        typed_values = numpy.zeros((n_rows,), dtype=WorksheetColumn.TYPES[type])
+        if type is bool:
+            typed_values[is_true] = True
+        elif type is int:
+            typed_values[i_ints] = ints
+        else:
+            typed_values[i_floats] = floats
+        for i_row in type_rows[type][1:]:
+            typed_values[i_row] = values[i_row]
+        mask = ~is_empty
+        mask[i_typed] = False
+        others = {i_row: values[i_row] for i_row in numpy.flatnonzero(mask).tolist()}
+        mask[is_empty] = True
+        return WorksheetColumn(typed_values, mask, others)
+
+
+class IncrementalReader(object):
+    """ Read a workbook repeatedly, re-parsing only the worksheets which changed since the previous read
+
+    The files are not opened again if their modification times and sizes haven't changed. Otherwise, each worksheet
+    is only re-parsed if the digest of its content changed (see :obj:`Reader.get_sheet_digests`): the digest of each
+    comma separated (.csv) or tab separated (.tsv) file, or the digest of the part of each worksheet within an Excel
+    (.xlsx) file and of the shared strings and number formats which it uses. Worksheets are read from Excel files with
+    read-only readers.
+
+    Each read returns the same workbook, whose unchanged worksheets are reused. Therefore, the worksheets shouldn't
+    be modified between reads.
+
+    Attributes:
+        path (:obj:`str`): path to file(s)
+        columnar (:obj:`bool`): if :obj:`True`, read worksheets into instances of :obj:`ColumnarWorksheet`
+        workbook (:obj:`Workbook`): workbook, updated by each read
+        file_stats (:obj:`dict`): dictionary which maps the name of each file to its modification time and size at
+            the previous read
+        sheet_digests (:obj:`dict`): dictionary which maps the name of each worksheet to the digest of its content at
+            the previous read
+    """
+
+    def __init__(self, path, columnar=False):
+        """
+        Args:
+            path (:obj:`str`): path to file(s)
+            columnar (:obj:`bool`, optional): if :obj:`True`, read worksheets into instances of :obj:`ColumnarWorksheet`
+        """
+        _, ext = splitext(path)
+        reader_cls = get_reader(ext)
+        if issubclass(reader_cls, ExcelReader):
+            self._reader = reader_cls(path, read_only=True, columnar=columnar)
+        else:
+            self._reader = reader_cls(path, columnar=columnar)
+
+        self.path = path
+        self.columnar = columnar
+        self.workbook = Workbook()
+        self.file_stats = None
+        self.sheet_digests = {}
+
+    def run(self):
+        """ Read the worksheets which changed since the previous read
+
+        Returns:
+            :obj:`Workbook`: python representation of data
+        """
+        file_stats = self.get_file_stats()
+        if file_stats == self.file_stats:
+            return self.workbook
+
+        workbook = self.workbook
+        with self._reader as reader:
+            names = reader.get_sheet_names()
+            sheet_digests = reader.get_sheet_digests(names)
+            for name in names:
+                if name not in workbook or sheet_digests[name] != self.sheet_digests.get(name):
+                    workbook[name] = reader.read_worksheet(name)
+
+        for name in list(workbook.keys()):
+            if name not in sheet_digests:
+                del workbook[name]
+        for name in names:
+            workbook.move_to_end(name)
+
+        self.file_stats = file_stats
+        self.sheet_digests = sheet_digests
+        return workbook
+
+    def get_file_stats(self):
+        """ Get the modification times and sizes of the file(s)
+
+        Returns:
+            :obj:`dict`: dictionary which maps the name of each file to its modification time and size
+        """
+        stats = {}
+        for filename in glob(self.path) if '*' in self.path else [self.path]:
+            stat = os.stat(filename)
+            stats[filename] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+
+def get_separated_values_dialect(path):
+    """ Get the :obj:`csv` dialect of a comma separated (.csv) or tab separated (.tsv) file
+
+    Args:
+        path (:obj:`str`): path to file(s)
+
+    Returns:
+        :obj:`str`: name of the dialect
+    """
+    _, ext = splitext(path)
+    if ext == '.tsv':
+        return 'excel-tab'
+    else:
+        return 'excel'
+
+
+def _write_worksheet(writer, sheet_name, data, style, validation, protected):
+    """ Write a worksheet with a copy of a writer in a worker of a pool
+
+    Args:
+        writer (:obj:`Writer`): copy of a writer of a format whose worksheets are written to separate files
+        sheet_name (:obj:`str`): sheet name
+        data (:obj:`Worksheet`): python representation of data
+        style (:obj:`WorksheetStyle`): worksheet style
+        validation (:obj:`WorksheetValidation`): worksheet validation
+        protected (:obj:`bool`): if :obj:`True`, protect the worksheet
+    """
+    writer.write_worksheet(sheet_name, data, style=style, validation=validation, protected=protected)
+
+
+def get_sheet_columns(columns, sheet_name):
+    """ Get the columns to read from a worksheet
+
+    Args:
+        columns (:obj:`list` or :obj:`dict`): columns to read from each worksheet, or a dictionary which maps the
+            names of worksheets to the columns to read from them
+        sheet_name (:obj:`str`): sheet name
+
+    Returns:
+        :obj:`list`: columns to read from the worksheet, or :obj:`None` to read all of its columns
+    """
+    if isinstance(columns, dict):
+        return columns.get(sheet_name, None)
+    return columns
+
+
+def _read_worksheet(reader, sheet_name, columns=None, row_filter=None):
+    """ Read a worksheet with a copy of a reader in a worker of a pool
+
+    Args:
+        reader (:obj:`Reader`): copy of a reader
+        sheet_name (:obj:`str`): sheet name
+        columns (:obj:`list` of :obj:`int` or :obj:`str`, optional): indices and/or names of the columns to read
+        row_filter (:obj:`callable`, optional): function which returns :obj:`True` for each row that should be read
+
+    Returns:
+        :obj:`Worksheet`: data
+    """
+    with reader:
+        return reader.read_worksheet(sheet_name, columns=columns, row_filter=row_filter)
+
 
 def get_writer(extension):
     """ Get writer
@@ -949,9 +2105,13 @@ def get_reader(extension):
 
 def write(path, workbook,
           title=None, description=None, keywords=None, version=None, language=None, creator=None,
-          style=None):
+          style=None, max_workers=None, executor=None):
     """ Write data to Excel (.xlsx) file or collection of comma separated (.csv) or tab separated (.tsv) file(s)
 
+    The worksheets of collections of comma separated (.csv) or tab separated (.tsv) files can optionally be written
+    concurrently. The worksheets of Excel files are always written sequentially because they are assembled into a
+    single package.
+
     Args:
         path (:obj:`str`): path to file(s)
         workbook (:obj:`Workbook`): python representation of data; each element must be a string, boolean, integer, float, or NoneType
@@ -962,6 +2122,10 @@ def write(path, workbook,
         language (:obj:`str`, optional): language
         creator (:obj:`str`, optional): creator
         style (:obj:`WorkbookStyle`, optional): workbook style
+        max_workers (:obj:`int`, optional): if greater than 1 and the path is a collection of comma separated (.csv)
+            or tab separated (.tsv) files, write worksheets concurrently with a pool of up to this many processes
+        executor (:obj:`concurrent.futures.Executor`, optional): pool of workers to write worksheets to comma
+            separated (.csv) or tab separated (.tsv) files concurrently; takes precedence over :obj:`max_workers`
     """
     # check extensions are valid
     _, ext = splitext(path)
@@ -970,34 +2134,182 @@ def write(path, workbook,
     writer = writer_cls(path,
                         title=title, description=description, keywords=keywords,
                         version=version, language=language, creator=creator)
-    writer.run(workbook, style=style)
+    writer.run(workbook, style=style, max_workers=max_workers, executor=executor)
 
 
-def read(path):
+def read(path, max_workers=None, executor=None, columnar=False, cache=False, lazy=False, columns=None, row_filter=None):
     """ Read data from Excel (.xlsx) file or collection of comma separated (.csv) or tab separated (.tsv) file(s)
 
+    Optionally, only some of the columns and rows of each worksheet can be read (see :obj:`Reader.read_worksheet`).
+
+    Optionally, parsed workbooks can be cached in binary files (see :obj:`wc_utils.workbook.binary`) alongside
+    the file(s) (see :obj:`get_cache_filename`). Each cache is keyed by a digest of the file(s). Stale caches are
+    ignored and replaced.
+
+    Alternatively, worksheets can be read lazily on their first access (see :obj:`LazyWorkbook`). Excel files are
+    kept open until lazy workbooks are closed.
+
     Args:
         path (:obj:`str`): path to file(s)
+        max_workers (:obj:`int`, optional): if greater than 1, read worksheets concurrently with a pool of up to
+            this many processes
+        executor (:obj:`concurrent.futures.Executor`, optional): pool of workers to read the worksheets
+            concurrently; takes precedence over :obj:`max_workers`
+        columnar (:obj:`bool`, optional): if :obj:`True`, read worksheets into instances of :obj:`ColumnarWorksheet`
+        cache (:obj:`bool`, optional): if :obj:`True`, load the workbook from its cache, if the cache is valid, or
+            save the workbook to its cache
+        lazy (:obj:`bool`, optional): if :obj:`True`, return a :obj:`LazyWorkbook` which reads each worksheet on
+            its first access
+        columns (:obj:`list` or :obj:`dict`, optional): indices (0-based) and/or names of the columns to read from
+            each worksheet, or a dictionary which maps the names of worksheets to the columns to read from them
+        row_filter (:obj:`callable`, optional): function which returns :obj:`True` for each row that should be read
 
     Returns:
         :obj:`Workbook`: python representation of data
+
+    Raises:
+        :obj:`ValueError`: if :obj:`lazy` is :obj:`True` and :obj:`cache` is :obj:`True` or :obj:`max_workers` or
+            :obj:`executor` is set
     """
     # check extensions are valid
     _, ext = splitext(path)
     reader_cls = get_reader(ext)
-    reader = reader_cls(path)
-    return reader.run()
 
+    if lazy:
+        if cache:
+            raise ValueError('Workbooks cannot be both cached and read lazily')
+        if max_workers is not None or executor is not None:
+            raise ValueError('Workbooks cannot be both read concurrently and read lazily')
+        if issubclass(reader_cls, ExcelReader):
+            reader = reader_cls(path, read_only=True, columnar=columnar)
+        else:
+            reader = reader_cls(path, columnar=columnar)
+        reader.initialize_workbook()
+        try:
+            sheet_names = reader.get_sheet_names()
+        except Exception:
+            reader.finalize_workbook()
+            raise
+
+        def load_worksheet(sheet_name):
+            return reader.read_worksheet(sheet_name, columns=get_sheet_columns(columns, sheet_name),
+                                         row_filter=row_filter)
+        return LazyWorkbook(sheet_names, load_worksheet=load_worksheet, close=reader.finalize_workbook)
+
+    if not cache:
+        reader = reader_cls(path, columnar=columnar)
+        return reader.run(max_workers=max_workers, executor=executor, columns=columns, row_filter=row_filter)
+
+    cache_filename = get_cache_filename(path)
+    key = get_source_digest(path)
+    try:
+        workbook = binary.load(cache_filename, key=key)
+    except (OSError, ValueError):
+        workbook = None
+
+    if workbook is None:
+        workbook = reader_cls(path).run(max_workers=max_workers, executor=executor)
+        try:
+            binary.dump(workbook, cache_filename, key=key)
+        except (OSError, ValueError):
+            # e.g., the directory is read-only or the workbook contains cells which can't be cached
+            pass
+
+    # the cache contains all of the columns and rows; select the requested columns and rows from it
+    if columns is not None or row_filter is not None:
+        reader = reader_cls(path, columnar=columnar)
+        for name, sheet in workbook.items():
+            rows = iter(sheet)
+            sheet_columns = get_sheet_columns(columns, name)
+            if sheet_columns is not None:
+                rows = reader.project_rows(name, rows, sheet_columns)
+            if row_filter is not None:
+                rows = filter(row_filter, rows)
+            workbook[name] = reader.build_worksheet(rows)
+    elif columnar:
+        for name, sheet in workbook.items():
+            workbook[name] = ColumnarWorksheet.from_rows(sheet)
+    return workbook
+
+
+def get_cache_filename(path):
+    """ Get the path of the binary cache of an Excel (.xlsx) file or collection of comma separated (.csv) or tab
+    separated (.tsv) file(s)
 
-def convert(source, destination, worksheet_order=None, style=None, ignore_extra_sheets=True):
+    Args:
+        path (:obj:`str`): path to file(s)
+
+    Returns:
+        :obj:`str`: path of the cache
+    """
+    return os.path.join(dirname(path), '.' + basename(path).replace('*', '%') + '.wcwb')
+
+
+def get_source_digest(path):
+    """ Get a digest of the content of an Excel (.xlsx) file or collection of comma separated (.csv) or tab
+    separated (.tsv) file(s)
+
+    Args:
+        path (:obj:`str`): path to file(s)
+
+    Returns:
+        :obj:`bytes`: digest
+    """
+    digest = hashlib.blake2b(digest_size=binary.KEY_SIZE)
+    filenames = natsorted(glob(path), alg=ns.IGNORECASE) if '*' in path else [path]
+    for filename in filenames:
+        with open(filename, 'rb') as file:
+            digest.update('{}\0{}\0'.format(basename(filename), os.fstat(file.fileno()).st_size).encode())
+            for block in iter(lambda: file.read(2 ** 20), b''):
+                digest.update(block)
+    return digest.digest()
+
+
+def iter_rows(path, sheet_name, ignore_empty_final_rows=True):
+    """ Iterate over the rows of a worksheet of an Excel (.xlsx) file or a comma separated (.csv) or tab separated (.tsv)
+    file, one at a time, without reading the entire file into memory
+
+    Args:
+        path (:obj:`str`): path to file(s)
+        sheet_name (:obj:`str`): sheet name; for comma separated (.csv) or tab separated (.tsv) files, the value of the
+            glob pattern '*' in :obj:`path` (or '' if :obj:`path` has no glob pattern)
+        ignore_empty_final_rows (:obj:`bool`, optional): if :obj:`True`, ignore empty final rows
+
+    Returns:
+        :obj:`types.GeneratorType` of :obj:`Row`: rows of the worksheet
+    """
+    # check extensions are valid
+    _, ext = splitext(path)
+    reader_cls = get_reader(ext)
+    if issubclass(reader_cls, ExcelReader):
+        reader = reader_cls(path, read_only=True)
+    else:
+        reader = reader_cls(path)
+
+    with reader:
+        for row in reader.iter_rows(sheet_name, ignore_empty_final_rows=ignore_empty_final_rows):
+            yield row
+
+
+def convert(source, destination, worksheet_order=None, style=None, ignore_extra_sheets=True,
+            max_workers=None, executor=None):
     """ Convert among Excel (.xlsx), comma separated (.csv), and tab separated formats (.tsv)
 
+    The worksheets are converted one at a time, so that only one worksheet is held in memory at a time. Worksheets
+    are read from Excel files with read-only readers. Worksheets can optionally be converted concurrently to comma
+    separated (.csv) or tab separated (.tsv) files.
+
     Args:
         source (:obj:`str`): path to source file
         destination (:obj:`str`): path to save converted file
         worksheet_order (:obj:`list` of :obj:`str`): worksheet order
         style (:obj:`WorkbookStyle`, optional): workbook style for Excel
         ignore_extra_sheets (:obj:`bool`, optional): true/false should extra sheets in worksheet_order be ignored or should an error be thrown
+        max_workers (:obj:`int`, optional): if greater than 1 and the destination is a collection of comma separated
+            (.csv) or tab separated (.tsv) files, convert worksheets concurrently with a pool of up to this many
+            processes
+        executor (:obj:`concurrent.futures.Executor`, optional): pool of workers to convert worksheets to comma
+            separated (.csv) or tab separated (.tsv) files concurrently; takes precedence over :obj:`max_workers`
 
     Raises:
         :obj:`ValueError`: if file extensions are not supported or file names are equal
@@ -1032,21 +2344,76 @@ def convert(source, destination, worksheet_order=None, style=None, ignore_extra_
                 copyfile(filename, destination.replace('*', sheet_name))
         return
 
-    # read, convert, and write
-    workbook = read(source)
+    # read, convert, and write the worksheets one at a time
+    reader_cls = get_reader(ext_src)
+    if issubclass(reader_cls, ExcelReader):
+        reader = reader_cls(source, read_only=True)
+    else:
+        reader = reader_cls(source)
+    writer = get_writer(ext_dst)(destination)
+    style = style or WorkbookStyle()
+
+    with reader:
+        sheet_names = reader.get_sheet_names()
+
+        worksheet_order = worksheet_order or []
+        if not ignore_extra_sheets:
+            difference = set(worksheet_order) - set(sheet_names)
+            if difference:
+                raise ValueError("source '{}' missing worksheets: '{}'".format(source, difference))
+
+        ordered_sheet_names = []
+        for sheet_name in chain(worksheet_order, sheet_names):
+            if sheet_name in sheet_names and sheet_name not in ordered_sheet_names:
+                ordered_sheet_names.append(sheet_name)
 
-    ordered_workbook = Workbook()
-    worksheet_order = worksheet_order or []
-    if not ignore_extra_sheets:
-        difference = set(worksheet_order) - set(workbook.keys())
-        if difference:
-            raise ValueError("source '{}' missing worksheets: '{}'".format(source, difference))
+        if isinstance(writer, SeparatedValuesWriter):
+            if len(ordered_sheet_names) > 1 and basename(destination).count('*') == 0:
+                raise ValueError("path '{}' must have a glob pattern '*' in its base name".format(destination))
 
-    for worksheet in chain(worksheet_order, workbook.keys()):
-        if worksheet in workbook:
-            ordered_workbook[worksheet] = workbook[worksheet]
+            if len(ordered_sheet_names) > 1 and executor is not None:
+                _convert_worksheets_concurrently(reader, writer, ordered_sheet_names, style, executor)
+                return
+            if len(ordered_sheet_names) > 1 and max_workers is not None and max_workers > 1:
+                with ProcessPoolExecutor(max_workers=min(max_workers, len(ordered_sheet_names))) as executor:
+                    _convert_worksheets_concurrently(reader, writer, ordered_sheet_names, style, executor)
+                return
 
-    write(destination, ordered_workbook, style=style)
+        writer.initialize_workbook()
+        for sheet_name in ordered_sheet_names:
+            writer.write_worksheet(sheet_name, reader.read_worksheet(sheet_name), style=style.get(sheet_name, None))
+        writer.finalize_workbook()
+
+
+def _convert_worksheets_concurrently(reader, writer, sheet_names, style, executor):
+    """ Convert worksheets concurrently with a pool of workers
+
+    Args:
+        reader (:obj:`Reader`): reader
+        writer (:obj:`Writer`): writer of a format whose worksheets are written to separate files
+        sheet_names (:obj:`list` of :obj:`str`): names of the worksheets to convert
+        style (:obj:`WorkbookStyle`): workbook style
+        executor (:obj:`concurrent.futures.Executor`): pool of workers
+    """
+    writer.initialize_workbook()
+    futures = [executor.submit(_convert_worksheet, copy.copy(reader), writer, sheet_name, style.get(sheet_name, None))
+               for sheet_name in sheet_names]
+    for future in futures:
+        future.result()
+    writer.finalize_workbook()
+
+
+def _convert_worksheet(reader, writer, sheet_name, style):
+    """ Convert a worksheet with a copy of a reader in a worker of a pool
+
+    Args:
+        reader (:obj:`Reader`): copy of a reader
+        writer (:obj:`Writer`): writer of a format whose worksheets are written to separate files
+        sheet_name (:obj:`str`): sheet name
+        style (:obj:`WorksheetStyle`): worksheet style
+    """
+    with reader:
+        writer.write_worksheet(sheet_name, reader.read_worksheet(sheet_name), style=style)
 
 
 class WorkbookStyle(dict):
@@ -1162,6 +2529,113 @@ class Hyperlink(object):
         self.tip = tip
 
 
+class MergeRanges(object):
+    """ Index of the merged ranges of a worksheet
+
+    The ranges are sorted by their first rows so that the ranges which span each row can be determined
+    incrementally as the rows of a worksheet are read or written in order (see :obj:`iter_row_ranges`).
+
+    Attributes:
+        ranges (:obj:`list` of :obj:`tuple` of :obj:`int`): first row, first column, last row, and last column
+            (0-based) of each range
+    """
+
+    def __init__(self, ranges=()):
+        """
+        Args:
+            ranges (:obj:`iterable` of :obj:`tuple` of :obj:`int`, optional): first row, first column, last row, and
+                last column (0-based) of each range
+        """
+        self.ranges = [tuple(merge_range) for merge_range in ranges]
+
+    def __len__(self):
+        """ Get the number of ranges
+
+        Returns:
+            :obj:`int`: number of ranges
+        """
+        return len(self.ranges)
+
+    def iter_row_ranges(self):
+        """ Iterate over the ranges which span each row, starting with the first row
+
+        Each list of ranges is ordered by the first rows of the ranges, and then by the order of the ranges.
+        The generator is infinite; it should be advanced once per row.
+
+        Returns:
+            :obj:`types.GeneratorType` of :obj:`list` of :obj:`tuple`: ranges which span each row
+        """
+        starts = sorted(self.ranges, key=lambda merge_range: merge_range[0])
+        i_next = 0
+        active = []
+        i_row = 0
+        while True:
+            if active:
+                active = [merge_range for merge_range in active if merge_range[2] >= i_row]
+            while i_next < len(starts) and starts[i_next][0] <= i_row:
+                if starts[i_next][2] >= i_row:
+                    active.append(starts[i_next])
+                i_next += 1
+            yield active
+            i_row += 1
+
+    def validate(self, sheet_name):
+        """ Check that the ranges don't overlap, with O(n log n) comparisons
+
+        The ranges are swept in order of their first rows. The ranges which span the current row must have disjoint
+        columns; their columns are kept sorted so that each new range only needs to be compared with its neighbors.
+
+        Args:
+            sheet_name (:obj:`str`): sheet name
+
+        Raises:
+            :obj:`ValueError`: if a range is empty or two ranges overlap
+        """
+        for merge_range in self.ranges:
+            row_start, col_start, row_end, col_end = merge_range
+            if row_start > row_end or col_start > col_end:
+                raise ValueError('Merge range {} of worksheet "{}" is empty'.format(
+                    self.format_range(merge_range), sheet_name))
+
+        active_col_starts = []
+        active_ranges = []
+        ends = []
+        for merge_range in sorted(self.ranges):
+            row_start, col_start, row_end, col_end = merge_range
+
+            # remove the ranges which end before this range
+            while ends and ends[0][0] < row_start:
+                _, other_range = heapq.heappop(ends)
+                i_other = bisect.bisect_left(active_col_starts, other_range[1])
+                del active_col_starts[i_other]
+                del active_ranges[i_other]
+
+            # the active ranges span the first row of this range; check that their columns are disjoint from those
+            # of this range
+            i_range = bisect.bisect_right(active_col_starts, col_end)
+            if i_range > 0 and active_ranges[i_range - 1][3] >= col_start:
+                raise ValueError('Merge ranges {} and {} of worksheet "{}" overlap'.format(
+                    self.format_range(active_ranges[i_range - 1]), self.format_range(merge_range), sheet_name))
+
+            active_col_starts.insert(i_range, col_start)
+            active_ranges.insert(i_range, merge_range)
+            heapq.heappush(ends, (row_end, merge_range))
+
+    @staticmethod
+    def format_range(merge_range):
+        """ Format a range in A1 notation
+
+        Args:
+            merge_range (:obj:`tuple` of :obj:`int`): first row, first column, last row, and last column (0-based)
+
+        Returns:
+            :obj:`str`: range in A1 notation (e.g., 'A1:B2')
+        """
+        row_start, col_start, row_end, col_end = merge_range
+        return '{}{}:{}{}'.format(get_column_letter(col_start + 1), row_start + 1,
+                                  get_column_letter(col_end + 1), row_end + 1)
+
+
 class WorkbookValidation(dict):
     """ Workbook validation: dictionary of worksheet validations """
     pass
@@ -1201,15 +2675,43 @@ class WorksheetValidation(object):
             last_col (:obj:`int`): last column
             include_help_comments (:obj:`bool`, optional): if :obj:`True`, include help comments
         """
+        self.apply_help_comments(ws, first_row, first_col, include_help_comments=include_help_comments)
+        self.apply_validations(ws, first_row, first_col, last_row, last_col)
+
+    def apply_help_comments(self, ws, first_row, first_col, include_help_comments=False):
+        """ Apply help comments to the headings of the fields
+
+        Args:
+            ws (:obj:`xlsxwriter.Worksheet`): worksheet
+            first_row (:obj:`int`): first row
+            first_col (:obj:`int`): first column
+            include_help_comments (:obj:`bool`, optional): if :obj:`True`, include help comments
+        """
+        if not include_help_comments:
+            return
+
+        for i_field, field in enumerate(self.fields):
+            if field:
+                if self.orientation == WorksheetValidationOrientation.row:
+                    field.apply_help_comment(ws, first_row - 1, i_field)
+                else:
+                    field.apply_help_comment(ws, i_field, first_col - 1)
+
+    def apply_validations(self, ws, first_row, first_col, last_row, last_col):
+        """ Apply the validations of the fields
+
+        Args:
+            ws (:obj:`xlsxwriter.Worksheet`): worksheet
+            first_row (:obj:`int`): first row
+            first_col (:obj:`int`): first column
+            last_row (:obj:`int`): last row
+            last_col (:obj:`int`): last column
+        """
         for i_field, field in enumerate(self.fields):
             if field:
                 if self.orientation == WorksheetValidationOrientation.row:
-                    if include_help_comments:
-                        field.apply_help_comment(ws, first_row - 1, i_field)
                     field.apply_validation(ws, first_row, i_field, last_row, i_field)
                 else:
-                    if include_help_comments:
-                        field.apply_help_comment(ws, i_field, first_col - 1)
                     field.apply_validation(ws, i_field, first_col, i_field, last_col)
 
 